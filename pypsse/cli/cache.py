@@ -0,0 +1,34 @@
+"""
+CLI to manage the contingency result cache
+"""
+
+from pathlib import Path
+
+import click
+
+from pypsse.result_cache import ResultCache
+
+
+@click.group()
+def cache():
+    """Contingency result cache utilities."""
+
+
+@click.argument(
+    "cache-path",
+)
+@click.option(
+    "-c",
+    "--case",
+    required=False,
+    default=None,
+    help="only invalidate results of this case (SAV or RAW file)",
+)
+@cache.command()
+def invalidate(cache_path, case):
+    """Removes cached contingency results."""
+    assert Path(cache_path).exists(), f"Result cache {cache_path} does not exist"
+    result_cache = ResultCache(cache_path)
+    removed = result_cache.invalidate(case)
+    result_cache.close()
+    click.echo(f"{removed} cached results removed")
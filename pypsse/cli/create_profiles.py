@@ -18,6 +18,7 @@ from pypsse.profile_manager.common import (
     DEFAULT_START_TIME,
     PROFILE_VALIDATION,
 )
+from pypsse.profile_manager.ingestion import ProfileIngestor, get_profile_files
 from pypsse.profile_manager.profile_store import ProfileManager
 from pypsse.models import SimulationSettings
 
@@ -79,9 +80,27 @@ from pypsse.models import SimulationSettings
     show_default=True,
     help="Profile time resolution in seconds",
 )
+@click.option(
+    "-w",
+    "--workers",
+    required=False,
+    default=1,
+    show_default=True,
+    type=int,
+    help="""Number of worker processes used to parse profiles in a folder (-p).
+    Values larger than 1 enable parallel, resumable ingestion""",
+)
 @click.command()
 def create_profiles(
-    project_path, csv_file_path, profile_folder, profile_name, profile_type, start_time, profile_res, profile_info
+    project_path,
+    csv_file_path,
+    profile_folder,
+    profile_name,
+    profile_type,
+    start_time,
+    profile_res,
+    profile_info,
+    workers,
 ):
     """Creates profiles for PyPSSE project."""
     settings_file = os.path.join(project_path, SIMULATION_SETTINGS_FILENAME)
@@ -100,6 +119,16 @@ def create_profiles(
                 info=profile_info,
             )
             logger.info(f"Profile '{profile_name}' added to group '{profile_type}'")
+        elif os.path.exists(profile_folder) and workers > 1:
+            settings = toml.load(settings_file)
+            settings = SimulationSettings.model_validate(settings)
+            a = ProfileManager(None, settings)
+            ProfileIngestor(a, workers).ingest(
+                get_profile_files(profile_folder),
+                start_time=dt.datetime.strptime(start_time, "%Y-%m-%d %H:%M:%S.%f"),
+                resolution_sec=profile_res,
+                info=profile_info,
+            )
         elif os.path.exists(profile_folder):
             settings = toml.load(settings_file)
             settings = SimulationSettings.model_validate(settings)
@@ -9,7 +9,9 @@ import click
 import toml
 
 from pypsse.models import SimulationSettings
-from pypsse.common import SIMULATION_SETTINGS_FILENAME
+from pypsse.common import DEFAULT_PROFILE_STORE_FILENAME, PROFILES_FOLDER, SIMULATION_SETTINGS_FILENAME
+from pypsse.enumerations import ProfileCompressors
+from pypsse.profile_manager.compaction import compact_profile_store
 from pypsse.profile_manager_interface import ProfileManagerInterface
 
 @click.argument(
@@ -23,8 +25,16 @@ from pypsse.profile_manager_interface import ProfileManagerInterface
     show_default=True,
     help="scenario toml file to run (over rides default)",
 )
+@click.option(
+    "-f",
+    "--export-format",
+    type=click.Choice(["csv", "parquet"]),
+    default="csv",
+    show_default=True,
+    help="export file format",
+)
 @click.command()
-def get_profiles(project_path, simulations_file=None):
+def get_profiles(project_path, simulations_file=None, export_format="csv"):
     """Runs a valid PyPSSE simulation."""
     file_path = Path(project_path) / simulations_file
     msg = "Simulation file not found. Use -s to choose a valid settings file"
@@ -40,5 +50,51 @@ def get_profiles(project_path, simulations_file=None):
         logger.add(log_path)
     
     profile_interface = ProfileManagerInterface.from_setting_files(file_path)
-    profile_interface.get_profiles()
-    
+    profile_interface.get_profiles(export_format)
+
+
+@click.group()
+def profiles():
+    """Profile store utilities."""
+
+
+@click.argument(
+    "project-path",
+)
+@click.option(
+    "-d",
+    "--dtype",
+    type=click.Choice(["float32", "float64"]),
+    default="float64",
+    show_default=True,
+    help="data type of the compacted profiles",
+)
+@click.option(
+    "-r",
+    "--chunk-rows",
+    type=int,
+    default=3600,
+    show_default=True,
+    help="number of time steps per chunk",
+)
+@click.option(
+    "-c",
+    "--compressor",
+    type=click.Choice([c.value for c in ProfileCompressors]),
+    default=ProfileCompressors.AUTO.value,
+    show_default=True,
+    help="compressor, lz4 and blosc require hdf5plugin (falls back to gzip)",
+)
+@click.option(
+    "-o",
+    "--output",
+    required=False,
+    default=None,
+    help="path to the compacted store (the project store is replaced if not passed)",
+)
+@profiles.command()
+def compact(project_path, dtype, chunk_rows, compressor, output):
+    """Rewrites the profile store of a project with homogeneous 2-D float datasets."""
+    store_file = Path(project_path) / PROFILES_FOLDER / DEFAULT_PROFILE_STORE_FILENAME
+    assert store_file.exists(), f"Profile store {store_file} does not exist"
+    compact_profile_store(store_file, output, dtype=dtype, chunk_rows=chunk_rows, compressor=compressor)
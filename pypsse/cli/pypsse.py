@@ -3,11 +3,12 @@
 import click
 from loguru import logger
 
+from pypsse.cli.cache import cache
 from pypsse.cli.create_profiles import create_profiles
 from pypsse.cli.create_project import create_project
 from pypsse.cli.explore import explore
 from pypsse.cli.run import run
-from pypsse.cli.profiles import get_profiles
+from pypsse.cli.profiles import get_profiles, profiles
 
 server_dependencies_installed = True
 
@@ -30,5 +31,7 @@ cli.add_command(run)
 cli.add_command(create_profiles)
 cli.add_command(explore)
 cli.add_command(get_profiles)
+cli.add_command(profiles)
+cli.add_command(cache)
 if server_dependencies_installed:
     cli.add_command(serve)
@@ -1,12 +1,15 @@
 "This module manages contingency modeling in PyPSSE"
 
 
+import heapq
+import itertools
 from abc import ABCMeta
 from typing import List, Union
 
 from loguru import logger
 
 # from pyPSSE import
+from pypsse.enumerations import ContingencyEvents
 from pypsse.models import (
     BusFault,
     Contingencies,
@@ -46,14 +49,19 @@ class BaseFault:
         self.psse = psse
         self.enabled = False
         self.tripped = False
+        self.fault_settings = {}
 
-    def update(self, t: float):
+    def update(self, t: float) -> bool:
         """updates a fault event
 
         Args:
             t (float): simuation time in seconds
+
+        Returns:
+            bool: true if the fault was applied, cleared or tripped during this update
         """
         self.t = t
+        changed = False
         if hasattr(self.settings, "duration"):
             if (
                 self.settings.time + self.settings.duration
@@ -63,12 +71,14 @@ class BaseFault:
             ):
                 self.enabled = True
                 self.enable_fault()
+                changed = True
             if (
                 t >= self.settings.time + self.settings.duration
                 and self.enabled
             ):
                 self.enabled = False
                 self.disable_fault()
+                changed = True
         elif (
             not hasattr(self.settings, "duration")
             and t >= self.settings.time
@@ -76,6 +86,48 @@ class BaseFault:
         ):
             self.enable_fault()
             self.tripped = True
+            changed = True
+        return changed
+
+    def get_events(self) -> list:
+        """returns the scheduled events of the contingency
+
+        Returns:
+            list: list of (time, event type) tuples
+        """
+        if hasattr(self.settings, "duration"):
+            return [
+                (self.settings.time, ContingencyEvents.ENABLE),
+                (self.settings.time + self.settings.duration, ContingencyEvents.DISABLE),
+            ]
+        return [(self.settings.time, ContingencyEvents.TRIP)]
+
+    def apply_event(self, event: ContingencyEvents, t: float) -> bool:
+        """applies a scheduled event, equivalent to 'update' at the event time
+
+        Args:
+            event (ContingencyEvents): event type
+            t (float): simuation time in seconds
+
+        Returns:
+            bool: true if the fault was applied, cleared or tripped
+        """
+        self.t = t
+        if event == ContingencyEvents.ENABLE:
+            if not self.enabled and t < self.settings.time + self.settings.duration:
+                self.enabled = True
+                self.enable_fault()
+                return True
+        elif event == ContingencyEvents.DISABLE:
+            if self.enabled:
+                self.enabled = False
+                self.disable_fault()
+                return True
+        elif not self.tripped:
+            self.enable_fault()
+            self.tripped = True
+            return True
+        return False
 
     def enable_fault(self):
         """enables a fault event"""
@@ -121,7 +173,6 @@ class BaseFault:
 class BusFaultObject(BaseFault):
     "Class defination for a bus fault"
     fault_method = "dist_bus_fault"
-    fault_settings = {}
 
     def __init__(self, psse: object, settings: BusFault, contingency_type: str):
         """bus fault object
@@ -142,7 +193,6 @@ class BusFaultObject(BaseFault):
 class LineFaultObject(BaseFault):
     "Class defination for a line fault"
     fault_method = "dist_branch_fault"
-    fault_settings = {}
 
     def __init__(
         self, psse: object, settings: LineFault, contingency_type: str
@@ -167,7 +217,6 @@ class LineFaultObject(BaseFault):
 class LineTripObject(BaseFault):
     "Class defination for a line trip"
     fault_method = "dist_branch_trip"
-    fault_settings = {}
 
     def __init__(self, psse: object, settings: LineTrip, contingency_type: str):
         """line trip model
@@ -186,7 +235,6 @@ class LineTripObject(BaseFault):
 class BusTripObject(BaseFault):
     "Class defination for a bus trip"
     fault_method = "dist_bus_trip"
-    fault_settings = {}
 
     def __init__(self, psse: object, settings: BusTrip, contingency_type: str):
         """Bus trip contingency
@@ -204,7 +252,6 @@ class BusTripObject(BaseFault):
 class MachineTripObject(BaseFault):
     "Class defination for a machine fault"
     fault_method = "dist_machine_trip"
-    fault_settings = {}
 
     def __init__(
         self, psse: object, settings: MachineTrip, contingency_type: str
@@ -272,3 +319,52 @@ def build_contingencies(
     else:
         logger.debug("No contingencies to build")
     return system_contingencies
+
+
+class ContingencyScheduler:
+    """Time sorted queue of contingency events.
+
+    Enable, disable and trip events of all contingencies are kept in a heap, so each update only pops the events
+    that are due, instead of polling every contingency. Events due at the same time are applied in the order the
+    contingencies were added.
+    """
+
+    def __init__(self, contingencies_: list = None):
+        """creates the scheduler
+
+        Args:
+            contingencies_ (list, optional): contingency objects. Defaults to None.
+        """
+        self.events = []
+        self.counter = itertools.count()
+        if contingencies_:
+            self.add(contingencies_)
+
+    def add(self, contingencies_: list):
+        """schedules the events of contingency objects
+
+        Args:
+            contingencies_ (list): contingency objects
+        """
+        for contingency in contingencies_:
+            order = next(self.counter)
+            for time, event in contingency.get_events():
+                heapq.heappush(self.events, (time, order, event.value, contingency))
+
+    def update(self, t: float) -> bool:
+        """applies all events due at or before the simulation time
+
+        Args:
+            t (float): simuation time in seconds
+
+        Returns:
+            bool: true if any fault was applied, cleared or tripped
+        """
+        changed = False
+        while self.events and self.events[0][0] <= t:
+            _, _, event, contingency = heapq.heappop(self.events)
+            changed |= contingency.apply_event(ContingencyEvents(event), t)
+        return changed
+
+    def __len__(self) -> int:
+        return len(self.events)
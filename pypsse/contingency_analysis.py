@@ -0,0 +1,315 @@
+"Parallel steady state contingency screening"
+
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.util import Finalize
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from pypsse.dc_screening import DCNetwork, screen_contingencies
+from pypsse.models import (
+    BusFault,
+    BusTrip,
+    Contingencies,
+    ContingencyAnalysisSettings,
+    LineFault,
+    LineTrip,
+    MachineTrip,
+)
+from pypsse.modes.snapshots import BASE_SNAPSHOT, SnapshotManager
+from pypsse.result_cache import ResultCache, get_result_key, hash_files
+
+N_BUS = 200000
+EXPORT_VARIABLES = ["psse_version", "voltage_min", "voltage_max", "loading_limit", "monitored_buses"]
+
+_worker = None
+
+
+class ContingencyWorker:
+    """Holds one loaded case and screens contingencies against it.
+
+    The case is loaded and solved once and the solved base case is captured as a snapshot. Each contingency is
+    applied as a steady state outage, the power flow is solved and the results are read. The working case is then
+    reset from the snapshot, so adjustments made by the solution (taps, switched shunts, var limits) never carry
+    over to the next contingency and results do not depend on the order or the worker a case runs on.
+
+    Faults without a trip (BusFault / LineFault with 'bus_trip' false) have no post contingency steady state and
+    are skipped. Faults with a trip are screened as the corresponding bus or branch outage.
+    """
+
+    def __init__(self, psse: object, base_case: Path, settings: ContingencyAnalysisSettings):
+        """loads and solves the base case
+
+        Args:
+            psse (object): psspy module (or a stand-in with the same API)
+            base_case (Path): path to a SAV or RAW case
+            settings (ContingencyAnalysisSettings): screening settings
+
+        Raises:
+            Exception: raised if the case can not be loaded
+        """
+        self.psse = psse
+        self.settings = settings
+        base_case = Path(base_case)
+        if base_case.suffix.lower() == ".raw":
+            ierr = self.psse.read(0, str(base_case))
+        else:
+            ierr = self.psse.case(str(base_case))
+        if ierr:
+            msg = f"Unable to load case {base_case}. Error code - {ierr}"
+            raise Exception(msg)
+
+        self.psse.fnsl()
+        self.snapshots = SnapshotManager(self.psse, max_snapshots=1, directory=settings.snapshot_directory)
+        self.snapshots.capture(BASE_SNAPSHOT)
+        self.buses = np.array(self.psse.abusint(-1, 2, "NUMBER")[1][0], dtype=int)
+        self.monitored = np.isin(self.buses, settings.monitored_buses)
+        logger.debug(f"Contingency worker {os.getpid()} loaded {base_case}")
+
+    def close(self):
+        """removes the base case snapshot"""
+        self.snapshots.close()
+
+    def get_network(self) -> DCNetwork:
+        """returns the DC network of the solved base case"""
+        return DCNetwork.from_psse(self.psse)
+
+    def get_actions(self, contingency: object) -> list:
+        """returns the outage actions of a contingency
+
+        Args:
+            contingency (object): contingency model
+
+        Returns:
+            list: list of (function, kwargs) tuples, empty if the contingency has no steady state outage
+        """
+        if isinstance(contingency, BusTrip) or (isinstance(contingency, BusFault) and contingency.bus_trip):
+            return [("dscn", {"ibus": contingency.bus_id})]
+        if isinstance(contingency, LineTrip) or (isinstance(contingency, LineFault) and contingency.bus_trip):
+            ibus, jbus = contingency.bus_ids[:2]
+            ckt = str(contingency.bus_ids[2]) if len(contingency.bus_ids) > 2 else "1"  # noqa: PLR2004
+            return [("branch_chng_3", {"ibus": ibus, "jbus": jbus, "ckt": ckt, "intgar1": 0})]
+        if isinstance(contingency, MachineTrip):
+            return [("machine_chng_3", {"ibus": contingency.bus_id, "id": contingency.machine_id, "intgar1": 0})]
+        return []
+
+    def run(self, index: int, contingencies_: Contingencies) -> dict:
+        """screens one contingency case
+
+        Args:
+            index (int): contingency case index
+            contingencies_ (Contingencies): outages applied together (e.g. an N-2 case)
+
+        Returns:
+            dict: result row
+        """
+        row = {"index": index, "elements": ";".join(describe(c) for c in contingencies_.contingencies)}
+        actions = [a for c in contingencies_.contingencies for a in self.get_actions(c)]
+        if not actions:
+            return {**row, "applied": False, "converged": None, "error": "no steady state outage"}
+
+        try:
+            for func, kwargs in actions:
+                ierr = getattr(self.psse, func)(**kwargs)
+                if ierr:
+                    msg = f"{func} failed with error code {ierr}"
+                    raise Exception(msg)
+            self.psse.fnsl()
+            row.update(self.get_results())
+            row["applied"] = True
+            row["error"] = ""
+        except Exception as e:
+            row.update({"applied": False, "converged": None, "error": str(e)})
+        finally:
+            self.snapshots.restore(BASE_SNAPSHOT)
+        return row
+
+    def get_results(self) -> dict:
+        """returns convergence, violations and monitored bus voltages for the current solution"""
+        converged = self.psse.solved() == 0
+        vm = np.abs(np.array(self.psse.abuscplx(-1, 2, "VOLTAGE")[1][0], dtype=complex))
+        in_service = vm > 0
+        low = in_service & (vm < self.settings.voltage_min)
+        high = vm > self.settings.voltage_max
+        loading = np.array(self.psse.abrnreal(-1, 1, 3, 4, 1, "PCTRATE")[1][0], dtype=float)
+        overloaded = loading > self.settings.loading_limit
+
+        results = {
+            "converged": converged,
+            "voltage_violations": int(low.sum() + high.sum()),
+            "thermal_violations": int(overloaded.sum()),
+            "min_voltage": float(vm[in_service].min()) if in_service.any() else np.nan,
+            "max_voltage": float(vm.max()) if len(vm) else np.nan,
+            "max_loading": float(loading.max()) if len(loading) else np.nan,
+            "violating_buses": " ".join(str(b) for b in self.buses[low | high]),
+        }
+        for bus, v in zip(self.buses[self.monitored].tolist(), vm[self.monitored].tolist()):
+            results[f"V_{bus}"] = v
+        return results
+
+
+def describe(contingency: object) -> str:
+    """returns a short description of a contingency model"""
+    element = getattr(contingency, "bus_ids", None) or getattr(contingency, "bus_id", None)
+    if isinstance(contingency, MachineTrip):
+        element = f"{contingency.bus_id}.{contingency.machine_id}"
+    return f"{contingency.__class__.__name__}({element})"
+
+
+def import_psse(settings: ContingencyAnalysisSettings) -> object:
+    """imports and initializes psspy (or the configured stand-in module)"""
+    if settings.psse_version:
+        __import__(settings.psse_version.value, fromlist=[""])
+    psse = importlib.import_module(settings.psse_module)
+    ierr = psse.psseinit(N_BUS)
+    assert ierr == 0, f"Error code: {ierr}"
+    return psse
+
+
+def init_worker(base_case: Path, settings: ContingencyAnalysisSettings):
+    """process pool initializer, loads the case once per worker process"""
+    global _worker  # noqa: PLW0603
+    _worker = ContingencyWorker(import_psse(settings), base_case, settings)
+    # pool workers exit without running atexit handlers, multiprocessing finalizers are run
+    Finalize(_worker, _worker.close, exitpriority=10)
+
+
+def run_contingency(index: int, contingencies_: Contingencies) -> dict:
+    """screens a contingency case on the worker of the current process"""
+    return _worker.run(index, contingencies_)
+
+
+def get_network() -> DCNetwork:
+    """returns the DC network of the base case loaded by the worker of the current process"""
+    return _worker.get_network()
+
+
+class ContingencyAnalysis:
+    """Screens a list of contingency cases against a base case on a pool of worker processes.
+
+    Each worker process initializes psspy and loads the base case once. Results are aggregated into a single
+    table with one row per contingency case.
+
+    If 'screening_threshold' is set, branch outages are first screened with DC sensitivity factors and only cases
+    with an estimated post contingency loading above the threshold (and cases that can not be screened) are
+    simulated. The screening estimates are added to the result table for all cases.
+
+    If 'cache_path' is set, result rows are stored in a persistent result cache. Cases with a cached result for
+    the same case, dyr and settings files, contingency definition and export variables are not simulated again.
+    """
+
+    def __init__(self, base_case: Path, settings: ContingencyAnalysisSettings = None):
+        """creates the contingency analysis
+
+        Args:
+            base_case (Path): path to a SAV or RAW case
+            settings (ContingencyAnalysisSettings, optional): screening settings. Defaults to None.
+        """
+        self.base_case = Path(base_case)
+        self.settings = settings if settings is not None else ContingencyAnalysisSettings()
+
+    def run(self, contingencies_: List[Contingencies]) -> pd.DataFrame:
+        """screens all contingency cases
+
+        Args:
+            contingencies_ (List[Contingencies]): contingency cases, the outages of each case are applied together
+
+        Returns:
+            pd.DataFrame: result table indexed by contingency case
+        """
+        cases = list(enumerate(contingencies_))
+        cache = None
+        keys, cached = [], {}
+        if self.settings.cache_path:
+            cache = ResultCache(self.settings.cache_path, self.settings.cache_max_size_mb)
+            keys, cached = self.read_cache(cache, contingencies_)
+        screen = self.settings.screening_threshold is not None
+        screening = None
+        rows = []
+        pending = [(i, case) for i, case in cases if i not in cached]
+        logger.info(f"Screening {len(pending)} contingencies on {self.settings.workers} workers")
+        if pending or screen:
+            if self.settings.workers == 1:
+                worker = ContingencyWorker(import_psse(self.settings), self.base_case, self.settings)
+                try:
+                    if screen:
+                        screening, cases = self.screen(worker.get_network(), contingencies_)
+                        pending = [(i, case) for i, case in cases if i not in cached]
+                    rows = [worker.run(i, case) for i, case in pending]
+                finally:
+                    worker.close()
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=self.settings.workers,
+                    initializer=init_worker,
+                    initargs=(self.base_case, self.settings),
+                ) as executor:
+                    if screen:
+                        screening, cases = self.screen(executor.submit(get_network).result(), contingencies_)
+                        pending = [(i, case) for i, case in cases if i not in cached]
+                    chunksize = max(1, len(pending) // (4 * self.settings.workers))
+                    rows = list(executor.map(run_contingency, *zip(*pending), chunksize=chunksize)) if pending else []
+
+        if cache is not None:
+            cache.put_many(self.base_case, {keys[row["index"]]: row for row in rows})
+            cache.close()
+            rows += [cached[i] for i, _ in cases if i in cached]
+
+        results = pd.DataFrame(rows)
+        if not results.empty:
+            results = results.set_index("index").sort_index()
+            failed = int((results["converged"] == False).sum())  # noqa: E712
+            logger.info(f"Contingency screening complete, {failed} cases did not converge")
+        if screening is not None:
+            results = screening.join(results.drop(columns="elements", errors="ignore")).sort_index()
+            results.index.name = "index"
+        return results
+
+    def get_fingerprint(self) -> str:
+        """returns the content hash of the case, dyr and settings files"""
+        return hash_files([self.base_case, self.settings.dyr_file, self.settings.settings_file])
+
+    def get_export_variables(self) -> dict:
+        """returns the settings that define the result of a contingency case"""
+        return self.settings.model_dump(mode="json", include=set(EXPORT_VARIABLES))
+
+    def read_cache(self, cache: ResultCache, contingencies_: List[Contingencies]) -> (list, dict):
+        """looks up cached results of all contingency cases
+
+        Args:
+            cache (ResultCache): result cache
+            contingencies_ (List[Contingencies]): contingency cases
+
+        Returns:
+            list: cache key of each contingency case
+            dict: mapping of contingency case indices to cached result rows
+        """
+        fingerprint = self.get_fingerprint()
+        export_variables = self.get_export_variables()
+        keys = [get_result_key(fingerprint, case, export_variables) for case in contingencies_]
+        found = cache.get_many(keys)
+        cached = {i: {**found[key], "index": i} for i, key in enumerate(keys) if key in found}
+        logger.info(f"{len(cached)} of {len(keys)} contingency results found in the cache")
+        return keys, cached
+
+    def screen(self, network: DCNetwork, contingencies_: List[Contingencies]) -> (pd.DataFrame, list):
+        """screens branch outages with DC sensitivity factors
+
+        Args:
+            network (DCNetwork): DC network of the solved base case
+            contingencies_ (List[Contingencies]): contingency cases
+
+        Returns:
+            pd.DataFrame: screening table indexed by contingency case
+            list: (index, contingency case) tuples selected for simulation
+        """
+        screening = screen_contingencies(network, contingencies_, self.settings.screening_threshold)
+        selected = screening.index[screening["simulate"]]
+        elements = [";".join(describe(c) for c in contingencies_[i].contingencies) for i in screening.index]
+        screening.insert(0, "elements", elements)
+        return screening, [(i, contingencies_[i]) for i in sorted(selected)]
@@ -0,0 +1,88 @@
+import queue
+import threading
+from datetime import datetime
+
+from loguru import logger
+
+from pypsse.data_writers.data_writer import DataWriter
+
+
+class AsyncDataWriter:
+    """Runs a data writer on a background thread so that result serialization overlaps with the solver.
+
+    Results are placed on a bounded queue. 'write' blocks when the queue is full (backpressure). 'close_store'
+    drains the queue before closing the wrapped writer. An exception raised on the worker thread stops the worker
+    and is sticky: every later 'write' and 'close_store' call re-raises it.
+    """
+
+    _stop = object()
+
+    def __init__(self, writer: DataWriter, queue_size: int = 64):
+        """creates the background writer
+
+        Args:
+            writer (DataWriter): data writer used to serialize results
+            queue_size (int, optional): maximum number of queued time steps. Defaults to 64.
+        """
+        self.writer = writer
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.error = None
+        self.closed = False
+        self.thread = threading.Thread(target=self.run, name="pypsse-data-writer", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        """worker loop, writes queued results until the stop marker is received or a write fails"""
+        while True:
+            item = self.queue.get()
+            try:
+                if item is self._stop:
+                    return
+                self.writer.write(*item)
+            except Exception as e:
+                logger.error(f"Background data writer failed: {e!s}")
+                self.error = e
+                return
+            finally:
+                self.queue.task_done()
+
+    def raise_error(self):
+        """re-raises an exception from the worker thread in the calling thread"""
+        if self.error is not None:
+            raise self.error
+
+    def put(self, item):
+        """queues an item, waiting for space unless the worker has failed"""
+        while True:
+            self.raise_error()
+            try:
+                self.queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def write(self, currenttime: datetime, powerflow_output: dict, convergence: bool):
+        """queues results from a single time step
+
+        Args:
+            currenttime (datetime): simulator time step
+            powerflow_output (dict): simulation results
+            convergence (bool): simulation convergence status
+        """
+
+        self.raise_error()
+        snapshot = {k: dict(v) for k, v in powerflow_output.items()}
+        self.put((currenttime, snapshot, convergence))
+
+    def close_store(self):
+        """waits for all queued results to be written and closes the wrapped writer"""
+        if self.closed:
+            self.raise_error()
+            return
+        self.closed = True
+        try:
+            self.put(self._stop)
+        finally:
+            self.thread.join()
+            self.writer.close_store()
+        self.raise_error()
@@ -1,59 +1,146 @@
 # Standard libraries
-# from common import dtype_MAPPING
+import csv
+import gzip
 import os
+import time
 from datetime import datetime
 from pathlib import Path
 
-import numpy as np
-import pandas as pd
+from loguru import logger
+
+from pypsse.models import WriterBufferSettings
 
 
 class CSVWriter:
     """Class that handles writing simulation results to csv
     files.
+
+    One append-only file is created per object type. The header (time stamp, convergence and element labels) is
+    written once, rows are buffered and appended through a persistent file handle in batches. Element labels that
+    appear after the header was written are not written and are reported once per object type.
     """
 
-    def __init__(self, log_dir: Path, column_length: int, filename_prefix:str=""):
+    def __init__(
+        self,
+        log_dir: Path,
+        column_length: int,
+        filename_prefix: str = "",
+        buffer_settings: WriterBufferSettings = None,
+        compress: bool = False,
+    ):
         """Constructor for csv writer
 
         Args:
             log_dir (Path): output path (dirctory)
             column_length (int): number of data columns
+            filename_prefix (str, optional): prefix for the results files. Defaults to "".
+            buffer_settings (WriterBufferSettings, optional): row buffer and flush settings. Defaults to None.
+            compress (bool, optional): gzip the output files. Defaults to False.
         """
-        self.filename_prefix=filename_prefix
+
+        if buffer_settings is None:
+            buffer_settings = WriterBufferSettings()
+
+        self.filename_prefix = filename_prefix
         self.column_length = column_length
         self.log_dir = log_dir
-        self.timestamps = []
-        self.chunkRows = 1
-        self.dfs = {}
-        self.step = 0
-        # Create arrow writer for each object type
+        self.compress = compress
+        self.buffer_rows = buffer_settings.rows
+        self.flush_interval = (
+            buffer_settings.flush_interval.total_seconds() if buffer_settings.flush_interval else None
+        )
+        self.handles = {}
+        self.writers = {}
+        self.columns = {}
+        self.column_sets = {}
+        self.unknown_labels = {}
+        self.rows = {}
+        self.buffered = 0
+        self.last_flush = time.monotonic()
+        self.closed = False
+
+    def open_file(self, obj_type: str, data: dict):
+        """opens the output file for an object type and writes the header
+
+        Args:
+            obj_type (str): result variable name e.g. 'Buses_PU'
+            data (dict): mapping of element labels to values for the first time step
+        """
+
+        fpath = os.path.join(self.log_dir, f"{self.filename_prefix}_{obj_type}.csv")
+        if self.compress:
+            handle = gzip.open(f"{fpath}.gz", "wt", newline="")
+        else:
+            handle = open(fpath, "w", newline="", buffering=1024 * 1024)
+        self.handles[obj_type] = handle
+        self.writers[obj_type] = csv.writer(handle)
+        self.columns[obj_type] = list(data.keys())
+        self.column_sets[obj_type] = set(self.columns[obj_type])
+        self.rows[obj_type] = []
+        self.writers[obj_type].writerow(["timestamp", "convergence", *[str(c) for c in self.columns[obj_type]]])
 
-    def write(self, currenttime: datetime, powerflow_output: dict):
+    def write(self, currenttime: datetime, powerflow_output: dict, convergence: bool = None):
         """Writes the status of assets at a particular timestep to a csv file.
 
         Args:
             currenttime (datetime): simulator time step
             powerflow_output (dict): simulation results
+            convergence (bool, optional): simulation convergence status. Defaults to None.
         """
 
-        # Iterate through each object type
-        self.timestamps.append(currenttime)
-        for obj_type in powerflow_output:
-            data = powerflow_output[obj_type]
-            if obj_type not in self.dfs:
-                self.dfs[obj_type] = [data]
-            else:
-                if self.dfs[obj_type] is None:
-                    self.dfs[obj_type] = [data]
-                else:
-                    self.dfs[obj_type].append(data)
-
-            if self.step % self.chunkRows == self.chunkRows - 1:
-                fpath = os.path.join(self.log_dir, f"{self.filename_prefix}_{obj_type}.csv")
-                self.dfs[obj_type] = pd.DataFrame(self.dfs[obj_type], index=self.timestamps)
-                self.dfs[obj_type].to_csv(fpath, mode="a")
-
-                self.dfs[obj_type] = None
-            self.Timestamp[self.step - 1] = np.string_(str(currenttime))
-        self.step += 1
+        for obj_type, data in powerflow_output.items():
+            if obj_type not in self.handles:
+                self.open_file(obj_type, data)
+            if obj_type not in self.unknown_labels:
+                self.check_labels(obj_type, data)
+            row = [currenttime, convergence]
+            row.extend(data.get(c) for c in self.columns[obj_type])
+            self.rows[obj_type].append(row)
+
+        self.buffered += 1
+        if self.buffered >= self.buffer_rows or (
+            self.flush_interval is not None and time.monotonic() - self.last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def check_labels(self, obj_type: str, data: dict):
+        """warns once per object type about element labels missing from the header
+
+        Args:
+            obj_type (str): result variable name e.g. 'Buses_PU'
+            data (dict): mapping of element labels to values
+        """
+
+        columns = self.column_sets[obj_type]
+        unknown = [label for label in data if label not in columns]
+        if unknown:
+            self.unknown_labels[obj_type] = unknown
+            logger.warning(
+                f"{len(unknown)} element(s) of '{obj_type}' appeared after the csv header was written and are not "
+                f"written: {unknown[:10]}"
+            )
+
+    def flush(self):
+        """appends all buffered rows to the output files"""
+        for obj_type, rows in self.rows.items():
+            if rows:
+                self.writers[obj_type].writerows(rows)
+                self.handles[obj_type].flush()
+                self.rows[obj_type] = []
+        self.buffered = 0
+        self.last_flush = time.monotonic()
+
+    def close_store(self):
+        """writes remaining buffered rows and closes all output files"""
+        if getattr(self, "closed", True):
+            return
+        try:
+            self.flush()
+            for handle in self.handles.values():
+                handle.close()
+        except Exception as e:
+            logger.info(str(e))
+        self.closed = True
+
+    def __del__(self):
+        self.close_store()
@@ -1,6 +1,7 @@
 from pypsse.data_writers.csv import CSVWriter
 from pypsse.data_writers.hdf5 import HDF5Writer
 from pypsse.data_writers.json import JSONWriter
+from pypsse.data_writers.parquet import ParquetWriter
 
 
 class DummyWriter:
@@ -16,17 +17,46 @@ class DataWriter:
     modes = {
         "h5": HDF5Writer,
         "csv": CSVWriter,
+        "csv_stream": CSVWriter,
         "json": JSONWriter,
+        "parquet": ParquetWriter,
         "none": DummyWriter,
     }
 
-    def __init__(self, log_dir, formatnm, column_length, filename_prefix):
+    def __init__(self, log_dir, formatnm, column_length, filename_prefix, export_settings=None, result_types=None):
         "Sets up a data writer as per user input"
-        self.writer = self.modes[formatnm](log_dir, column_length, filename_prefix)
+        self.writer = self.modes[formatnm](
+            log_dir,
+            column_length,
+            filename_prefix,
+            **self.get_writer_options(formatnm, export_settings, result_types),
+        )
+
+    def get_writer_options(self, formatnm, export_settings, result_types=None):
+        "Returns writer specific keyword arguments from the export settings"
+        if export_settings is None:
+            return {}
+        if formatnm == "h5":
+            return {
+                "buffer_settings": export_settings.write_buffer,
+                "layout": export_settings.hdf5_layout,
+                "result_types": result_types,
+            }
+        if formatnm in ["csv", "csv_stream"]:
+            return {"buffer_settings": export_settings.write_buffer, "compress": export_settings.csv_compression}
+        if formatnm == "parquet":
+            return {
+                "buffer_settings": export_settings.write_buffer,
+                "dictionary_encoding": export_settings.parquet_dictionary_encoding,
+                "result_types": result_types,
+            }
+        return {}
 
     def write(self, currenttime, powerflow_output, convergence):
         "Enables incremental write to the data writer object"
         self.writer.write(currenttime, powerflow_output, convergence)
 
     def close_store(self):
-        pass
\ No newline at end of file
+        "Writes buffered data and closes the data writer object"
+        if hasattr(self.writer, "close_store"):
+            self.writer.close_store()
\ No newline at end of file
@@ -1,66 +1,252 @@
 # Standard libraries
 # from common import dtype_MAPPING
 import os
+import time
 from datetime import datetime
 from pathlib import Path
 
 import h5py
 import numpy as np
-import pandas as pd
 from loguru import logger
 
 from pypsse.common import DEFAULT_RESULTS_FILENAME
+from pypsse.enumerations import HDF5Layouts
+from pypsse.models import WriterBufferSettings
+
+RESULT_DTYPES = {
+    "real": np.dtype(np.float64),
+    "int": np.dtype(np.int64),
+    "cplx": np.dtype(np.complex128),
+    "char": np.dtype("S30"),
+}
 
 
 class HDF5Writer:
-    """Class that handles writing simulation results to hdf5 files."""
+    """Class that handles writing simulation results to hdf5 files.
+
+    Rows are buffered in memory and written with a single slice assignment per dataset once the buffer is full,
+    the flush interval has passed or the buffer exceeds the configured size in bytes.
+
+    The data type of each result variable is taken from the value types of the export variables if known, otherwise
+    it is sized from all element values of the first time step. Element labels that appear after the datasets were
+    created are not written and are reported once per result variable. Elements missing from a time step are
+    written as NaN for real and complex values, 0 for integers and an empty string for characters.
+
+    Two layouts are supported. 'columns' creates one 1-D dataset per element under each result group.
+    'matrix' creates a single (time, element) dataset named 'values' per result group with a sidecar 'labels' array.
+    """
 
-    def __init__(self, log_dir: Path, column_length: int, filename_prefix:str=""):
+    def __init__(
+        self,
+        log_dir: Path,
+        column_length: int,
+        filename_prefix: str = "",
+        buffer_settings: WriterBufferSettings = None,
+        layout: HDF5Layouts = HDF5Layouts.COLUMNS,
+        result_types: dict = None,
+    ):
         """Constructor for hdf5 writer
 
         Args:
             log_dir (Path): output path (dirctory)
             column_length (int): number of data columns
+            filename_prefix (str, optional): prefix for the results file. Defaults to "".
+            buffer_settings (WriterBufferSettings, optional): row buffer and flush settings. Defaults to None.
+            layout (HDF5Layouts, optional): dataset layout. Defaults to HDF5Layouts.COLUMNS.
+            result_types (dict, optional): mapping of result variables to value types ('real', 'int', 'cplx' or
+                'char'). Defaults to None.
         """
 
+        if buffer_settings is None:
+            buffer_settings = WriterBufferSettings()
+
         self.log_dir = log_dir
-        filename = filename_prefix + "_"  + DEFAULT_RESULTS_FILENAME
-        self.store = h5py.File(
-            os.path.join(log_dir, filename), "w"
-        )
+        filename = filename_prefix + "_" + DEFAULT_RESULTS_FILENAME
+        self.store = h5py.File(os.path.join(log_dir, filename), "w")
         self.store_groups = {}
         self.store_datasets = {}
-        self.row = {}
         self.column_length = column_length
+        self.layout = HDF5Layouts(layout) if layout else HDF5Layouts.COLUMNS
+        self.matrix_index = {}
+        self.result_types = result_types or {}
+        self.unknown_labels = {}
 
-        self.chunkRows = 1
+        self.buffer_rows = buffer_settings.rows
+        self.flush_interval = (
+            buffer_settings.flush_interval.total_seconds() if buffer_settings.flush_interval else None
+        )
+        self.flush_bytes = buffer_settings.flush_bytes
+        self.chunk_rows = max(1, min(self.buffer_rows, max(self.column_length, 1)))
+        self.buffers = {}
+        self.row_bytes = 0
+        self.buffered = 0
         self.step = 0
-        self.dfs = {}
-        self.convergence = self.store.create_dataset(
-            "Convergence",
+        self.last_flush = time.monotonic()
+        self.closed = False
+
+        self.convergence = self.create_dataset(self.store, "Convergence", np.int16)
+        self.Timestamp = self.create_dataset(self.store, "Time stamp", "S30")
+        self.convergence_buffer = np.zeros(self.buffer_rows, dtype=np.int16)
+        self.timestamp_buffer = np.zeros(self.buffer_rows, dtype="S30")
+
+    def create_dataset(self, group: h5py.Group, name: str, dtype) -> h5py.Dataset:
+        """creates a resizable 1-D dataset chunked for appends
+
+        Args:
+            group (h5py.Group): parent group
+            name (str): dataset name
+            dtype: data type
+
+        Returns:
+            h5py.Dataset: created dataset
+        """
+
+        return group.create_dataset(
+            name,
             shape=(self.column_length,),
             maxshape=(None,),
-            chunks=True,
+            chunks=(self.chunk_rows,),
             compression="gzip",
             compression_opts=4,
             shuffle=True,
-            dtype=np.int16,
+            dtype=dtype,
         )
-        self.Timestamp = self.store.create_dataset(
-            "Time stamp",
-            shape=(self.column_length,),
-            maxshape=(None,),
-            chunks=True,
+
+    @staticmethod
+    def get_dtype(value):
+        """returns the dataset data type for a result value"""
+        if value is None:
+            return np.float64
+        dtype = np.asarray(value).dtype
+        if dtype.kind in "OUS":
+            return np.dtype("S30")
+        return dtype
+
+    @staticmethod
+    def get_matrix_dtype(values) -> np.dtype:
+        """returns a common data type for all element values of a result variable"""
+        dtypes = [np.dtype(HDF5Writer.get_dtype(value)) for value in values if value is not None]
+        if any(dtype.kind == "S" for dtype in dtypes):
+            return np.dtype("S30")
+        if any(dtype.kind == "c" for dtype in dtypes):
+            return np.dtype(np.complex128)
+        if dtypes and all(dtype.kind in "iu" for dtype in dtypes):
+            return np.dtype(np.int64)
+        return np.dtype(np.float64)
+
+    def get_variable_dtype(self, obj_type: str, data: dict) -> np.dtype:
+        """returns the data type of a result variable, from the export variable type if known, otherwise from all
+        element values
+
+        Args:
+            obj_type (str): result variable name e.g. 'Buses_PU'
+            data (dict): mapping of element labels to values for the first time step
+
+        Returns:
+            np.dtype: dataset data type
+        """
+
+        if obj_type in self.result_types:
+            return RESULT_DTYPES[self.result_types[obj_type]]
+        return self.get_matrix_dtype(data.values())
+
+    @staticmethod
+    def get_fill_value(dtype: np.dtype):
+        """returns the value written for elements missing from a time step"""
+        if dtype.kind in "fc":
+            return np.nan
+        if dtype.kind == "S":
+            return b""
+        return 0
+
+    def reset_buffers(self):
+        """fills all row buffers with the fill value of their data type, so values of a flushed time step are never
+        written again for elements missing from a later time step"""
+        for buffers in self.buffers.values():
+            for buffer in buffers.values() if isinstance(buffers, dict) else [buffers]:
+                buffer.fill(self.get_fill_value(buffer.dtype))
+
+    def report_unknown_labels(self, obj_type: str, labels: list):
+        """logs element labels that have no dataset, once per result variable"""
+        if obj_type in self.unknown_labels:
+            return
+        self.unknown_labels[obj_type] = labels
+        logger.warning(
+            f"{len(labels)} element(s) of '{obj_type}' appeared after the datasets were created and are not "
+            f"written to the hdf5 store: {labels[:10]}"
+        )
+
+    @staticmethod
+    def set_value(buffer: np.ndarray, index, value, obj_type: str):
+        """stores a value in a row buffer
+
+        Raises:
+            TypeError: raised if the value does not fit the dataset data type
+        """
+        if value is None:
+            value = 0
+        elif buffer.dtype.kind == "S":
+            value = str(value)
+        try:
+            buffer[index] = value
+        except (TypeError, ValueError) as e:
+            msg = f"Value {value!r} of '{obj_type}' does not fit the dataset data type {buffer.dtype}"
+            raise TypeError(msg) from e
+
+    def create_matrix_dataset(self, obj_type: str, data: dict):
+        """creates the (time, element) dataset, label array and row buffer for an object type
+
+        Args:
+            obj_type (str): result variable name e.g. 'Buses_PU'
+            data (dict): mapping of element labels to values for the first time step
+        """
+
+        labels = list(data.keys())
+        n = len(labels)
+        self.store_groups[obj_type] = self.store.create_group(obj_type)
+        self.store_groups[obj_type].create_dataset(
+            "labels", data=np.array([str(label) for label in labels], dtype=object), dtype=h5py.string_dtype()
+        )
+        self.matrix_index[obj_type] = {label: i for i, label in enumerate(labels)}
+        if n == 0:
+            return
+        dtype = self.get_variable_dtype(obj_type, data)
+        self.store_datasets[obj_type] = self.store_groups[obj_type].create_dataset(
+            "values",
+            shape=(self.column_length, n),
+            maxshape=(None, n),
+            chunks=(self.chunk_rows, min(n, 1024)),
             compression="gzip",
             compression_opts=4,
             shuffle=True,
-            dtype="S30",
+            dtype=dtype,
         )
-        # Create arrow writer for each object type
+        self.buffers[obj_type] = np.full((self.buffer_rows, n), self.get_fill_value(dtype), dtype=dtype)
+        self.row_bytes += self.buffers[obj_type][0].nbytes
 
-    def write(
-        self, currenttime: datetime, powerflow_output: dict, convergence: int
-    ):
+    def create_datasets(self, obj_type: str, data: dict):
+        """creates the group, datasets and row buffers for an object type
+
+        Args:
+            obj_type (str): result variable name e.g. 'Buses_PU'
+            data (dict): mapping of element labels to values for the first time step
+        """
+
+        if self.layout == HDF5Layouts.MATRIX:
+            self.create_matrix_dataset(obj_type, data)
+            return
+
+        self.store_groups[obj_type] = self.store.create_group(obj_type)
+        self.store_datasets[obj_type] = {}
+        self.buffers[obj_type] = {}
+        dtype = self.get_variable_dtype(obj_type, data)
+        for col_name in data:
+            name = self.column_name(col_name)
+            self.store_datasets[obj_type][name] = self.create_dataset(self.store_groups[obj_type], name, dtype)
+            self.buffers[obj_type][name] = np.full(self.buffer_rows, self.get_fill_value(dtype), dtype=dtype)
+            self.row_bytes += self.buffers[obj_type][name].itemsize
+
+    def write(self, currenttime: datetime, powerflow_output: dict, convergence: int):
         """Writes the status of assets at a particular timestep to a hdf5 file.
 
         Args:
@@ -68,82 +254,106 @@ class HDF5Writer:
             powerflow_output (dict): simulation results
             convergence (int): simulation convergence status
         """
-        # Iterate through each object type
-        for obj_type in powerflow_output:
-            data = pd.DataFrame(powerflow_output[obj_type], index=[self.step])
-            data = data.fillna(0)
-
-            if obj_type not in self.row:
-                self.row[obj_type] = 0
-                self.store_groups[obj_type] = self.store.create_group(obj_type)
-                self.store_datasets[obj_type] = {}
-                for col_name in powerflow_output[obj_type].keys():
-                    dtype = data[col_name].dtype
-                    if dtype == object:
-                        dtype = "S30"
-
-                    self.store_datasets[obj_type][self.column_name(col_name)] = self.store_groups[
-                        obj_type
-                    ].create_dataset(
-                        self.column_name(col_name),
-                        shape=(self.column_length,),
-                        maxshape=(None,),
-                        chunks=True,
-                        compression="gzip",
-                        compression_opts=4,
-                        shuffle=True,
-                        dtype=dtype,
-                    )
-
-            if obj_type not in self.dfs:
-                self.dfs[obj_type] = data
-            else:
-                if self.dfs[obj_type] is None:
-                    self.dfs[obj_type] = data
-                else:
-                    self.dfs[obj_type] = self.dfs[obj_type].append(
-                        data, ignore_index=True
-                    )
-
-            if self.step % self.chunkRows == self.chunkRows - 1:
-                si = int(self.step / self.chunkRows) * self.chunkRows
-                ei = si + self.chunkRows
-                for col_name in powerflow_output[obj_type].keys():
-                    r = self.store_datasets[obj_type][self.column_name(col_name)].shape[0]
-                    if ei >= r:
-                        self.store_datasets[obj_type][self.column_name(col_name)].resize((ei,))
-                    self.store_datasets[obj_type][self.column_name(col_name)][si:ei] = self.dfs[
-                        obj_type
-                    ][col_name]
-                self.dfs[obj_type] = None
-            if self.step >= len(self.Timestamp):
-                self.Timestamp.resize((len(self.Timestamp) + 1,))
-                self.convergence.resize((len(self.convergence) + 1,))
-            self.Timestamp[self.step - 1] = np.string_(currenttime.strftime("%Y-%m-%d %H:%M:%S.%f"))
-            self.convergence[self.step - 1] = convergence
-            # Add object status data to a DataFrame
-            self.store.flush()
+
+        row = self.buffered
+        for obj_type, data in powerflow_output.items():
+            if obj_type not in self.store_groups:
+                self.create_datasets(obj_type, data)
+            if self.layout == HDF5Layouts.MATRIX:
+                self.buffer_matrix_row(obj_type, data, row)
+                continue
+            buffers = self.buffers[obj_type]
+            unknown = []
+            for col_name, value in data.items():
+                name = self.column_name(col_name)
+                if name not in buffers:
+                    unknown.append(col_name)
+                    continue
+                self.set_value(buffers[name], row, value, obj_type)
+            if unknown:
+                self.report_unknown_labels(obj_type, unknown)
+
+        self.timestamp_buffer[row] = np.bytes_(currenttime.strftime("%Y-%m-%d %H:%M:%S.%f"))
+        self.convergence_buffer[row] = convergence
+        self.buffered += 1
         self.step += 1
 
-    def column_name(self, column_name:str)-> str:
+        if self.flush_required():
+            self.flush()
+
+    def buffer_matrix_row(self, obj_type: str, data: dict, row: int):
+        """copies results for a single time step into the matrix row buffer
+
+        Args:
+            obj_type (str): result variable name e.g. 'Buses_PU'
+            data (dict): mapping of element labels to values
+            row (int): buffer row
+        """
+
+        if obj_type not in self.buffers:
+            return
+        buffer = self.buffers[obj_type][row]
+        index = self.matrix_index[obj_type]
+        unknown = []
+        for label, value in data.items():
+            i = index.get(label)
+            if i is None:
+                unknown.append(label)
+                continue
+            self.set_value(buffer, i, value, obj_type)
+        if unknown:
+            self.report_unknown_labels(obj_type, unknown)
+
+    def flush_required(self) -> bool:
+        """returns true if the row buffer should be written to disk"""
+        if self.buffered >= self.buffer_rows:
+            return True
+        if self.flush_bytes and self.buffered * self.row_bytes >= self.flush_bytes:
+            return True
+        if self.flush_interval is not None and time.monotonic() - self.last_flush >= self.flush_interval:
+            return True
+        return False
+
+    def flush(self):
+        """writes all buffered rows with one slice assignment per dataset"""
+
+        n = self.buffered
+        if n == 0:
+            return
+        ei = self.step
+        si = ei - n
+        for obj_type, buffers in self.buffers.items():
+            if self.layout == HDF5Layouts.MATRIX:
+                self.write_slice(self.store_datasets[obj_type], buffers, si, ei)
+                continue
+            for name, buffer in buffers.items():
+                self.write_slice(self.store_datasets[obj_type][name], buffer, si, ei)
+        self.write_slice(self.Timestamp, self.timestamp_buffer, si, ei)
+        self.write_slice(self.convergence, self.convergence_buffer, si, ei)
+        self.store.flush()
+        self.reset_buffers()
+        self.buffered = 0
+        self.last_flush = time.monotonic()
+        logger.debug(f"{n} rows written to the hdf5 store")
+
+    def write_slice(self, dataset: h5py.Dataset, buffer: np.ndarray, si: int, ei: int):
+        if ei > dataset.shape[0]:
+            dataset.resize((ei, *dataset.shape[1:]))
+        dataset[si:ei] = buffer[: ei - si]
+
+    def column_name(self, column_name: str) -> str:
         return str(column_name).replace(" ", "")
 
     def close_store(self):
+        """writes remaining buffered rows and closes the hdf5 store"""
+        if getattr(self, "closed", True):
+            return
         try:
-            k = list(self.dfs.keys())[0]
-            if self.dfs[k] is not None:
-                length = len(self.dfs[k])
-                if length > 0:
-                    for obj_type in self.dfs.keys():
-                        for col_name in self.dfs[k].columns:
-                            self.store_datasets[obj_type][self.column_name(col_name)][
-                                self.column_length - length :
-                            ] = self.dfs[obj_type][col_name]
-
-            self.store.flush()
+            self.flush()
             self.store.close()
         except Exception as e:
             logger.info(str(e))
+        self.closed = True
 
     def __del__(self):
         self.close_store()
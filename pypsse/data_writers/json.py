@@ -45,7 +45,8 @@ class JSONWriter:
                 f = open(fpath, "w")
                 f.close()
                 self.handles[obj_type] = open(fpath, "a")
-            data = powerflow_output[obj_type]
+            # copied, result frames reuse their vectors between time steps
+            data = dict(powerflow_output[obj_type])
             if obj_type not in self.dfs:
                 self.dfs[obj_type] = {str(currenttime): data}
             else:
@@ -0,0 +1,217 @@
+# Standard libraries
+import numbers
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+from pypsse.models import WriterBufferSettings
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+class ParquetWriter:
+    """Class that handles writing simulation results to parquet files.
+
+    One file is created per object type (e.g. 'Buses_PU'). Each row holds the time stamp, the convergence flag and
+    one column per element. Rows are buffered and written as one row group per flush so memory use stays flat.
+    Complex values are split into '<label>_real' and '<label>_imag' columns.
+
+    The column type of each result variable is taken from the value types of the export variables if known
+    ('real' -> float64, 'int' -> int64, 'char' -> string). Otherwise it is inferred from all element values of
+    the first time step, and numeric values are always written as float64 so integer and real values can mix.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        column_length: int,
+        filename_prefix: str = "",
+        buffer_settings: WriterBufferSettings = None,
+        dictionary_encoding: bool = False,
+        result_types: dict = None,
+    ):
+        """Constructor for parquet writer
+
+        Args:
+            log_dir (Path): output path (dirctory)
+            column_length (int): number of data columns
+            filename_prefix (str, optional): prefix for the results files. Defaults to "".
+            buffer_settings (WriterBufferSettings, optional): row group and flush settings. Defaults to None.
+            dictionary_encoding (bool, optional): dictionary encode string columns. Defaults to False.
+            result_types (dict, optional): mapping of result variables to value types ('real', 'int', 'cplx' or
+                'char'). Defaults to None.
+
+        Raises:
+            ImportError: raised if pyarrow is not installed
+        """
+
+        if pa is None:
+            msg = "Parquet export requires pyarrow. Use 'pip install NREL-pypsse[parquet]' to install it"
+            raise ImportError(msg)
+
+        if buffer_settings is None:
+            buffer_settings = WriterBufferSettings()
+
+        self.log_dir = log_dir
+        self.filename_prefix = filename_prefix
+        self.column_length = column_length
+        self.dictionary_encoding = dictionary_encoding
+        self.result_types = result_types or {}
+        self.buffer_rows = buffer_settings.rows
+        self.flush_interval = (
+            buffer_settings.flush_interval.total_seconds() if buffer_settings.flush_interval else None
+        )
+        self.writers = {}
+        self.schemas = {}
+        self.columns = {}
+        self.buffers = {}
+        self.timestamps = []
+        self.convergence = []
+        self.last_flush = time.monotonic()
+        self.closed = False
+
+    def get_result_type(self, obj_type: str, data: dict) -> str:
+        """returns the value type of a result variable, from the export variable type if known, otherwise from all
+        element values
+
+        Args:
+            obj_type (str): result variable name e.g. 'Buses_PU'
+            data (dict): mapping of element labels to values for the first time step
+
+        Returns:
+            str: value type ('real', 'int', 'cplx' or 'char')
+        """
+
+        if obj_type in self.result_types:
+            return self.result_types[obj_type]
+        values = [value for value in data.values() if value is not None]
+        if any(isinstance(value, (complex, np.complexfloating)) for value in values):
+            return "cplx"
+        if all(isinstance(value, numbers.Number) for value in values):
+            return "real"
+        return "char"
+
+    def get_type(self, result_type: str) -> "pa.DataType":
+        """returns the arrow data type for a value type"""
+        if result_type == "int":
+            return pa.int64()
+        if result_type == "char":
+            return pa.dictionary(pa.int32(), pa.string()) if self.dictionary_encoding else pa.string()
+        return pa.float64()
+
+    def create_writer(self, obj_type: str, data: dict):
+        """creates the parquet file and schema for an object type
+
+        Args:
+            obj_type (str): result variable name e.g. 'Buses_PU'
+            data (dict): mapping of element labels to values for the first time step
+        """
+
+        fields = [pa.field("timestamp", pa.timestamp("us")), pa.field("convergence", pa.bool_())]
+        result_type = self.get_result_type(obj_type, data)
+        columns = list(data.keys())
+        label_columns = []
+        for label in columns:
+            name = str(label).replace(" ", "")
+            if result_type == "cplx":
+                fields.append(pa.field(f"{name}_real", pa.float64()))
+                fields.append(pa.field(f"{name}_imag", pa.float64()))
+            else:
+                fields.append(pa.field(name, self.get_type(result_type)))
+                if result_type == "char":
+                    label_columns.append(name)
+
+        schema = pa.schema(fields)
+        fpath = os.path.join(self.log_dir, f"{self.filename_prefix}_{obj_type}.parquet")
+        # only string (label) columns are dictionary encoded, numeric columns keep the pyarrow default encoding
+        options = {"use_dictionary": label_columns} if self.dictionary_encoding else {}
+        self.writers[obj_type] = pq.ParquetWriter(fpath, schema, **options)
+        self.schemas[obj_type] = schema
+        self.columns[obj_type] = (result_type, columns)
+        self.buffers[obj_type] = [[] for _ in fields[2:]]
+
+    def write(self, currenttime: datetime, powerflow_output: dict, convergence: bool):
+        """Writes the status of assets at a particular timestep to parquet files.
+
+        Args:
+            currenttime (datetime): simulator time step
+            powerflow_output (dict): simulation results
+            convergence (bool): simulation convergence status
+        """
+
+        row = len(self.timestamps)
+        for obj_type, data in powerflow_output.items():
+            if obj_type not in self.writers:
+                self.create_writer(obj_type, data)
+            buffers = self.buffers[obj_type]
+            result_type, columns = self.columns[obj_type]
+            for i, label in enumerate(columns):
+                value = data.get(label)
+                if result_type == "cplx":
+                    value = complex(value) if value is not None else None
+                    self.append(buffers[2 * i], row, value.real if value is not None else None)
+                    self.append(buffers[2 * i + 1], row, value.imag if value is not None else None)
+                elif result_type == "char" and value is not None:
+                    self.append(buffers[i], row, str(value))
+                else:
+                    self.append(buffers[i], row, value)
+
+        self.timestamps.append(currenttime)
+        self.convergence.append(bool(convergence))
+        if len(self.timestamps) >= self.buffer_rows or (
+            self.flush_interval is not None and time.monotonic() - self.last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    @staticmethod
+    def append(buffer: list, row: int, value):
+        """appends a value to a column buffer, padding rows for object types missing in earlier steps"""
+        if len(buffer) < row:
+            buffer.extend([None] * (row - len(buffer)))
+        buffer.append(value)
+
+    def flush(self):
+        """writes buffered rows as one row group per object type"""
+
+        n = len(self.timestamps)
+        if n == 0:
+            return
+        timestamps = pa.array(self.timestamps, type=pa.timestamp("us"))
+        convergence = pa.array(self.convergence, type=pa.bool_())
+        for obj_type, writer in self.writers.items():
+            schema = self.schemas[obj_type]
+            arrays = [timestamps, convergence]
+            for field, buffer in zip(list(schema)[2:], self.buffers[obj_type]):
+                if len(buffer) < n:
+                    buffer.extend([None] * (n - len(buffer)))
+                arrays.append(pa.array(buffer, type=field.type, from_pandas=True))
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema), row_group_size=n)
+            self.buffers[obj_type] = [[] for _ in self.buffers[obj_type]]
+        self.timestamps = []
+        self.convergence = []
+        self.last_flush = time.monotonic()
+        logger.debug(f"{n} rows written to parquet files")
+
+    def close_store(self):
+        """writes remaining buffered rows and closes all parquet files"""
+        if getattr(self, "closed", True):
+            return
+        try:
+            self.flush()
+            for writer in self.writers.values():
+                writer.close()
+        except Exception as e:
+            logger.info(str(e))
+        self.closed = True
+
+    def __del__(self):
+        self.close_store()
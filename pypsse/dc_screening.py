@@ -0,0 +1,273 @@
+"DC sensitivity factor (PTDF / LODF) screening of branch outages"
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from pypsse.models import Contingencies, LineFault, LineTrip
+
+try:
+    import scipy.sparse as sp
+    from scipy.sparse.csgraph import connected_components
+    from scipy.sparse.linalg import splu
+except ImportError:
+    sp = None
+
+MIN_REACTANCE = 1e-4
+ISLANDING_TOLERANCE = 1e-6
+
+
+class DCNetwork:
+    """DC power flow model of a case built from bus and branch arrays.
+
+    The reduced susceptance matrix (one reference bus removed per island) is factorized once. Flow changes caused
+    by branch outages are computed from one solve per outaged branch, so the full PTDF (branches x buses) and LODF
+    (branches x branches) matrices are only built when requested. Sparse factorization requires scipy; without it
+    a dense solve is used, which is only practical for small networks.
+    """
+
+    def __init__(
+        self,
+        buses: np.ndarray,
+        from_buses: np.ndarray,
+        to_buses: np.ndarray,
+        reactance: np.ndarray,
+        ratings: np.ndarray = None,
+        flows: np.ndarray = None,
+        circuits: list = None,
+        slack_buses: list = None,
+    ):
+        """builds and factorizes the network
+
+        Args:
+            buses (np.ndarray): bus numbers
+            from_buses (np.ndarray): from bus number of each branch
+            to_buses (np.ndarray): to bus number of each branch
+            reactance (np.ndarray): branch reactance (pu)
+            ratings (np.ndarray, optional): branch ratings (MVA), 0 for unrated branches. Defaults to None.
+            flows (np.ndarray, optional): base case active power flow at the from bus (MW). Defaults to None.
+            circuits (list, optional): circuit id of each branch. Defaults to None (all "1").
+            slack_buses (list, optional): bus numbers of swing buses. Defaults to None.
+        """
+        self.buses = np.asarray(buses, dtype=int)
+        self.bus_index = {b: i for i, b in enumerate(self.buses.tolist())}
+        self.from_index = np.array([self.bus_index[b] for b in np.asarray(from_buses).tolist()], dtype=int)
+        self.to_index = np.array([self.bus_index[b] for b in np.asarray(to_buses).tolist()], dtype=int)
+        nbr = len(self.from_index)
+        reactance = np.asarray(reactance, dtype=float)
+        self.susceptance = 1.0 / np.where(np.abs(reactance) < MIN_REACTANCE, MIN_REACTANCE, reactance)
+        self.ratings = np.zeros(nbr) if ratings is None else np.asarray(ratings, dtype=float)
+        self.flows = np.zeros(nbr) if flows is None else np.asarray(flows, dtype=float)
+        self.circuits = ["1"] * nbr if circuits is None else [str(c).strip() for c in circuits]
+        self.branch_index = {}
+        for k, (i, j, ckt) in enumerate(zip(self.buses[self.from_index], self.buses[self.to_index], self.circuits)):
+            self.branch_index.setdefault((int(i), int(j), ckt), k)
+            self.branch_index.setdefault((int(j), int(i), ckt), k)
+
+        self.reference = self.get_reference_buses(slack_buses or [])
+        self.keep = np.setdiff1d(np.arange(len(self.buses)), self.reference)
+        self.factorize()
+        logger.debug(f"DC network built with {len(self.buses)} buses, {nbr} branches, {len(self.reference)} islands")
+
+    @classmethod
+    def from_psse(cls, psse):
+        """builds the network from the in service buses, branches and two winding transformers of the working case
+
+        Three winding transformers are not modeled.
+
+        Args:
+            psse (object): psspy module
+
+        Returns:
+            DCNetwork: DC network
+        """
+
+        buses = psse.abusint(-1, 1, "NUMBER")[1][0]
+        bus_types = psse.abusint(-1, 1, "TYPE")[1][0]
+        slack_buses = [b for b, t in zip(buses, bus_types) if t == 3]  # noqa: PLR2004
+        from_buses, to_buses = psse.abrnint(-1, 1, 3, 3, 1, ["FROMNUMBER", "TONUMBER"])[1]
+        circuits = psse.abrnchar(-1, 1, 3, 3, 1, "ID")[1][0]
+        reactance = np.array(psse.abrncplx(-1, 1, 3, 3, 1, "RX")[1][0]).imag
+        ratings, flows = psse.abrnreal(-1, 1, 3, 3, 1, ["RATE", "P"])[1]
+        return cls(buses, from_buses, to_buses, reactance, ratings, flows, circuits, slack_buses)
+
+    def __getstate__(self) -> dict:
+        # the factorization can not be pickled, it is rebuilt when the network is unpickled
+        return {k: v for k, v in self.__dict__.items() if k not in ["lu", "solve", "branch_susceptance"]}
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self.factorize()
+
+    def get_incidence(self):
+        """returns the branch to bus incidence matrix (+1 at the from bus, -1 at the to bus)"""
+        nbr, nbus = len(self.from_index), len(self.buses)
+        rows = np.r_[np.arange(nbr), np.arange(nbr)]
+        cols = np.r_[self.from_index, self.to_index]
+        data = np.r_[np.ones(nbr), -np.ones(nbr)]
+        if sp is not None:
+            return sp.csr_matrix((data, (rows, cols)), shape=(nbr, nbus))
+        incidence = np.zeros((nbr, nbus))
+        np.add.at(incidence, (rows, cols), data)
+        return incidence
+
+    def get_reference_buses(self, slack_buses: list) -> np.ndarray:
+        """returns one reference bus index per island, the swing bus if the island has one"""
+        nbus = len(self.buses)
+        if sp is not None:
+            adjacency = sp.csr_matrix(
+                (np.ones(len(self.from_index)), (self.from_index, self.to_index)), shape=(nbus, nbus)
+            )
+            _, labels = connected_components(adjacency, directed=False)
+        else:
+            labels = np.arange(nbus)
+            for f, t in zip(self.from_index, self.to_index):
+                labels[labels == labels[t]] = labels[f]
+        slack = {self.bus_index[b] for b in slack_buses if b in self.bus_index}
+        reference = {}
+        for i, label in enumerate(labels.tolist()):
+            if label not in reference or (i in slack and reference[label] not in slack):
+                reference[label] = i
+        return np.array(sorted(reference.values()), dtype=int)
+
+    def factorize(self):
+        """factorizes the reduced bus susceptance matrix"""
+        incidence = self.get_incidence()
+        if sp is not None:
+            self.branch_susceptance = sp.diags(self.susceptance) @ incidence
+            bbus = (incidence.T @ self.branch_susceptance).tocsc()
+            self.lu = splu(bbus[self.keep][:, self.keep].tocsc())
+            self.solve = self.lu.solve
+        else:
+            self.branch_susceptance = self.susceptance[:, None] * incidence
+            bbus = incidence.T @ self.branch_susceptance
+            reduced = bbus[np.ix_(self.keep, self.keep)]
+            self.solve = lambda rhs: np.linalg.solve(reduced, rhs)
+
+    def get_angles(self, injections: np.ndarray) -> np.ndarray:
+        """returns bus angles (reference buses at zero) for bus injections (buses x columns)"""
+        angles = np.zeros(injections.shape)
+        if len(self.keep):
+            angles[self.keep] = self.solve(np.ascontiguousarray(injections[self.keep]))
+        return angles
+
+    def get_transfer_factors(self, branches: list) -> np.ndarray:
+        """returns the flow on every branch for a unit transfer from the from bus to the to bus of each branch
+
+        Args:
+            branches (list): branch indices
+
+        Returns:
+            np.ndarray: transfer factors (branches x len(branches))
+        """
+        branches = np.asarray(branches, dtype=int)
+        injections = np.zeros((len(self.buses), len(branches)))
+        injections[self.from_index[branches], np.arange(len(branches))] += 1.0
+        injections[self.to_index[branches], np.arange(len(branches))] -= 1.0
+        return np.asarray(self.branch_susceptance @ self.get_angles(injections))
+
+    def get_ptdf(self) -> np.ndarray:
+        """returns the dense power transfer distribution factors (branches x buses), injections withdrawn at the
+        reference bus of the island"""
+        angles = self.get_angles(np.eye(len(self.buses)))
+        return np.asarray(self.branch_susceptance @ angles)
+
+    def get_lodf(self) -> np.ndarray:
+        """returns the dense line outage distribution factors (monitored branch x outaged branch)
+
+        Columns of outages that island the network are NaN.
+        """
+        transfer = self.get_transfer_factors(np.arange(len(self.from_index)))
+        denominator = 1.0 - np.diag(transfer)
+        islanding = np.abs(denominator) < ISLANDING_TOLERANCE
+        lodf = transfer / np.where(islanding, 1.0, denominator)
+        lodf[:, islanding] = np.nan
+        np.fill_diagonal(lodf, -1.0)
+        return lodf
+
+    def get_post_contingency_flows(self, branches: list) -> np.ndarray:
+        """returns the estimated flows after a simultaneous outage of one or more branches
+
+        Args:
+            branches (list): outaged branch indices
+
+        Returns:
+            np.ndarray: post contingency flows (MW), None if the outage islands the network
+        """
+        branches = np.unique(np.asarray(branches, dtype=int))
+        transfer = self.get_transfer_factors(branches)
+        coupling = np.eye(len(branches)) - transfer[branches]
+        if np.linalg.matrix_rank(coupling, tol=ISLANDING_TOLERANCE) < len(branches):
+            return None
+        flows = self.flows + transfer @ np.linalg.solve(coupling, self.flows[branches])
+        flows[branches] = 0.0
+        return flows
+
+    def get_loading(self, flows: np.ndarray) -> np.ndarray:
+        """returns branch loading in percent of rating, 0 for unrated branches"""
+        rated = self.ratings > 0
+        return np.where(rated, np.abs(flows) / np.where(rated, self.ratings, 1.0) * 100.0, 0.0)
+
+
+def get_outaged_branches(network: DCNetwork, contingencies_: Contingencies) -> list:
+    """returns the branch indices outaged by a contingency case
+
+    Args:
+        network (DCNetwork): DC network
+        contingencies_ (Contingencies): contingency case
+
+    Returns:
+        list: branch indices, None if the case holds outages other than branch trips or unknown branches
+    """
+    branches = []
+    for contingency in contingencies_.contingencies:
+        if not (isinstance(contingency, LineTrip) or (isinstance(contingency, LineFault) and contingency.bus_trip)):
+            return None
+        ibus, jbus = contingency.bus_ids[:2]
+        ckt = str(contingency.bus_ids[2]) if len(contingency.bus_ids) > 2 else "1"  # noqa: PLR2004
+        branch = network.branch_index.get((int(ibus), int(jbus), ckt))
+        if branch is None:
+            return None
+        branches.append(branch)
+    return branches
+
+
+def screen_contingencies(network: DCNetwork, contingencies_: List[Contingencies], threshold: float) -> pd.DataFrame:
+    """estimates post contingency branch loading of branch outages and selects the cases to simulate
+
+    Cases with an estimated loading above the threshold, cases that island the network and cases that can not
+    be screened (bus or machine outages, unknown branches) are selected for full simulation.
+
+    Args:
+        network (DCNetwork): DC network of the solved base case
+        contingencies_ (List[Contingencies]): contingency cases
+        threshold (float): estimated loading (percent of rating) above which a case is simulated
+
+    Returns:
+        pd.DataFrame: screening table indexed by contingency case, ranked by estimated loading
+    """
+
+    rows = []
+    for index, case in enumerate(contingencies_):
+        row = {"index": index, "estimated_loading": np.nan, "critical_branch": "", "islanding": False}
+        branches = get_outaged_branches(network, case)
+        if branches is not None:
+            flows = network.get_post_contingency_flows(branches)
+            if flows is None:
+                row["islanding"] = True
+            else:
+                loading = network.get_loading(flows)
+                k = int(np.argmax(loading))
+                row["estimated_loading"] = float(loading[k])
+                i, j = network.buses[network.from_index[k]], network.buses[network.to_index[k]]
+                row["critical_branch"] = f"{i}_{j}_{network.circuits[k]}"
+        row["simulate"] = bool(branches is None or row["islanding"] or row["estimated_loading"] > threshold)
+        rows.append(row)
+
+    results = pd.DataFrame(rows, columns=["index", "estimated_loading", "critical_branch", "islanding", "simulate"])
+    results = results.set_index("index").sort_values("estimated_loading", ascending=False, na_position="first")
+    results["rank"] = np.arange(1, len(results) + 1)
+    logger.info(f"DC screening selected {int(results['simulate'].sum())} of {len(results)} cases for simulation")
+    return results
@@ -19,6 +19,28 @@ class BulkWriteModes(str, Enum):
 class StreamedWriteModes(str, Enum):
     "Supported stream writers"
     H5 = "h5"
+    PARQUET = "parquet"
+    CSV_STREAM = "csv_stream"
+
+
+class HDF5Layouts(str, Enum):
+    "Dataset layouts supported by the hdf5 writer"
+    COLUMNS = "columns"
+    MATRIX = "matrix"
+
+
+class ProfileCompressors(str, Enum):
+    "Compressors for compacted profile stores"
+    AUTO = "auto"
+    LZ4 = "lz4"
+    BLOSC = "blosc"
+    GZIP = "gzip"
+
+
+class SubsystemReadModes(str, Enum):
+    "Engines available for reading subsystem results"
+    LEGACY = "legacy"
+    BULK = "bulk"
 
 
 class SimulationModes(str, Enum):
@@ -403,6 +425,8 @@ class ExportModes(str, Enum):
     JSON = "json"
     CSV = "csv"
     H5 = "h5"
+    PARQUET = "parquet"
+    CSV_STREAM = "csv_stream"
 
 
 class ChannelTypes(str, Enum):
@@ -435,6 +459,14 @@ class ApiCommands(str, Enum):
     QUERY_ASSET_LIST = "query_asset_list"
 
 
+class ContingencyEvents(str, Enum):
+    "Scheduled contingency event types"
+
+    ENABLE = "enable"
+    DISABLE = "disable"
+    TRIP = "trip"
+
+
 class SimulationStatus(str, Enum):
     NOT_INITIALIZED = "Instance not initialized"
     STARTING_INSTANCE = "Starting PyPSSE instance"
@@ -1,14 +1,42 @@
 import ast
+import json
+from operator import itemgetter
 
 import helics as h
+import numpy as np
 import pandas as pd
 from loguru import logger
 
-from pypsse.common import MAPPED_CLASS_NAMES, VALUE_UPDATE_BOUND
+from pypsse.common import MAPPED_CLASS_NAMES
 from pypsse.models import ExportFileOptions, SimulationSettings
 from pypsse.modes.abstract_mode import AbstractMode
+from pypsse.modes.update_batch import get_key_order
 from pypsse.profile_manager.common import PROFILE_VALIDATION
 
+PUBLISH_FUNCTIONS = {
+    "double": h.helicsPublicationPublishDouble,
+    "complex": lambda pub, val: h.helicsPublicationPublishComplex(pub, val.real, val.imag),
+    "integer": h.helicsPublicationPublishInteger,
+    "vector": lambda pub, val: h.helicsPublicationPublishVector(pub, list(val)),
+    "complex_vector": lambda pub, val: h.helicsPublicationPublishComplexVector(pub, [complex(v) for v in val]),
+    "string": h.helicsPublicationPublishString,
+}
+
+
+def get_publication_type(val) -> str:
+    """returns the HELICS publication type for a result value, None if the type is not supported"""
+    if isinstance(val, float):
+        return "double"
+    elif isinstance(val, complex):
+        return "complex"
+    elif isinstance(val, int):
+        return "integer"
+    elif isinstance(val, list):
+        return "vector"
+    elif isinstance(val, str):
+        return "string"
+    return None
+
 
 class HelicsInterface:
     "Implements the HEILCS interface for PyPSSE"
@@ -130,39 +158,89 @@ class HelicsInterface:
             if elm_class.lower() in MAPPED_CLASS_NAMES:
                 elm_class = MAPPED_CLASS_NAMES[elm_class.lower()]
 
-            self.pub_struc.append([{elm_class: properties}, bus_cluster])
-            temp_res = self.sim.read_subsystems({elm_class: properties}, bus_cluster)
-            temp_res = self.get_restructured_results(temp_res)
-            for c_name, elm_info in temp_res.items():
-                for name, v_info in elm_info.items():
-                    for p_name, val in v_info.items():
-                        pub_tag = f"{self.settings.helics.federate_name}.{c_name}.{name}.{p_name}"
-                        dtype_matched = True
-                        if isinstance(val, float):
-                            self.publications[pub_tag] = h.helicsFederateRegisterGlobalTypePublication(
-                                self.psse_federate, pub_tag, "double", ""
-                            )
-                        elif isinstance(val, complex):
-                            self.publications[pub_tag] = h.helicsFederateRegisterGlobalTypePublication(
-                                self.psse_federate, pub_tag, "complex", ""
-                            )
-                        elif isinstance(val, int):
-                            self.publications[pub_tag] = h.helicsFederateRegisterGlobalTypePublication(
-                                self.psse_federate, pub_tag, "integer", ""
-                            )
-                        elif isinstance(val, list):
-                            self.publications[pub_tag] = h.helicsFederateRegisterGlobalTypePublication(
-                                self.psse_federate, pub_tag, "vector", ""
-                            )
-                        elif isinstance(val, str):
-                            self.publications[pub_tag] = h.helicsFederateRegisterGlobalTypePublication(
-                                self.psse_federate, pub_tag, "string", ""
-                            )
-                        else:
-                            dtype_matched = False
-                            logger.warning(f"Publication {pub_tag} could not be registered. Data type not found")
-                        if dtype_matched:
-                            logger.debug(f"Publication registered: {pub_tag}")
+            quantities = {elm_class: properties}
+            results = self.sim.read_subsystems({elm_class: list(properties)}, bus_cluster)
+            if publication_dict.vector:
+                table = self.register_vector_publications(results)
+            else:
+                table = self.register_scalar_publications(results)
+            self.pub_struc.append([quantities, bus_cluster, table])
+
+    def register_publication(self, pub_tag: str, val) -> (object, object):
+        """registers a typed publication
+
+        Args:
+            pub_tag (str): publication tag
+            val (object): sample value used to select the publication type
+
+        Returns:
+            object: HELICS publication, None if the value type is not supported
+            function: publish function for the publication type
+        """
+
+        pub_type = get_publication_type(val)
+        if pub_type is None:
+            logger.warning(f"Publication {pub_tag} could not be registered. Data type not found")
+            return None, None
+        pub = h.helicsFederateRegisterGlobalTypePublication(self.psse_federate, pub_tag, pub_type, "")
+        logger.debug(f"Publication registered: {pub_tag}")
+        return pub, PUBLISH_FUNCTIONS[pub_type]
+
+    def register_scalar_publications(self, results: dict) -> list:
+        """registers one publication per element and property
+
+        Args:
+            results (dict): simulation results for the publication group
+
+        Returns:
+            list: publication table, (result key, value getter, publication, publish function, tag) tuples
+        """
+
+        table = []
+        for key, values in results.items():
+            c_name, p_name = key.split("_", 1)
+            for n_raw, val in values.items():
+                name = n_raw.replace(" ", "") if isinstance(n_raw, str) else str(n_raw)
+                pub_tag_reduced = f"{c_name}.{name}.{p_name}"
+                pub_tag = f"{self.settings.helics.federate_name}.{pub_tag_reduced}"
+                pub, publish = self.register_publication(pub_tag, val)
+                if pub is not None:
+                    self.publications[pub_tag] = pub
+                    table.append((key, itemgetter(n_raw), pub, publish, pub_tag_reduced))
+        return table
+
+    def register_vector_publications(self, results: dict) -> list:
+        """registers one vector publication per property, packing the values of all elements in the group
+
+        The element labels (in publication order) are stored as a json list in the publication info field.
+
+        Args:
+            results (dict): simulation results for the publication group
+
+        Returns:
+            list: publication table, (result key, value getter, publication, publish function, tag) tuples
+        """
+
+        table = []
+        for key, values in results.items():
+            c_name, p_name = key.split("_", 1)
+            labels = list(values)
+            pub_tag_reduced = f"{c_name}.{p_name}"
+            pub_tag = f"{self.settings.helics.federate_name}.{pub_tag_reduced}"
+            if any(isinstance(v, complex) for v in values.values()):
+                pub_type = "complex_vector"
+            elif all(isinstance(v, (int, float)) for v in values.values()):
+                pub_type = "vector"
+            else:
+                logger.warning(f"Publication {pub_tag} could not be registered. Values are not numeric")
+                continue
+            pub = h.helicsFederateRegisterGlobalTypePublication(self.psse_federate, pub_tag, pub_type, "")
+            h.helicsPublicationSetInfo(pub, json.dumps([str(label) for label in labels]))
+            self.publications[pub_tag] = pub
+            getter = itemgetter(*labels) if len(labels) > 1 else lambda d, label=labels[0]: (d[label],)
+            table.append((key, getter, pub, PUBLISH_FUNCTIONS[pub_type], pub_tag_reduced))
+            logger.debug(f"Vector publication registered: {pub_tag} ({len(labels)} elements)")
+        return table
 
     def register_subscriptions(self):
         """Creates a HELICS subscriptions
@@ -178,7 +256,6 @@ class HelicsInterface:
             self.settings.simulation.subscriptions_file
         ), "HELICS co-simulations requires a subscriptions_file property populated"
         sub_data = pd.read_csv(self.settings.simulation.subscriptions_file)
-        self.psse_dict = {}
         for _, row in sub_data.iterrows():
             try:
                 row["element_property"] = ast.literal_eval(row["element_property"])
@@ -227,19 +304,48 @@ class HelicsInterface:
                 )
             )
 
-            if row["bus"] not in self.psse_dict:
-                self.psse_dict[row["bus"]] = {}
-            if row["element_type"] not in self.psse_dict[row["bus"]]:
-                self.psse_dict[row["bus"]][row["element_type"]] = {}
-            if element_id not in self.psse_dict[row["bus"]][row["element_type"]]:
-                self.psse_dict[row["bus"]][row["element_type"]][element_id] = {}
-            if isinstance(row["element_property"], str):
-                if row["element_property"] not in self.psse_dict[row["bus"]][row["element_type"]][element_id]:
-                    self.psse_dict[row["bus"]][row["element_type"]][element_id][row["element_property"]] = 0
-            elif isinstance(row["element_property"], list):
-                for r in row["element_property"]:
-                    if r not in self.psse_dict[row["bus"]][row["element_type"]][element_id]:
-                        self.psse_dict[row["bus"]][row["element_type"]][element_id][r] = 0
+        self.compile_subscriptions()
+
+    def compile_subscriptions(self):
+        """compiles the subscriptions into flat arrays
+
+        Every (subscription, vector position) pair is an entry holding the target element slot, the realar column
+        and the scaler. Element slots are rows of a (element, realar key) value table that is updated by a
+        vectorized gather-scale-scatter on each call to 'subscribe'.
+        """
+
+        elements = {}
+        entry_element = []
+        entry_key = []
+        entry_scaler = []
+        self.sub_tags = []
+        self.sub_inputs = []
+        for sub_data in self.subscriptions.values():
+            t = sub_data["element_type"]
+            is_vector = isinstance(sub_data["property"], list)
+            properties = sub_data["property"] if is_vector else [sub_data["property"]]
+            scalers = sub_data["scaler"] if is_vector else [sub_data["scaler"]]
+            slot = elements.setdefault((t, int(sub_data["bus"]), sub_data["element_id"]), len(elements))
+            self.sub_inputs.append((sub_data, len(entry_element), len(properties), is_vector))
+            for p, scaler in zip(properties, scalers):
+                entry_element.append(slot)
+                entry_key.append(f"realar{PROFILE_VALIDATION[t].index(p) + 1}")
+                entry_scaler.append(float(scaler))
+                self.sub_tags.append(f"{t}.{sub_data['bus']}.{sub_data['element_id']}.{p}")
+
+        self.sub_keys = sorted(set(entry_key), key=get_key_order)
+        columns = {k: j for j, k in enumerate(self.sub_keys)}
+        self.sub_dtypes = np.array([e[0] for e in elements], dtype=object)
+        self.sub_buses = np.array([e[1] for e in elements], dtype=int)
+        self.sub_element_ids = np.array([e[2] for e in elements], dtype=object)
+        self.entry_element = np.array(entry_element, dtype=int)
+        self.entry_column = np.array([columns[k] for k in entry_key], dtype=int)
+        self.entry_scaler = np.array(entry_scaler, dtype=np.float64)
+        self.sub_tags = np.array(self.sub_tags, dtype=object)
+        self.entry_values = np.full(len(entry_element), np.nan)
+        self.element_values = np.full((len(elements), len(self.sub_keys)), np.nan)
+        self.applied_values = np.full((len(elements), len(self.sub_keys)), np.nan)
+        logger.debug(f"{len(entry_element)} subscription entries compiled for {len(elements)} elements")
 
     def request_time(self, _) -> (bool, float):
         """Enables time increment of the federate ina  co-simulation."
@@ -336,32 +442,17 @@ class HelicsInterface:
         """
 
         pub_results = {}
-        for quantities, subsystem_buses in self.pub_struc:
-            temp_res = self.sim.read_subsystems(quantities, subsystem_buses)
-            temp_res = self.get_restructured_results(temp_res)
-            for c_name, elm_info in temp_res.items():
-                for name, v_info in elm_info.items():
-                    for p_name, val in v_info.items():
-                        pub_tag = f"{self.settings.helics.federate_name}.{c_name}.{name}.{p_name}"
-                        pub_tag_reduced = f"{c_name}.{name}.{p_name}"
-                        pub = self.publications[pub_tag]
-                        dtype_matched = True
-                        pub_results[pub_tag_reduced] = val
-                        if isinstance(val, float):
-                            h.helicsPublicationPublishDouble(pub, val)
-                        elif isinstance(val, complex):
-                            h.helicsPublicationPublishComplex(pub, val.real, val.imag)
-                        elif isinstance(val, int):
-                            h.helicsPublicationPublishInteger(pub, val)
-                        elif isinstance(val, list):
-                            h.helicsPublicationPublishVector(pub, val)
-                        elif isinstance(val, str):
-                            h.helicsPublicationPublishString(pub, val)
-                        else:
-                            dtype_matched = False
-                            logger.warning(f"Publication {pub_tag} not updated")
-                        if dtype_matched:
-                            logger.debug(f"Publication {pub_tag} published: {val}")
+        for quantities, subsystem_buses, table in self.pub_struc:
+            # read_subsystems converts the quantities in place, a copy keeps the result keys stable
+            results = self.sim.read_subsystems({k: list(v) for k, v in quantities.items()}, subsystem_buses)
+            for key, getter, pub, publish, pub_tag in table:
+                try:
+                    val = getter(results[key])
+                    publish(pub, val)
+                    pub_results[pub_tag] = val
+                except Exception as e:
+                    logger.warning(f"Publication {pub_tag} not updated: {e!s}")
+        logger.debug(f"{len(pub_results)} publications published")
         return pub_results
 
     def subscribe(self) -> dict:
@@ -371,59 +462,45 @@ class HelicsInterface:
             dict: mapping of subscription key to updated result
         """
 
-        "Subscribes results each iteration and updates PSSE objects accordingly"
-        for sub_tag, sub_data in self.subscriptions.items():
-            if isinstance(sub_data["property"], str):
-                sub_data["value"] = h.helicsInputGetDouble(sub_data["subscription"])
-                self.psse_dict[sub_data["bus"]][sub_data["element_type"]][sub_data["element_id"]][
-                    sub_data["property"]
-                ] = (sub_data["value"], sub_data["scaler"])
-            elif isinstance(sub_data["property"], list):
+        received = np.full(len(self.entry_values), np.nan)
+        for sub_data, start, n, is_vector in self.sub_inputs:
+            if is_vector:
                 sub_data["value"] = h.helicsInputGetVector(sub_data["subscription"])
-                if isinstance(sub_data["value"], list) and len(sub_data["value"]) == len(sub_data["property"]):
-                    for i, p in enumerate(sub_data["property"]):
-                        self.psse_dict[sub_data["bus"]][sub_data["element_type"]][sub_data["element_id"]][p] = (
-                            sub_data["value"][i],
-                            sub_data["scaler"][i],
-                        )
-
-            logger.debug("Data received {} for tag {}".format(sub_data["value"], sub_tag))
+                if isinstance(sub_data["value"], list) and len(sub_data["value"]) == n:
+                    received[start : start + n] = sub_data["value"]
+            else:
+                sub_data["value"] = h.helicsInputGetDouble(sub_data["subscription"])
+                received[start] = sub_data["value"]
+
             if self.settings.helics.iterative_mode:
                 if self.c_seconds != self.c_seconds_old:
                     sub_data["dStates"] = [self.init_state] * self.n_states
                 else:
                     sub_data["dStates"].insert(0, sub_data["dStates"].pop())
-        all_values = {}
-        for b, b_info in self.psse_dict.items():
-            for t, t_info in b_info.items():
-                for i, v_dict in t_info.items():
-                    values = {}
-                    j = 0
-                    for p, v_raw in v_dict.items():
-                        if isinstance(v_raw, tuple):
-                            v, scale = v_raw
-                            all_values[f"{t}.{b}.{i}.{p}"] = v
-                            if isinstance(p, str):
-                                ppty = f"realar{PROFILE_VALIDATION[t].index(p) + 1}"
-                                values[ppty] = v * scale
-                            elif isinstance(p, list):
-                                for _, ppt in enumerate(p):
-                                    ppty = f"realar{PROFILE_VALIDATION[t].index(ppt) + 1}"
-                                    values[ppty] = v * scale
-                        j += 1
-
-                    is_empty = [0 if not vx else 1 for vx in values.values()]
-                    if (
-                        sum(is_empty) != 0
-                        and sum(values.values()) < VALUE_UPDATE_BOUND
-                        and sum(values.values()) > -VALUE_UPDATE_BOUND
-                    ):
-                        self.sim.update_object(t, b, i, values)
-                        logger.debug(f"{t}.{b}.{i} = {values}")
-
-                    else:
-                        logger.debug("write failed")
 
+        is_received = ~np.isnan(received)
+        self.entry_values[is_received] = received[is_received]
+        self.element_values[self.entry_element[is_received], self.entry_column[is_received]] = (
+            received[is_received] * self.entry_scaler[is_received]
+        )
+
+        values = self.element_values
+        is_set = ~np.isnan(values)
+        non_zero = (is_set & (values != 0)).any(axis=1)
+        changed = ~((values == self.applied_values) | (~is_set & np.isnan(self.applied_values))).all(axis=1)
+        rows = np.flatnonzero(non_zero & changed)
+        if len(rows):
+            errors = self.sim.update_objects(
+                self.sub_dtypes[rows], self.sub_buses[rows], self.sub_element_ids[rows], self.sub_keys, values[rows]
+            )
+            written = rows[errors == 0]
+            self.applied_values[written] = values[written]
+            for r in rows[errors != 0]:
+                logger.debug(f"write failed for {self.sub_dtypes[r]}.{self.sub_buses[r]}.{self.sub_element_ids[r]}")
+        logger.debug(f"{int(is_received.sum())} subscription values received, {len(rows)} elements changed")
+
+        has_value = ~np.isnan(self.entry_values)
+        all_values = dict(zip(self.sub_tags[has_value].tolist(), self.entry_values[has_value].tolist()))
         self.c_seconds_old = self.c_seconds
         return all_values
 
@@ -17,6 +17,7 @@ from pypsse.enumerations import (
     DCLineProperties,
     ExportModes,
     FixedShuntProperties,
+    HDF5Layouts,
     HelicsCoreTypes,
     InductionGeneratorProperties,
     LoadProperties,
@@ -25,9 +26,11 @@ from pypsse.enumerations import (
     ModelProperties,
     ModelTypes,
     ProjectFolders,
+    PSSE_VERSIONS,
     SimulationModes,
     StationProperties,
     SubscriptionFileRequiredColumns,
+    SubsystemReadModes,
     SwitchedShuntProperties,
     TransformerProperties,
     UseModes,
@@ -55,6 +58,7 @@ class SimSettings(BaseModel):
     user_models: List[str] = []
     setup_files: List[str] = []
     simulation_mode: SimulationModes
+    subsystem_read_mode: SubsystemReadModes = SubsystemReadModes.LEGACY
 
     @model_validator(mode="after")
     def sim_res_smaller_than_sim_time(self):
@@ -157,6 +161,7 @@ class PublicationDefination(BaseModel):
     ]
     asset_type: ModelTypes = ModelTypes.BUSES
     asset_properties: List[ModelProperties] = [ModelProperties.FREQ, ModelProperties.PU]
+    vector: bool = False
 
 
 class HelicsSettings(BaseModel):
@@ -282,6 +287,30 @@ class MachineTrip(BaseModel):
     machine_id: str = ""
 
 
+class ProfileSettings(BaseModel):
+    "Profile manager settings"
+
+    cache_window_rows: int = Field(3600, ge=1)
+    cache_max_windows: int = Field(32, ge=1)
+    cache_prefetch: bool = False
+
+
+class UpdateSettings(BaseModel):
+    "Settings for writes of profile and co-simulation values to the PSS/E model"
+
+    coalesce: bool = True
+    absolute_deadband: float = Field(0.0, ge=0.0)
+    relative_deadband: float = Field(0.0, ge=0.0)
+
+
+class SnapshotSettings(BaseModel):
+    "Settings for named snapshots of the working case"
+
+    max_snapshots: int = Field(8, ge=1)
+    directory: Optional[Path] = None
+    capture_base_case: bool = False
+
+
 class SimulationSettings(BaseModel):
     "PyPSSE project settings"
 
@@ -294,6 +323,9 @@ class SimulationSettings(BaseModel):
     bus_subsystems: BusSubsystems = BusSubsystems()
     loads: LoadSettings = LoadSettings()
     generators: GeneratorSettings = GeneratorSettings()
+    profiles: ProfileSettings = ProfileSettings()
+    updates: UpdateSettings = UpdateSettings()
+    snapshots: SnapshotSettings = SnapshotSettings()
     contingencies: Optional[
         List[Union[BusFault, LineFault, LineTrip, BusTrip, MachineTrip]]
     ] = None
@@ -383,15 +415,30 @@ class ExportAssetTypes(BaseModel):
     machines: Optional[List[MachinesProperties]] = None
 
 
+class WriterBufferSettings(BaseModel):
+    "Buffering settings for streamed result writers"
+
+    rows: int = Field(100, ge=1)
+    flush_interval: Optional[timedelta] = None
+    flush_bytes: Optional[int] = Field(None, ge=1)
+    background_thread: bool = False
+    queue_size: int = Field(64, ge=1)
+
+
 class ExportFileOptions(ExportAssetTypes):
     "Export settings for a PyPSSE project"
 
     export_results_using_channels: bool = False
+    columnar_results: bool = False
     filename_prefix :str = ""
     defined_subsystems_only: bool = True
     file_format: ExportModes = ExportModes.H5
+    hdf5_layout: HDF5Layouts = HDF5Layouts.COLUMNS
+    parquet_dictionary_encoding: bool = False
+    csv_compression: bool = False
     channels: Optional[List[str]] = None
     channel_setup: Optional[List[channel_types]] = None
+    write_buffer: WriterBufferSettings = WriterBufferSettings()
 
 
 class ProjectDefination(BaseModel):
@@ -484,6 +531,25 @@ class ApiWebSocketRequest(BaseModel):
 class Contingencies(BaseModel):
     contingencies: List[Union[BusFault, BusTrip, LineFault, LineTrip, MachineTrip]]
 
+
+class ContingencyAnalysisSettings(BaseModel):
+    "Steady state contingency screening settings"
+
+    workers: int = Field(1, ge=1)
+    psse_module: str = "psspy"
+    psse_version: Optional[PSSE_VERSIONS] = PSSE_VERSIONS.PSSE35
+    voltage_min: float = 0.95
+    voltage_max: float = 1.05
+    loading_limit: float = 100.0
+    monitored_buses: List[int] = []
+    snapshot_directory: Optional[Path] = None
+    screening_threshold: Optional[float] = None
+    dyr_file: Optional[Path] = None
+    settings_file: Optional[Path] = None
+    cache_path: Optional[Path] = None
+    cache_max_size_mb: float = Field(512.0, gt=0)
+
+
 class ProfileMap(BaseModel):
     id: str 
     bus: str
@@ -4,9 +4,14 @@ import numpy as np
 from loguru import logger
 
 from pypsse.common import CASESTUDY_FOLDER, VALUE_UPDATE_BOUND
-from pypsse.enumerations import ModelTypes, WritableModelTypes
+from pypsse.enumerations import ModelTypes, SubsystemReadModes, WritableModelTypes
 from pypsse.models import ExportSettings, SimulationModes, SimulationSettings, ExportFileOptions
-from pypsse.modes.constants import converter
+from pypsse.modes.bulk_reader import BulkSubsystemReader
+from pypsse.modes.constants import RESULT_TYPES, STANDARD_FORMAT, converter
+from pypsse.modes.read_plan import ReadPlanCompiler
+from pypsse.modes.snapshots import SnapshotManager
+from pypsse.modes.update_filter import UpdateFilter
+from pypsse.parsers.element_index import ElementIndex
 
 
 class AbstractMode:
@@ -35,6 +40,8 @@ class AbstractMode:
         self.dyntools = dyntools
         self.settings = settings
         self.export_settings = export_settings
+        self.bulk_reader = BulkSubsystemReader(psse)
+        self.element_index = ElementIndex(psse, raw_data)
         self.func_options = {
             ModelTypes.BUSES.value: {
                 "busdat": ["BASE", "PU", "KV", "ANGLE", "ANGLED", "NVLMHI", "NVLMLO", "EVLMHI", "EVLMLO"],
@@ -256,6 +263,18 @@ class AbstractMode:
                 ],
             },
         }
+        self.read_plans = ReadPlanCompiler(psse, self.func_options, self.element_index)
+        self.update_filter = UpdateFilter(
+            absolute_deadband=settings.updates.absolute_deadband,
+            relative_deadband=settings.updates.relative_deadband,
+            enabled=settings.updates.coalesce,
+        )
+        self.snapshots = SnapshotManager(
+            psse,
+            max_snapshots=settings.snapshots.max_snapshots,
+            directory=settings.snapshots.directory,
+            dynamic=settings.simulation.simulation_mode in [SimulationModes.DYNAMIC, SimulationModes.SNAP],
+        )
         self.initialization_complete = False
 
     def save_model(self):
@@ -391,7 +410,7 @@ class AbstractMode:
     def get_a_list_of_buses_in_substation(self, sub_number, subsystem_buses):
         bus_numbers = []
         for b in subsystem_buses:
-            ierr, val = self.psse.busint(int(b), "STATION")
+            val = self.element_index.bus_station.get(int(b))
 
             if val == sub_number:
                 bus_numbers.append(int(b))
@@ -400,7 +419,7 @@ class AbstractMode:
     def get_a_list_of_nomkv_in_substation(self, sub_number, subsystem_buses):
         nom_kvs = []
         for b in subsystem_buses:
-            ierr, val = self.psse.busint(int(b), "STATION")
+            val = self.element_index.bus_station.get(int(b))
 
             if val == sub_number:
                 ierr, val = self.psse.busdat(int(b), "BASE")
@@ -411,25 +430,20 @@ class AbstractMode:
     def get_a_loadmw_in_substation(self, sub_number, subsystem_buses):
         load_mw = 0
         for b in subsystem_buses:
-            ierr, val = self.psse.busint(int(b), "STATION")
+            val = self.element_index.bus_station.get(int(b))
 
             if val == sub_number:
-                ierr = self.psse.inilod(int(b))
-
-                ierr, load_id = self.psse.nxtlod(int(b))
-
-                while ierr == 0:
+                for load_id in self.element_index.loads.get(int(b), []):
                     ierr, val = self.psse.loddt2(int(b), load_id, "TOTAL", "ACT")
                     if isinstance(val, complex):
                         load_mw += val.real
-                    ierr, load_id = self.psse.nxtlod(int(b))
 
         return load_mw
 
     def get_a_genmw_in_substation(self, sub_number, subsystem_buses):
         gen_mw = 0
         for b in subsystem_buses:
-            ierr, val = self.psse.busint(int(b), "STATION")
+            val = self.element_index.bus_station.get(int(b))
 
             if val == sub_number:
                 ierr, val = self.psse.gendat(int(b))
@@ -441,56 +455,42 @@ class AbstractMode:
     def get_a_list_of_generators_in_substation(self, sub_number, subsystem_buses):
         generators = []
         for b in subsystem_buses:
-            ierr, val = self.psse.busint(int(b), "STATION")
+            val = self.element_index.bus_station.get(int(b))
 
             if val == sub_number:
-                ierr = self.psse.inimac(int(b))
-
-                ierr, mach_id = self.psse.nxtmac(int(b))
-
-                while ierr == 0:
-                    gen_name = f"{b}_{mach_id}"
-                    ierr, mach_id = self.psse.nxtmac(int(b))
-
-                    generators.append(gen_name)
+                for mach_id in self.element_index.machines.get(int(b), []):
+                    generators.append(f"{b}_{mach_id}")
 
         return list(set(generators))
 
     def get_a_list_of_transformers_in_substation(self, sub_number, subsystem_buses):
         transformers = []
         for b in subsystem_buses:
-            ierr, val = self.psse.busint(int(b), "STATION")
+            val = self.element_index.bus_station.get(int(b))
 
             if val == sub_number:
                 # Get two winding transformers
-                ierr = self.psse.inibrx(int(b), 1)
-
-                ierr, b1, ickt = self.psse.nxtbrn(int(b))
-
-                ickt_string = str(ickt)
-                while ierr == 0:
-                    ierr, val = self.psse.xfrdat(int(b), int(b1), ickt, "RATIO")
-
-                    if ierr == 0:
-                        t_name = f"{b}_{b1}_{ickt_string}"
-                        transformers.append(t_name)
-                    ierr, b1, ickt = self.psse.nxtbrn(int(b))
+                for b1, ickt in self.element_index.two_winding_transformers.get(int(b), []):
+                    transformers.append(f"{b}_{b1}_{ickt!s}")
 
                 # Get three winding transformers
-                ierr = self.psse.inibrx(int(b), 1)
-
-                ierr, b1, b2, ickt = self.psse.nxtbrn3(int(b))
+                for b1, b2, ickt in self.element_index.three_winding_transformers.get(int(b), []):
+                    transformers.append(f"{b!s}_{b1!s}_{b2!s}_{ickt!s}")
 
-                ickt_string = str(ickt)
-                while ierr == 0:
-                    ierr, val = self.psse.tr3dt2(int(b), int(b1), int(b2), ickt, "Z01")
+        return list(set(transformers))
 
-                    if ierr == 0:
-                        t_name = f"{b!s}_{b1!s}_{b2!s}_{ickt_string}"
-                        transformers.append(t_name)
-                    ierr, b1, b2, ickt = self.psse.nxtbrn3(int(b))
+    def refresh_element_index(self):
+        """Rebuilds the bus to element index. Should be called after elements are added or purged"""
+        self.element_index.refresh()
+        self.read_plans.clear()
+        self.update_filter.clear()
+        self.raw_data = self.element_index.raw_data
+        logger.debug("Element index refreshed")
 
-        return list(set(transformers))
+    def restore_snapshot(self, name: str):
+        """Resets the working case to a snapshot and rebuilds the element index"""
+        self.snapshots.restore(name)
+        self.refresh_element_index()
 
     def check_for_loadbus(self, b):
         ierr = self.psse.inilod(int(b))
@@ -502,23 +502,62 @@ class AbstractMode:
 
         return 0
 
+    def get_result_types(self, quantities: dict) -> dict:
+        """returns the value type ('real', 'int', 'cplx' or 'char') of each result key read by 'read_subsystems'
+
+        Args:
+            quantities (dict): mapping of class names to lists of properties
+
+        Returns:
+            dict: mapping of 'Class_VARIABLE' keys to value types, keys of unknown type are omitted
+        """
+
+        types = {}
+        for class_name, var_list in quantities.items():
+            funcs = self.func_options.get(class_name, {})
+            for v in var_list:
+                key = f"{class_name}_{v}"
+                conversion = STANDARD_FORMAT.get(class_name, {}).get(v)
+                if v.lower() == "status":
+                    types[key] = "char"  # translated to 'connected' / 'notconnected'
+                    continue
+                if conversion is not None and len(conversion) > 1:
+                    types[key] = "real"  # complex values reduced to their real or imaginary part
+                    continue
+                name = conversion[0] if conversion is not None else v
+                for func_name, properties in funcs.items():
+                    if name in properties and func_name in RESULT_TYPES:
+                        types[key] = RESULT_TYPES[func_name]
+                        break
+        return types
+
     @converter
-    def read_subsystems(self, quantities, subsystem_buses, ext_string2_info=None, mapping_dict=None):
+    def read_subsystems(self, quantities, subsystem_buses, ext_string2_info=None, mapping_dict=None, results=None):
         if ext_string2_info is None:
             ext_string2_info = {}
         if mapping_dict is None:
             mapping_dict = {}
+        if results is None:
+            results = {}
 
-        results = {}
-        area_numbers = self.get_area_numbers(subsystem_buses)
-        zone_numbers = self.get_zone_numbers(subsystem_buses)
-        dctr_lines = self.get_dctr_line_names(subsystem_buses)
-        substation_numbers = self.get_substation_numbers(subsystem_buses)
+        bulk_vars = {}
+        if self.settings.simulation.subsystem_read_mode == SubsystemReadModes.BULK:
+            results, bulk_vars = self.bulk_reader.read(quantities, subsystem_buses, mapping_dict, results)
+
+        plan = self.read_plans.get(quantities, subsystem_buses, ext_string2_info, mapping_dict, bulk_vars)
+        results = plan.execute(results)
+
+        area_numbers = self.element_index.get_areas(subsystem_buses)
+        zone_numbers = self.element_index.get_zones(subsystem_buses)
+        dctr_lines = self.element_index.get_dc_line_names(subsystem_buses)
+        substation_numbers = self.element_index.get_stations(subsystem_buses)
 
         for class_name, var_list in quantities.items():
             if class_name in self.func_options:
                 funcs = self.func_options[class_name]
                 for id_, v in enumerate(var_list):
+                    if v in bulk_vars.get(class_name, []) or v in plan.compiled.get(class_name, []):
+                        continue
                     for func_name, settinsgs in funcs.items():
                         if v in settinsgs:
                             q = f"{class_name}_{v}"
@@ -660,30 +699,20 @@ class AbstractMode:
                                         results = self.add_result(results, q, val, b)
 
                                     elif func_name in ["inddt1", "inddt2", "indnofunc"]:
-                                        ierr = self.psse.iniind(int(b))
-                                        if ierr:
-                                            logger.info("No induction machine in the model")
-                                        else:
-                                            ierr, ind_id = self.psse.nxtind(int(b))
-                                            while ind_id is not None:
-                                                if func_name == "indnofunc":
-                                                    if v in ["BUSNUM", "INDID"]:
-                                                        val = {"INDID": ind_id, "BUSNUM": int(b)}[v]
-                                                        results = self.add_result(results, q, val, f"{b}_{ind_id}")
-                                                    elif v == "BUSNAME":
-                                                        irr, val = self.psse.notona(int(b))
-                                                        results = self.add_result(results, q, val, f"{b}_{ind_id}")
-                                                else:
-                                                    ierr, val = getattr(self.psse, func_name)(int(b), ind_id, v)
+                                        for ind_id in self.element_index.induction_machines.get(int(b), []):
+                                            if func_name == "indnofunc":
+                                                if v in ["BUSNUM", "INDID"]:
+                                                    val = {"INDID": ind_id, "BUSNUM": int(b)}[v]
+                                                    results = self.add_result(results, q, val, f"{b}_{ind_id}")
+                                                elif v == "BUSNAME":
+                                                    irr, val = self.psse.notona(int(b))
                                                     results = self.add_result(results, q, val, f"{b}_{ind_id}")
-                                                ierr, ind_id = self.psse.nxtind(int(b))
+                                            else:
+                                                ierr, val = getattr(self.psse, func_name)(int(b), ind_id, v)
+                                                results = self.add_result(results, q, val, f"{b}_{ind_id}")
 
                                     elif func_name in ["loddt2", "lodnofunc", "lodint"]:
-                                        ierr = self.psse.inilod(int(b))
-
-                                        ierr, load_id = self.psse.nxtlod(int(b))
-
-                                        while load_id is not None:
+                                        for load_id in self.element_index.loads.get(int(b), []):
                                             if func_name == "lodnofunc":
                                                 if v in ["BUSNUM", "LOADID"]:
                                                     val = {"LOADID": load_id, "BUSNUM": int(b)}[v]
@@ -700,12 +729,8 @@ class AbstractMode:
 
                                                 results = self.add_result(results, q, val, f"{b}_{load_id}")
 
-                                            ierr, load_id = self.psse.nxtlod(int(b))
-
                                     elif func_name in ["macdat", "macdt2", "macnofunc", "macint"]:
-                                        ierr = self.psse.inimac(int(b))
-                                        ierr, mach_id = self.psse.nxtmac(int(b))
-                                        while mach_id is not None:
+                                        for mach_id in self.element_index.machines.get(int(b), []):
                                             if func_name == "macnofunc":
                                                 if v in ["BUSNUM", "MACID"]:
                                                     val = {"BUSNUM": int(b), "MACID": mach_id}[v]
@@ -735,14 +760,9 @@ class AbstractMode:
                                                 ierr, val = getattr(self.psse, func_name)(int(b), mach_id, v)
 
                                                 results = self.add_result(results, q, val, f"{b}_{mach_id}")
-                                            ierr, mach_id = self.psse.nxtmac(int(b))
 
                                     elif func_name in ["fxsdt2", "fxsnofunc"]:
-                                        ierr = self.psse.inifxs(int(b))
-
-                                        ierr, fx_id = self.psse.nxtfxs(int(b))
-
-                                        while fx_id is not None:
+                                        for fx_id in self.element_index.fixed_shunts.get(int(b), []):
                                             if func_name == "fxsnofunc":
                                                 if v in ["BUSNUM", "FXSHID"]:
                                                     val = {"BUSNUM": int(b), "FXSHID": fx_id}[v]
@@ -755,7 +775,6 @@ class AbstractMode:
                                                 ierr, val = getattr(self.psse, func_name)(int(b), fx_id, v)
 
                                                 results = self.add_result(results, q, val, f"{b}_{fx_id}")
-                                            ierr, fx_id = self.psse.nxtfxs(int(b))
 
                                     elif func_name in ["swsdt1", "swsnofunc"]:
                                         if func_name == "swsnofunc":
@@ -774,12 +793,8 @@ class AbstractMode:
                                             results = self.add_result(results, q, val, b)
 
                                     elif func_name in ["brndat", "brndt2", "brnmsc", "brnint", "brnnofunc"]:
-                                        ierr = self.psse.inibrx(int(b), 1)
-
-                                        ierr, b1, ickt = self.psse.nxtbrn(int(b))
-
-                                        ickt_string = str(ickt)
-                                        while ierr == 0:
+                                        for b1, ickt in self.element_index.branches.get(int(b), []):
+                                            ickt_string = str(ickt)
                                             if func_name == "brnnofunc":
                                                 if v in ["FROMBUSNUM", "TOBUSNUM", "CIRCUIT"]:
                                                     val = {
@@ -841,15 +856,10 @@ class AbstractMode:
                                                     results = self.add_result(
                                                         results, q, val, f"{b!s}_{b1!s}_{ickt_string}"
                                                     )
-                                            ierr, b1, ickt = self.psse.nxtbrn(int(b))
 
                                     elif func_name in ["xfrdat", "tr3dt2", "trfnofunc"]:
-                                        ierr = self.psse.inibrx(int(b), 1)
-
-                                        ierr, b1, ickt = self.psse.nxtbrn(int(b))
-
-                                        ickt_string = str(ickt)
-                                        while ierr == 0:
+                                        for b1, ickt in self.element_index.two_winding_transformers.get(int(b), []):
+                                            ickt_string = str(ickt)
                                             if func_name == "xfrdat":
                                                 ierr, val = getattr(self.psse, func_name)(int(b), int(b1), ickt, v)
 
@@ -890,14 +900,9 @@ class AbstractMode:
                                                             f"{b!s}_{b1!s}_{ickt_string}",
                                                         )
 
-                                            ierr, b1, ickt = self.psse.nxtbrn(int(b))
-
-                                        ierr = self.psse.inibrx(int(b), 1)
-
-                                        ierr, b1, b2, ickt = self.psse.nxtbrn3(int(b))
-
-                                        ickt_string = str(ickt)
-                                        while ierr == 0:
+                                        three_winding_transformers = self.element_index.three_winding_transformers
+                                        for b1, b2, ickt in three_winding_transformers.get(int(b), []):
+                                            ickt_string = str(ickt)
                                             if func_name == "tr3dt2":
                                                 ierr, val = getattr(self.psse, func_name)(
                                                     int(b), int(b1), int(b2), ickt, v
@@ -957,19 +962,11 @@ class AbstractMode:
                                                             val,
                                                             f"{b!s}_{b1!s}_{ickt_string}",
                                                         )
-                                            ierr, b1, b2, ickt = self.psse.nxtbrn3(int(b))
 
         return results
 
     def add_result(self, results_dict, class_name, value, label):
-        if value or value == 0:
-            if class_name not in results_dict:
-                results_dict[class_name] = {}
-            results_dict[class_name][label] = value
-        else:
-            if class_name not in results_dict:
-                results_dict[class_name] = {}
-            results_dict[class_name][label] = None
+        results_dict.setdefault(class_name, {})[label] = value if value or value == 0 else None
         return results_dict
 
     def convert_load(self, bus_subsystem=None):
@@ -987,24 +984,93 @@ class AbstractMode:
                 self.psse.conl(0, 1, 2, [0, 0], [p1, p2, q1, q2])  # convert loads.
                 self.psse.conl(0, 1, 3, [0, 0], [p1, p2, q1, q2])  # postprocessing housekeeping.
 
+    def get_update_function(self, dtype: str):
+        """returns a function that writes values to an element of a writable model type
+
+        Args:
+            dtype (str): writable model type
+
+        Returns:
+            function: f(bus, element_id, values) -> ierr, None for model types that can not be updated
+        """
+
+        if dtype == WritableModelTypes.LOAD.value:
+            return lambda bus, element_id, values: self.psse.load_chng_5(ibus=bus, id=element_id, **values)
+        elif dtype == WritableModelTypes.GENERATOR.value:
+            return lambda bus, element_id, values: self.psse.induction_machine_data(ibus=bus, id=element_id, **values)
+        elif dtype == WritableModelTypes.MACHINE.value:
+            return lambda bus, element_id, values: self.psse.machine_data_2(i=bus, id=element_id, **values)
+        elif dtype == WritableModelTypes.PLANT.value:
+            return lambda bus, element_id, values: self.psse.plant_data_4(ibus=bus, inode=element_id, **values)
+        return None
+
     def update_object(self, dtype, bus, element_id, values: dict):
         val = sum(list(values.values()))
         if val > -VALUE_UPDATE_BOUND and val < VALUE_UPDATE_BOUND:
-            if dtype == WritableModelTypes.LOAD.value:
-                ierr = self.psse.load_chng_5(ibus=int(bus), id=element_id, **values)
-            elif dtype == WritableModelTypes.GENERATOR.value:
-                ierr = self.psse.induction_machine_data(ibus=int(bus), id=element_id, **values)
-            elif dtype == WritableModelTypes.MACHINE.value:
-                ierr = self.psse.machine_data_2(i=int(bus), id=element_id, **values)
-            elif dtype == WritableModelTypes.PLANT.value:
-                ierr = self.psse.plant_data_4(ibus=int(bus), inode=element_id, **values)
-            else:
-                ierr = 1
+            values = self.update_filter.filter(dtype, bus, element_id, values)
+            if not values:
+                return
 
+            func = self.get_update_function(dtype)
+            ierr = func(int(bus), element_id, values) if func else 1
             if ierr == 0:
-                logger.info(f"Profile Manager: {dtype} '{element_id}' on bus '{bus}' has been updated. {values}")
+                self.update_filter.commit(dtype, bus, element_id, values)
+                logger.debug(f"Profile Manager: {dtype} '{element_id}' on bus '{bus}' has been updated. {values}")
             else:
                 logger.error(f"Profile Manager: Error updating {dtype} '{element_id}' on bus '{bus}'.")
 
+    def update_objects(self, dtypes, buses, element_ids, keys: list, values: np.ndarray) -> np.ndarray:
+        """updates a table of elements, one row per element
+
+        Bounds are checked for all rows at once and writes are grouped by model type. Values set to NaN are
+        not written.
+
+        Args:
+            dtypes (array): writable model type for each row
+            buses (array): bus number for each row
+            element_ids (array): element id for each row
+            keys (list): realar keys (value columns)
+            values (np.ndarray): values (rows, keys)
+
+        Returns:
+            np.ndarray: error code for each row. 0 if written or unchanged, -1 if the values are out of bounds
+            (or not set) and the PSS/E error code otherwise
+        """
+
+        dtypes = np.asarray(dtypes, dtype=object)
+        buses = np.asarray(buses, dtype=int)
+        element_ids = np.asarray(element_ids, dtype=object)
+        values = np.asarray(values, dtype=np.float64).reshape(len(dtypes), len(keys))
+
+        is_set = ~np.isnan(values)
+        totals = np.where(is_set, values, 0.0).sum(axis=1)
+        valid = is_set.any(axis=1) & (totals > -VALUE_UPDATE_BOUND) & (totals < VALUE_UPDATE_BOUND)
+        errors = np.full(len(dtypes), -1, dtype=int)
+
+        for dtype in set(dtypes[valid]):
+            rows = np.flatnonzero(valid & (dtypes == dtype))
+            func = self.get_update_function(dtype)
+            if func is None:
+                errors[rows] = 1
+                logger.error(f"Profile Manager: {dtype} is not a writable model type.")
+                continue
+
+            for r in rows:
+                bus = int(buses[r])
+                element_id = element_ids[r]
+                row = {k: v for k, v, s in zip(keys, values[r].tolist(), is_set[r]) if s}
+                row = self.update_filter.filter(dtype, bus, element_id, row)
+                if not row:
+                    errors[r] = 0
+                    continue
+                errors[r] = func(bus, element_id, row)
+                if errors[r] == 0:
+                    self.update_filter.commit(dtype, bus, element_id, row)
+                else:
+                    logger.error(f"Profile Manager: Error updating {dtype} '{element_id}' on bus '{bus}'.")
+
+        logger.debug(f"Profile Manager: {int((errors == 0).sum())} of {len(errors)} elements updated")
+        return errors
+
     def has_converged(self):
         return self.psse.solved()
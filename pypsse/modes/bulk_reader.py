@@ -0,0 +1,134 @@
+"Subsystem result reader built on the PSSE subsystem array API"
+
+from loguru import logger
+
+from pypsse.modes.constants import BULK_READ_OPTIONS
+
+
+class BulkSubsystemReader:
+    """Reads subsystem results one column at a time using the PSSE array API (abusreal, aloadcplx, amachreal ...).
+
+    Results are returned in the same shape as 'AbstractMode.read_subsystems' so both engines are interchangeable.
+    Quantities without an array API equivalent are left for the per-element reader.
+    """
+
+    def __init__(self, psse: object):
+        """creates the bulk subsystem reader
+
+        Args:
+            psse (object): simulator instance
+        """
+        self.psse = psse
+
+    def supported_properties(self, quantities: dict) -> dict:
+        """returns the subset of quantities that can be read using the array API
+
+        Args:
+            quantities (dict): mapping of class names to lists of properties
+
+        Returns:
+            dict: mapping of class names to lists of supported properties
+        """
+
+        supported = {}
+        for class_name, var_list in quantities.items():
+            if class_name in BULK_READ_OPTIONS:
+                properties = BULK_READ_OPTIONS[class_name]["properties"]
+                valid_vars = [v for v in var_list if v in properties]
+                if valid_vars:
+                    supported[class_name] = valid_vars
+        return supported
+
+    def read(
+        self, quantities: dict, subsystem_buses: list, mapping_dict: dict = None, results: dict = None
+    ) -> (dict, dict):
+        """reads all supported quantities for elements connected to the subsystem buses
+
+        Args:
+            quantities (dict): mapping of class names to lists of properties
+            subsystem_buses (list): list of bus numbers in the subsystem
+            mapping_dict (dict, optional): mapping of class names to user facing property names. Defaults to None.
+            results (dict, optional): results to update (a dictionary or 'ResultFrame'). Defaults to None.
+
+        Returns:
+            dict: simulation results
+            dict: mapping of class names to properties read by this engine
+        """
+
+        if mapping_dict is None:
+            mapping_dict = {}
+
+        bus_labels = {int(b): b for b in subsystem_buses}
+        supported = self.supported_properties(quantities)
+        if results is None:
+            results = {}
+        for class_name, valid_vars in supported.items():
+            options = BULK_READ_OPTIONS[class_name]
+            columns = {}
+            for v in valid_vars:
+                tail, string = options["properties"][v]
+                columns.setdefault(tail, [])
+                if string not in columns[tail]:
+                    columns[tail].append(string)
+            for tail, string in options["keys"]:
+                columns.setdefault(tail, [])
+                if string not in columns[tail]:
+                    columns[tail].append(string)
+
+            data = {}
+            for tail, strings in columns.items():
+                arrays = self.get_columns(options["api"], tail, options["flag"], strings, options.get("entry"))
+                data.update({(tail, s): a for s, a in zip(strings, arrays)})
+
+            keys = [data[key] for key in options["keys"]]
+            labels = []
+            rows = []
+            for i, key_values in enumerate(zip(*keys)):
+                bus = int(key_values[0])
+                if bus not in bus_labels:
+                    continue
+                rows.append(i)
+                if len(key_values) == 1:
+                    labels.append(bus_labels[bus])
+                else:
+                    labels.append("_".join(str(x) for x in key_values))
+
+            for id_, v in enumerate(quantities[class_name]):
+                if v not in valid_vars:
+                    continue
+                q = f"{class_name}_{v}"
+                if class_name in mapping_dict:
+                    q = f"{class_name}_{mapping_dict[class_name][id_]}"
+                column = data[options["properties"][v]]
+                values = results.setdefault(q, {})
+                for label, i in zip(labels, rows):
+                    val = column[i]
+                    values[label] = val if val or val == 0 else None
+        return results, supported
+
+    def get_columns(self, api: str, tail: str, flag: int, strings: list, entry: int = None) -> list:
+        """returns one array per requested string from a PSSE subsystem array function
+
+        Args:
+            api (str): array API prefix e.g. 'abus'
+            tail (str): data type tail e.g. 'real', 'int', 'cplx', 'char'
+            flag (int): element filter flag passed to PSSE
+            strings (list): list of quantities to read
+            entry (int, optional): branch entry flag passed to PSSE (2 returns each branch from both ends).
+                Defaults to None.
+
+        Raises:
+            RuntimeError: raised if PSSE returns an error code
+
+        Returns:
+            list: list of arrays, one per requested string
+        """
+
+        func_name = f"{api}{tail}"
+        kwargs = {} if entry is None else {"entry": entry}
+        ierr, arrays = getattr(self.psse, func_name)(sid=-1, flag=flag, string=strings, **kwargs)
+        if ierr:
+            msg = f"Error code {ierr}, while running function '{func_name}'"
+            raise RuntimeError(msg)
+        logger.debug(f"{func_name} read {strings}")
+        return arrays
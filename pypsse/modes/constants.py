@@ -18,6 +18,215 @@ dyn_only_options = {
     },
 }
 
+BULK_READ_OPTIONS = {
+    "Buses": {
+        "api": "abus",
+        "flag": 2,
+        "keys": [("int", "NUMBER")],
+        "properties": {
+            "BASE": ("real", "BASE"),
+            "PU": ("real", "PU"),
+            "KV": ("real", "KV"),
+            "ANGLE": ("real", "ANGLE"),
+            "ANGLED": ("real", "ANGLED"),
+            "NVLMHI": ("real", "NVLMHI"),
+            "NVLMLO": ("real", "NVLMLO"),
+            "EVLMHI": ("real", "EVLMHI"),
+            "EVLMLO": ("real", "EVLMLO"),
+            "TYPE": ("int", "TYPE"),
+            "AREA": ("int", "AREA"),
+            "ZONE": ("int", "ZONE"),
+            "OWNER": ("int", "OWNER"),
+            "DUMMY": ("int", "DUMMY"),
+            "NUMBER": ("int", "NUMBER"),
+        },
+    },
+    "Loads": {
+        "api": "aload",
+        "flag": 4,
+        "keys": [("int", "NUMBER"), ("char", "ID")],
+        "properties": {
+            "MVA": ("cplx", "MVAACT"),
+            "IL": ("cplx", "ILACT"),
+            "YL": ("cplx", "YLACT"),
+            "TOTAL": ("cplx", "TOTALACT"),
+            "YNEG": ("cplx", "YNEG"),
+            "YZERO": ("cplx", "YZERO"),
+            "STATUS": ("int", "STATUS"),
+            "AREA": ("int", "AREA"),
+            "ZONE": ("int", "ZONE"),
+            "OWNER": ("int", "OWNER"),
+            "SCALE": ("int", "SCALE"),
+            "LOADID": ("char", "ID"),
+            "BUSNUM": ("int", "NUMBER"),
+        },
+    },
+    "Machines": {
+        "api": "amach",
+        "flag": 4,
+        "keys": [("int", "NUMBER"), ("char", "ID")],
+        "properties": {
+            "QMAX": ("real", "QMAX"),
+            "QMIN": ("real", "QMIN"),
+            "PMAX": ("real", "PMAX"),
+            "PMIN": ("real", "PMIN"),
+            "MBASE": ("real", "MBASE"),
+            "MVA": ("real", "MVA"),
+            "P": ("real", "PGEN"),
+            "Q": ("real", "QGEN"),
+            "PERCENT": ("real", "PERCENT"),
+            "GENTAP": ("real", "GENTAP"),
+            "VSCHED": ("real", "VSCHED"),
+            "WPF": ("real", "WPF"),
+            "RMPCT": ("real", "RMPCT"),
+            "XSUBTR": ("real", "XSUBTR"),
+            "XTRANS": ("real", "XTRANS"),
+            "XSYNCH": ("real", "XSYNCH"),
+            "PQ": ("cplx", "PQGEN"),
+            "STATUS": ("int", "STATUS"),
+            "IREG": ("int", "IREG"),
+            "NREG": ("int", "NREG"),
+            "OWNERS": ("int", "OWNERS"),
+            "WMOD": ("int", "WMOD"),
+            "MACID": ("char", "ID"),
+            "BUSNUM": ("int", "NUMBER"),
+        },
+    },
+    "Induction_generators": {
+        "api": "aindmac",
+        "flag": 4,
+        "keys": [("int", "NUMBER"), ("char", "ID")],
+        "properties": {
+            "MBASE": ("real", "MBASE"),
+            "RATEKV": ("real", "RATEKV"),
+            "PSET": ("real", "PSET"),
+            "H": ("real", "H"),
+            "RA": ("real", "RA"),
+            "XA": ("real", "XA"),
+            "R1": ("real", "R1"),
+            "X1": ("real", "X1"),
+            "R2": ("real", "R2"),
+            "X2": ("real", "X2"),
+            "X3": ("real", "X3"),
+            "E1": ("real", "E1"),
+            "SE1": ("real", "SE1"),
+            "E2": ("real", "E2"),
+            "SE2": ("real", "SE2"),
+            "IA1": ("real", "IA1"),
+            "IA2": ("real", "IA2"),
+            "XAMULT": ("real", "XAMULT"),
+            "P": ("real", "P"),
+            "O_P": ("real", "O_P"),
+            "Q": ("real", "Q"),
+            "O_Q": ("real", "O_Q"),
+            "MVA": ("real", "MVA"),
+            "O_MVA": ("real", "O_MVA"),
+            "SLIP": ("real", "SLIP"),
+            "ZA": ("cplx", "ZA"),
+            "Z1": ("cplx", "Z1"),
+            "Z2": ("cplx", "Z2"),
+            "ZZERO": ("cplx", "ZZERO"),
+            "ZGRND": ("cplx", "ZGRND"),
+            "PQ": ("cplx", "PQ"),
+            "O_PQ": ("cplx", "O_PQ"),
+            "INDID": ("char", "ID"),
+            "BUSNUM": ("int", "NUMBER"),
+        },
+    },
+    "Fixed_shunts": {
+        "api": "afxshunt",
+        "flag": 4,
+        "keys": [("int", "NUMBER"), ("char", "ID")],
+        "properties": {
+            "ACT": ("cplx", "SHUNTACT"),
+            "O_ACT": ("cplx", "O_SHUNTACT"),
+            "NOM": ("cplx", "SHUNTNOM"),
+            "O_NOM": ("cplx", "O_SHUNTNOM"),
+            "FXSHID": ("char", "ID"),
+            "BUSNUM": ("int", "NUMBER"),
+        },
+    },
+    "Switched_shunts": {
+        "api": "aswsh",
+        "flag": 4,
+        "keys": [("int", "NUMBER")],
+        "properties": {
+            "VSWHI": ("real", "VSWHI"),
+            "VSWLO": ("real", "VSWLO"),
+            "RMPCT": ("real", "RMPCT"),
+            "BINIT": ("real", "BINIT"),
+            "O_BINIT": ("real", "O_BINIT"),
+            "BUSNUM": ("int", "NUMBER"),
+        },
+    },
+    "Branches": {
+        "api": "abrn",
+        "flag": 4,
+        # every branch is returned once from each end (FROMNUMBER is the near end), as 'nxtbrn' does
+        "entry": 2,
+        "keys": [("int", "FROMNUMBER"), ("int", "TONUMBER"), ("char", "ID")],
+        "properties": {
+            "RATEA": ("real", "RATEA"),
+            "RATEB": ("real", "RATEB"),
+            "RATEC": ("real", "RATEC"),
+            "LENGTH": ("real", "LENGTH"),
+            "CHARG": ("real", "CHARGING"),
+            "MVA": ("real", "MVA"),
+            "AMPS": ("real", "AMPS"),
+            "PUCUR": ("real", "PUCUR"),
+            "P": ("real", "P"),
+            "Q": ("real", "Q"),
+            "PLOS": ("real", "PLOSS"),
+            "QLOS": ("real", "QLOSS"),
+            "PCTRTA": ("real", "PCTRATEA"),
+            "RX": ("cplx", "RX"),
+            "STATUS": ("int", "STATUS"),
+            "METER": ("int", "METERNUMBER"),
+            "NMETR": ("int", "NMETERNUMBER"),
+            "OWNERS": ("int", "OWNERS"),
+            "OWN1": ("int", "OWN1"),
+            "OWN2": ("int", "OWN2"),
+            "OWN3": ("int", "OWN3"),
+            "OWN4": ("int", "OWN4"),
+            "FROMBUSNUM": ("int", "FROMNUMBER"),
+            "TOBUSNUM": ("int", "TONUMBER"),
+            "CIRCUIT": ("char", "ID"),
+        },
+    },
+}
+
+# value type returned by the PSSE getters used in 'read_subsystems' (used to size result datasets), getters that
+# return mixed types ('*nofunc') are not listed
+RESULT_TYPES = {
+    "busdat": "real",
+    "busdt2": "cplx",
+    "busint": "int",
+    "busexs": "int",
+    "notona": "char",
+    "arenam": "char",
+    "stadat": "real",
+    "gendat": "cplx",
+    "frequency": "real",
+    "ardat": "cplx",
+    "zndat": "cplx",
+    "dc2int_2": "int",
+    "brndat": "real",
+    "brndt2": "cplx",
+    "brnmsc": "real",
+    "brnint": "int",
+    "inddt1": "real",
+    "inddt2": "cplx",
+    "loddt2": "cplx",
+    "lodint": "int",
+    "macdat": "real",
+    "macdt2": "cplx",
+    "macint": "int",
+    "fxsdt2": "cplx",
+    "swsdt1": "real",
+    "xfrdat": "real",
+    "tr3dt2": "cplx",
+}
+
 DYNAMIC_ONLY_PPTY = {
     "Loads": {
         "FmA": ["FmA"],
@@ -165,7 +165,7 @@ class Dynamic(AbstractMode, DynamicUtils):
         return self.settings.simulation.simulation_step_resolution.total_seconds()
 
     @converter
-    def read_subsystems(self, quantities, subsystem_buses, ext_string2_info=None, mapping_dict=None):
+    def read_subsystems(self, quantities, subsystem_buses, ext_string2_info=None, mapping_dict=None, results=None):
         "Queries the result container for current results"
 
         if ext_string2_info is None:
@@ -173,7 +173,7 @@ class Dynamic(AbstractMode, DynamicUtils):
         if mapping_dict is None:
             mapping_dict = {}
         results = super().read_subsystems(
-            quantities, subsystem_buses, mapping_dict=mapping_dict, ext_string2_info=ext_string2_info
+            quantities, subsystem_buses, mapping_dict=mapping_dict, ext_string2_info=ext_string2_info, results=results
         )
 
         poll_results = self.poll_channels()
@@ -187,11 +187,9 @@ class Dynamic(AbstractMode, DynamicUtils):
                                 con_ind = dyn_only_options[class_name][func_name][v]
                                 for bus in subsystem_buses:
                                     if class_name == "Loads":
-                                        ierr = self.psse.inilod(int(bus))
-
-                                        ierr, ld_id = self.psse.nxtlod(int(bus))
-
-                                        if ld_id is not None:
+                                        ld_ids = self.element_index.loads.get(int(bus), [])
+                                        if ld_ids:
+                                            ld_id = ld_ids[0]
                                             ierr, con_index = getattr(self.psse, func_name)(
                                                 int(bus), ld_id, "CHARAC", "CON"
                                             )
@@ -201,10 +199,8 @@ class Dynamic(AbstractMode, DynamicUtils):
                                                 ierr, value = self.psse.dsrval("CON", act_con_index)
 
                                                 res_base = f"{class_name}_{v}"
-                                                if res_base not in results:
-                                                    results[res_base] = {}
                                                 obj_name = f"{bus}_{ld_id}"
-                                                results[res_base][obj_name] = value
+                                                results.setdefault(res_base, {})[obj_name] = value
             else:
                 logger.warning("Extend function 'read_subsystems' in the Dynamic class (Dynamic.py)")
         return results
@@ -0,0 +1,257 @@
+"Compiled read plans for 'AbstractMode.read_subsystems'"
+
+from collections import OrderedDict
+
+from loguru import logger
+
+from pypsse.enumerations import ModelTypes
+from pypsse.parsers.element_index import ElementIndex
+
+PLAN_FUNCTIONS = {
+    "busdat": "bus",
+    "busint": "bus",
+    "busdt2": "bus",
+    "notona": "bus",
+    "gendat": "bus",
+    "loddt2": "loads",
+    "lodint": "loads",
+    "macdat": "machines",
+    "macdt2": "machines",
+    "macint": "machines",
+    "fxsdt2": "fixed_shunts",
+    "inddt1": "induction_machines",
+    "inddt2": "induction_machines",
+    "swsdt1": "switched_shunts",
+    "brndat": "branches",
+    "brndt2": "branches",
+    "brnmsc": "branches",
+    "brnint": "branches",
+    "xfrdat": "two_winding_transformers",
+    "tr3dt2": "three_winding_transformers",
+    "dc2int_2": "dc_lines",
+}
+
+
+class ReadPlan:
+    """Flat list of prebound PSSE calls and result slots for one set of quantities and subsystem buses.
+
+    Each step is a tuple of (bound psse function, arguments, result key, element label, check error code).
+    """
+
+    def __init__(self, steps: list, compiled: dict):
+        """creates a read plan
+
+        Args:
+            steps (list): list of read steps
+            compiled (dict): mapping of class names to properties covered by the plan
+        """
+        self.steps = steps
+        self.compiled = compiled
+
+    def execute(self, results: dict = None) -> dict:
+        """runs all steps in the plan
+
+        Args:
+            results (dict, optional): results to update. Defaults to None.
+
+        Returns:
+            dict: simulation results
+        """
+
+        if results is None:
+            results = {}
+        for func, args, key, label, check_ierr in self.steps:
+            ierr, val = func(*args)
+            if check_ierr and ierr != 0:
+                continue
+            results.setdefault(key, {})[label] = val if val or val == 0 else None
+        return results
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+
+class ReadPlanCompiler:
+    """Compiles 'quantities' and subsystem buses into read plans using the mode function table.
+
+    Only properties that map to a plain PSSE getter are compiled. Derived properties (names, substation lists,
+    frequency channels ...) are left for the per-element reader. Plans are cached by quantities and subsystem buses
+    in a bounded LRU cache and have to be cleared when the element index is refreshed.
+    """
+
+    def __init__(self, psse: object, func_options: dict, element_index: ElementIndex, max_plans: int = 32):
+        """creates the read plan compiler
+
+        Args:
+            psse (object): simulator instance
+            func_options (dict): mapping of class names to PSSE functions and supported properties
+            element_index (ElementIndex): bus to element index
+            max_plans (int, optional): maximum number of plans kept in memory. Defaults to 32.
+        """
+        self.psse = psse
+        self.func_options = func_options
+        self.element_index = element_index
+        self.max_plans = max_plans
+        self.plans = OrderedDict()
+
+    def get(
+        self,
+        quantities: dict,
+        subsystem_buses: list,
+        ext_string2_info: dict = None,
+        mapping_dict: dict = None,
+        skip: dict = None,
+    ) -> ReadPlan:
+        """returns a cached read plan, compiling it on first use
+
+        Args:
+            quantities (dict): mapping of class names to lists of properties
+            subsystem_buses (list): list of bus numbers in the subsystem
+            ext_string2_info (dict, optional): extra string arguments for 'busdt2'. Defaults to None.
+            mapping_dict (dict, optional): mapping of class names to user facing property names. Defaults to None.
+            skip (dict, optional): mapping of class names to properties read elsewhere. Defaults to None.
+
+        Returns:
+            ReadPlan: compiled read plan
+        """
+
+        key = (
+            self.freeze(quantities),
+            tuple(subsystem_buses),
+            self.freeze(ext_string2_info),
+            self.freeze(mapping_dict),
+            self.freeze(skip),
+        )
+        plan = self.plans.get(key)
+        if plan is None:
+            plan = self.compile(quantities, subsystem_buses, ext_string2_info, mapping_dict, skip)
+            self.plans[key] = plan
+            while len(self.plans) > self.max_plans:
+                self.plans.popitem(last=False)
+        else:
+            self.plans.move_to_end(key)
+        return plan
+
+    def clear(self):
+        """drops all cached plans"""
+        self.plans.clear()
+
+    def compile(
+        self,
+        quantities: dict,
+        subsystem_buses: list,
+        ext_string2_info: dict = None,
+        mapping_dict: dict = None,
+        skip: dict = None,
+    ) -> ReadPlan:
+        """compiles a read plan
+
+        Args:
+            quantities (dict): mapping of class names to lists of properties
+            subsystem_buses (list): list of bus numbers in the subsystem
+            ext_string2_info (dict, optional): extra string arguments for 'busdt2'. Defaults to None.
+            mapping_dict (dict, optional): mapping of class names to user facing property names. Defaults to None.
+            skip (dict, optional): mapping of class names to properties read elsewhere. Defaults to None.
+
+        Returns:
+            ReadPlan: compiled read plan
+        """
+
+        if ext_string2_info is None:
+            ext_string2_info = {}
+        if mapping_dict is None:
+            mapping_dict = {}
+        if skip is None:
+            skip = {}
+
+        steps = []
+        compiled = {}
+        special_classes = [ModelTypes.AREAS.value, ModelTypes.STATIONS.value, ModelTypes.ZONES.value]
+        for class_name, var_list in quantities.items():
+            if class_name not in self.func_options or class_name in special_classes:
+                continue
+            funcs = self.func_options[class_name]
+            for id_, v in enumerate(var_list):
+                if v in skip.get(class_name, []):
+                    continue
+                func_names = [func_name for func_name, settings in funcs.items() if v in settings]
+                if not func_names or not all(func_name in PLAN_FUNCTIONS for func_name in func_names):
+                    continue
+                if class_name == ModelTypes.DC_LINES.value and func_names != ["dc2int_2"]:
+                    continue
+
+                q = f"{class_name}_{v}"
+                if class_name in mapping_dict:
+                    q = f"{class_name}_{mapping_dict[class_name][id_]}"
+
+                string2 = "ACT"
+                if class_name in ext_string2_info and v in ext_string2_info[class_name]:
+                    string2 = ext_string2_info[class_name][v]
+
+                for func_name in func_names:
+                    func = getattr(self.psse, func_name)
+                    for args, label, check_ierr in self.get_calls(func_name, v, subsystem_buses, string2):
+                        steps.append((func, args, q, label, check_ierr))
+                compiled.setdefault(class_name, []).append(v)
+
+        logger.debug(f"Read plan compiled with {len(steps)} steps")
+        return ReadPlan(steps, compiled)
+
+    def get_calls(self, func_name: str, v: str, subsystem_buses: list, string2: str) -> list:
+        """returns call arguments and labels for a PSSE getter, matching the per-element reader
+
+        Args:
+            func_name (str): PSSE function name
+            v (str): property name
+            subsystem_buses (list): list of bus numbers in the subsystem
+            string2 (str): extra string argument for 'busdt2'
+
+        Returns:
+            list: list of (arguments, label, check error code) tuples
+        """
+
+        index = self.element_index
+        family = PLAN_FUNCTIONS[func_name]
+        calls = []
+        if family == "dc_lines":
+            for dcline in index.get_dc_line_names(subsystem_buses):
+                calls.append(((dcline, v), dcline, False))
+            return calls
+
+        for b in subsystem_buses:
+            if family == "bus":
+                if func_name == "busdt2":
+                    args = (int(b), v, string2)
+                elif func_name in ["notona", "gendat"]:
+                    args = (int(b),)
+                else:
+                    args = (int(b), v)
+                calls.append((args, b, False))
+            elif family == "switched_shunts":
+                calls.append(((int(b), v), b, True))
+            elif family == "loads":
+                for load_id in index.loads.get(int(b), []):
+                    args = (int(b), load_id, v, "ACT") if func_name == "loddt2" else (int(b), load_id, v)
+                    calls.append((args, f"{b}_{load_id}", False))
+            elif family in ["machines", "fixed_shunts", "induction_machines"]:
+                for elm_id in getattr(index, family).get(int(b), []):
+                    calls.append(((int(b), elm_id, v), f"{b}_{elm_id}", False))
+            elif family == "branches":
+                for b1, ickt in index.branches.get(int(b), []):
+                    calls.append(((int(b), int(b1), str(ickt), v), f"{b!s}_{b1!s}_{ickt!s}", True))
+            elif family == "two_winding_transformers":
+                for b1, ickt in index.two_winding_transformers.get(int(b), []):
+                    calls.append(((int(b), int(b1), ickt, v), f"{b!s}_{b1!s}_{ickt!s}", True))
+            elif family == "three_winding_transformers":
+                for b1, b2, ickt in index.three_winding_transformers.get(int(b), []):
+                    calls.append(((int(b), int(b1), int(b2), ickt, v), f"{b!s}_{b1!s}_{b2!s}_{ickt!s}", True))
+        return calls
+
+    @staticmethod
+    def freeze(data):
+        """returns a hashable copy of nested dicts and lists"""
+        if isinstance(data, dict):
+            return tuple((k, ReadPlanCompiler.freeze(v)) for k, v in data.items())
+        if isinstance(data, (list, tuple, set)):
+            return tuple(ReadPlanCompiler.freeze(v) for v in data)
+        return data
@@ -127,14 +127,14 @@ class Snap(AbstractMode, DynamicUtils):
         return self.settings.simulation.simulation_step_resolution.total_seconds()
 
     @converter
-    def read_subsystems(self, quantities, subsystem_buses, ext_string2_info=None, mapping_dict=None):
+    def read_subsystems(self, quantities, subsystem_buses, ext_string2_info=None, mapping_dict=None, results=None):
         "Queries the result container for current results"
         if ext_string2_info is None:
             ext_string2_info = {}
         if mapping_dict is None:
             mapping_dict = {}
         results = super().read_subsystems(
-            quantities, subsystem_buses, mapping_dict=mapping_dict, ext_string2_info=ext_string2_info
+            quantities, subsystem_buses, mapping_dict=mapping_dict, ext_string2_info=ext_string2_info, results=results
         )
 
         poll_results = self.poll_channels()
@@ -149,11 +149,9 @@ class Snap(AbstractMode, DynamicUtils):
                                 con_ind = dyn_only_options[class_name][func_name][v]
                                 for bus in subsystem_buses:
                                     if class_name == "Loads":
-                                        ierr = self.psse.inilod(int(bus))
-
-                                        ierr, ld_id = self.psse.nxtlod(int(bus))
-
-                                        if ld_id is not None:
+                                        ld_ids = self.element_index.loads.get(int(bus), [])
+                                        if ld_ids:
+                                            ld_id = ld_ids[0]
                                             ierr, con_index = getattr(self.psse, func_name)(
                                                 int(bus), ld_id, "CHARAC", "CON"
                                             )
@@ -163,10 +161,8 @@ class Snap(AbstractMode, DynamicUtils):
                                                 ierr, value = self.psse.dsrval("CON", act_con_index)
 
                                                 res_base = f"{class_name}_{v}"
-                                                if res_base not in results:
-                                                    results[res_base] = {}
                                                 obj_name = f"{bus}_{ld_id}"
-                                                results[res_base][obj_name] = value
+                                                results.setdefault(res_base, {})[obj_name] = value
             else:
                 logger.warning("Extend function 'read_subsystems' in the Snap class (Snap.py)")
 
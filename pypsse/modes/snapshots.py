@@ -0,0 +1,147 @@
+"Named snapshots of the PSS/E working case"
+
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+from loguru import logger
+
+RAM_DISK = Path("/dev/shm")
+BASE_SNAPSHOT = "base"
+
+
+def get_snapshot_directory(directory: Path = None) -> Path:
+    """creates a private directory for snapshot files
+
+    If no directory is passed, a RAM disk (/dev/shm) is used if available, otherwise the system temp directory.
+
+    Args:
+        directory (Path, optional): parent directory. Defaults to None.
+
+    Returns:
+        Path: snapshot directory
+    """
+
+    if directory is None and RAM_DISK.is_dir() and os.access(RAM_DISK, os.W_OK):
+        directory = RAM_DISK
+    return Path(tempfile.mkdtemp(prefix="pypsse_snapshots_", dir=directory))
+
+
+class SnapshotManager:
+    """Bounded cache of named snapshots of the PSS/E working case.
+
+    A snapshot is a binary SAV file (and a SNP file for dynamic simulations) written to a RAM disk or temp
+    directory. Binary case files are written and read considerably faster than RAW files, so a case can be reset
+    to a captured state without re-reading the original case. When more than 'max_snapshots' snapshots are held,
+    the least recently used snapshot is discarded. With 'max_snapshots' set to None the number of snapshots is
+    unbounded and snapshots are only removed by 'discard' or 'close'.
+    """
+
+    def __init__(self, psse, max_snapshots: int = 8, directory: Path = None, dynamic: bool = False):
+        """creates the snapshot manager. The snapshot directory is created on the first capture
+
+        Args:
+            psse (object): psspy module
+            max_snapshots (int, optional): maximum number of snapshots held, None for no limit. Defaults to 8.
+            directory (Path, optional): parent directory for snapshot files. Defaults to None (RAM disk or temp).
+            dynamic (bool, optional): also capture the dynamic model state (SNP). Defaults to False.
+        """
+        self.psse = psse
+        self.max_snapshots = max_snapshots
+        self.parent_directory = directory
+        self.dynamic = dynamic
+        self.directory = None
+        self.snapshots = OrderedDict()
+        self.serial = 0
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.snapshots
+
+    def __len__(self) -> int:
+        return len(self.snapshots)
+
+    def capture(self, name: str = None) -> str:
+        """captures the current state of the working case. An existing snapshot with the same name is replaced
+
+        Args:
+            name (str, optional): snapshot name. Defaults to None (a unique name is generated).
+
+        Raises:
+            Exception: raised if PSS/E fails to write the snapshot
+
+        Returns:
+            str: snapshot name (handle passed to 'restore')
+        """
+
+        if self.directory is None:
+            self.directory = get_snapshot_directory(self.parent_directory)
+        if name is None:
+            name = f"snapshot_{self.serial}"
+        self.discard(name)
+
+        stem = self.directory / f"{self.serial}"
+        self.serial += 1
+        files = [stem.with_suffix(".sav")]
+        ierr = self.psse.save(str(files[0]))
+        if ierr == 0 and self.dynamic:
+            files.append(stem.with_suffix(".snp"))
+            ierr = self.psse.snap([-1, -1, -1, -1, -1], str(files[1]))
+        if ierr:
+            self.remove_files(files)
+            msg = f"Unable to capture snapshot '{name}'. Error code - {ierr}"
+            raise Exception(msg)
+
+        self.snapshots[name] = files
+        while self.max_snapshots is not None and len(self.snapshots) > self.max_snapshots:
+            evicted, evicted_files = self.snapshots.popitem(last=False)
+            self.remove_files(evicted_files)
+            logger.debug(f"Snapshot '{evicted}' evicted")
+        logger.debug(f"Snapshot '{name}' captured")
+        return name
+
+    def restore(self, name: str):
+        """resets the working case to a snapshot
+
+        Args:
+            name (str): snapshot name
+
+        Raises:
+            Exception: raised if the snapshot does not exist or PSS/E fails to read it
+        """
+
+        if name not in self.snapshots:
+            msg = f"Snapshot '{name}' does not exist. Available snapshots: {list(self.snapshots)}"
+            raise Exception(msg)
+
+        files = self.snapshots[name]
+        ierr = self.psse.case(str(files[0]))
+        if ierr == 0 and len(files) > 1:
+            ierr = self.psse.rstr(str(files[1]))
+        if ierr:
+            msg = f"Unable to restore snapshot '{name}'. Error code - {ierr}"
+            raise Exception(msg)
+        self.snapshots.move_to_end(name)
+        logger.debug(f"Snapshot '{name}' restored")
+
+    def discard(self, name: str):
+        """removes a snapshot, if it exists"""
+        files = self.snapshots.pop(name, None)
+        if files:
+            self.remove_files(files)
+
+    @staticmethod
+    def remove_files(files: list):
+        for file in files:
+            Path(file).unlink(missing_ok=True)
+
+    def close(self):
+        """removes all snapshots and the snapshot directory"""
+        self.snapshots.clear()
+        if self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self.directory = None
+
+    def __del__(self):
+        self.close()
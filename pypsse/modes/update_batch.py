@@ -0,0 +1,35 @@
+"Table of model updates passed to 'update_objects'"
+
+import numpy as np
+
+
+def get_key_order(key: str) -> int:
+    """returns the sort position of a realar key"""
+    return int(key[6:]) if key[6:].isdigit() else 0
+
+
+def build_update_batch(updates: list) -> (np.ndarray, np.ndarray, np.ndarray, list, np.ndarray):
+    """converts a list of per element updates to update table columns
+
+    Args:
+        updates (list): list of (model type, bus, element id, {realar key: value}) tuples
+
+    Returns:
+        np.ndarray: model type for each row
+        np.ndarray: bus number for each row
+        np.ndarray: element id for each row
+        list: realar keys (value columns)
+        np.ndarray: values (rows, keys), NaN where a key is not updated
+    """
+
+    keys = sorted({k for update in updates for k in update[3]}, key=get_key_order)
+    columns = {k: j for j, k in enumerate(keys)}
+    values = np.full((len(updates), len(keys)), np.nan)
+    for i, (_, _, _, row) in enumerate(updates):
+        for k, v in row.items():
+            values[i, columns[k]] = v
+
+    dtypes = np.array([u[0] for u in updates], dtype=object)
+    buses = np.array([int(u[1]) for u in updates], dtype=int)
+    element_ids = np.array([u[2] for u in updates], dtype=object)
+    return dtypes, buses, element_ids, keys, values
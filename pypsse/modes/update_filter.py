@@ -0,0 +1,81 @@
+"Write coalescing for model updates"
+
+from loguru import logger
+
+
+class UpdateFilter:
+    """Skips model writes that would not change the value held by PSS/E.
+
+    The last value written is remembered for every (model type, bus, element id, realar key). A value is only
+    written again when it differs from the last written value by more than the absolute deadband and more than
+    the relative deadband (fraction of the last written value). Unchanged keys are dropped from an update, and
+    the update is skipped entirely if no key changed.
+    """
+
+    def __init__(self, absolute_deadband: float = 0.0, relative_deadband: float = 0.0, enabled: bool = True):
+        """creates the update filter
+
+        Args:
+            absolute_deadband (float, optional): minimum absolute change for a value to be written. Defaults to 0.0.
+            relative_deadband (float, optional): minimum change relative to the last written value. Defaults to 0.0.
+            enabled (bool, optional): if false, all updates are passed through. Defaults to True.
+        """
+        self.absolute_deadband = absolute_deadband
+        self.relative_deadband = relative_deadband
+        self.enabled = enabled
+        self.last_values = {}
+        self.written = 0
+        self.skipped = 0
+
+    def is_changed(self, key: tuple, value: float) -> bool:
+        """returns true if a value differs from the last written value by more than the deadband"""
+        last = self.last_values.get(key)
+        if last is None:
+            return True
+        change = abs(value - last)
+        return change > self.absolute_deadband and change > self.relative_deadband * abs(last)
+
+    def filter(self, dtype: str, bus: int, element_id: str, values: dict) -> dict:
+        """returns the subset of values that should be written
+
+        Args:
+            dtype (str): writable model type
+            bus (int): bus number
+            element_id (str): element id
+            values (dict): mapping of realar keys to new values
+
+        Returns:
+            dict: values to write, empty if the update can be skipped
+        """
+        if not self.enabled:
+            return values
+        changed = {k: v for k, v in values.items() if self.is_changed((dtype, int(bus), element_id, k), v)}
+        if not changed:
+            self.skipped += 1
+        return changed
+
+    def commit(self, dtype: str, bus: int, element_id: str, values: dict):
+        """records values that have been written successfully
+
+        Args:
+            dtype (str): writable model type
+            bus (int): bus number
+            element_id (str): element id
+            values (dict): mapping of realar keys to written values
+        """
+        self.written += 1
+        if self.enabled:
+            for k, v in values.items():
+                self.last_values[(dtype, int(bus), element_id, k)] = v
+
+    def clear(self):
+        """forgets all written values so that the next update of every element is written"""
+        self.last_values.clear()
+
+    def get_statistics(self) -> dict:
+        """returns the number of written and skipped updates"""
+        return {"written": self.written, "skipped": self.skipped}
+
+    def log_statistics(self):
+        """logs the number of written and skipped updates"""
+        logger.info(f"Model updates: {self.written} written, {self.skipped} skipped (unchanged within deadband)")
@@ -0,0 +1,152 @@
+from typing import Dict, List
+
+from loguru import logger
+
+from pypsse.parsers.reader import Reader
+
+
+class ElementIndex:
+    """Bus to element index for a loaded PSSE model.
+
+    The index is built once from the model reader so that result queries do not have to walk the
+    PSSE element lists (inilod/nxtlod, inibrx/nxtbrn ...) for every bus on every time step.
+    Branches are indexed from both ends and three winding transformers from all three windings, as 'nxtbrn' and
+    'nxtbrn3' return them. Element lists include out of service elements, so the index stays valid when faults
+    are applied or elements are tripped; it only has to be rebuilt after elements are added or purged (see
+    'refresh').
+    """
+
+    def __init__(self, psse_instance: object, raw_data: Reader = None):
+        """creates the bus to element index
+
+        Args:
+            psse_instance (object): simulator instance
+            raw_data (Reader, optional): model reader. A new reader is created if not provided. Defaults to None.
+        """
+        self.psse = psse_instance
+        self.build(raw_data if raw_data is not None else Reader(psse_instance))
+
+    def build(self, raw_data: Reader):
+        """(re)builds the index from a model reader
+
+        Args:
+            raw_data (Reader): model reader
+        """
+        self.raw_data = raw_data
+        self.loads = self.group_by_bus(raw_data.loads)
+        self.machines = self.group_by_bus(raw_data.generators)
+        self.induction_machines = self.group_by_bus(raw_data.induction_machines)
+        self.fixed_shunts = self.group_by_bus(raw_data.fixed_stunts)
+        self.branches = self.group_by_bus(self.get_branch_ends(raw_data.ac_branches))
+        self.two_winding_transformers = self.group_by_bus(self.get_branch_ends(raw_data.two_winding_transformers))
+        self.three_winding_transformers = self.group_by_bus(
+            self.get_winding_ends(raw_data.three_winding_transformers)
+        )
+        self.bus_area = {int(b): a for b, a in raw_data.bus_areas}
+        self.bus_zone = {int(b): z for b, z in raw_data.bus_zones}
+        self.bus_station = self.get_bus_stations(raw_data.buses)
+        self.dc_lines = self.get_dc_lines()
+        logger.debug(f"Element index built for {len(raw_data.buses)} buses")
+
+    def refresh(self):
+        """rebuilds the index after a topology changing event"""
+        self.build(Reader(self.psse))
+
+    def group_by_bus(self, elements: list) -> Dict[int, List[tuple]]:
+        """groups element records by their first (bus) column
+
+        Args:
+            elements (list): list of element records e.g. (bus, id)
+
+        Returns:
+            Dict[int, List[tuple]]: mapping of bus number to list of remaining record columns
+        """
+        index = {}
+        for element in elements:
+            bus, *element_info = element
+            element_info = element_info[0] if len(element_info) == 1 else tuple(element_info)
+            index.setdefault(int(bus), []).append(element_info)
+        return index
+
+    @staticmethod
+    def get_branch_ends(branches: list) -> list:
+        """returns branch records (from bus, to bus, id) as seen from both ends
+
+        Args:
+            branches (list): list of branch records
+
+        Returns:
+            list: branch records, once from each end
+        """
+        ends = list(branches)
+        ends.extend((j, i, ckt) for i, j, ckt in branches)
+        return ends
+
+    @staticmethod
+    def get_winding_ends(transformers: list) -> list:
+        """returns three winding transformer records (winding 1 bus, winding 2 bus, winding 3 bus, id) as seen from
+        each winding. The other windings keep their order, as returned by 'nxtbrn3'
+
+        Args:
+            transformers (list): list of three winding transformer records
+
+        Returns:
+            list: transformer records, once from each winding
+        """
+        ends = list(transformers)
+        ends.extend((j, i, k, ckt) for i, j, k, ckt in transformers)
+        ends.extend((k, i, j, ckt) for i, j, k, ckt in transformers)
+        return ends
+
+    def get_bus_stations(self, buses: list) -> Dict[int, int]:
+        """returns mapping of bus number to substation number
+
+        Args:
+            buses (list): list of bus numbers
+
+        Returns:
+            Dict[int, int]: mapping of bus number to substation number
+        """
+        stations = {}
+        for b in buses:
+            ierr, val = self.psse.busint(int(b), "STATION")
+            if ierr == 0:
+                stations[int(b)] = val
+        return stations
+
+    def get_dc_lines(self) -> Dict[str, tuple]:
+        """returns mapping of two terminal dc line names to rectifier and inverter buses
+
+        Returns:
+            Dict[str, tuple]: mapping of dc line name to (rectifier bus, inverter bus)
+        """
+        dc_lines = {}
+        ierr = self.psse.ini2dc()
+        if ierr:
+            logger.info("No DC line in the model.")
+        else:
+            ierr, dc_line_name = self.psse.nxtmdc()
+            while dc_line_name is not None:
+                ierr, rectbus = self.psse.dc2int_2(dc_line_name, "RECT")
+                ierr, invbus = self.psse.dc2int_2(dc_line_name, "INV")
+                dc_lines[dc_line_name] = (rectbus, invbus)
+                ierr, dc_line_name = self.psse.nxt2dc()
+        return dc_lines
+
+    def get_areas(self, subsystem_buses: list) -> list:
+        """returns area numbers for the subsystem buses"""
+        return list({self.bus_area[int(b)] for b in subsystem_buses if self.bus_area.get(int(b))})
+
+    def get_zones(self, subsystem_buses: list) -> list:
+        """returns zone numbers for the subsystem buses"""
+        return list({self.bus_zone[int(b)] for b in subsystem_buses if self.bus_zone.get(int(b))})
+
+    def get_stations(self, subsystem_buses: list) -> list:
+        """returns substation numbers for the subsystem buses"""
+        return list({self.bus_station[int(b)] for b in subsystem_buses if self.bus_station.get(int(b))})
+
+    def get_dc_line_names(self, subsystem_buses: list) -> list:
+        """returns names of dc lines with both terminals in the subsystem buses"""
+        return [
+            name for name, (rect, inv) in self.dc_lines.items() if rect in subsystem_buses and inv in subsystem_buses
+        ]
@@ -20,12 +20,29 @@ class Reader:
         self.loads = self.get_data("aload", tails=["int", "char"], strings=["NUMBER", "ID"], flags=[4, 4])
         self.fixed_stunts = self.get_data("afxshunt", tails=["int", "char"], strings=["NUMBER", "ID"], flags=[4, 4])
         self.generators = self.get_data("amach", tails=["int", "char"], strings=["NUMBER", "ID"], flags=[4, 4])
+        self.induction_machines = self.get_data(
+            "aindmac", tails=["int", "char"], strings=["NUMBER", "ID"], flags=[4, 4]
+        )
         self.branches = self.get_data(
             "abrn", tails=["int", "int", "char"], strings=["FROMNUMBER", "TONUMBER", "ID"], flags=[2, 2, 2]
         )
+        self.ac_branches = self.get_data(
+            "abrn", tails=["int", "int", "char"], strings=["FROMNUMBER", "TONUMBER", "ID"], flags=[4, 4, 4]
+        )
+        self.two_winding_transformers = self.get_data(
+            "atrn", tails=["int", "int", "char"], strings=["FROMNUMBER", "TONUMBER", "ID"], flags=[2, 2, 2]
+        )
         self.transformers = self.get_data(
             "atr3", tails=["int", "int", "int"], strings=["WIND1NUMBER", "WIND2NUMBER", "WIND3NUMBER"], flags=[2, 2, 2]
         )
+        self.three_winding_transformers = self.get_data(
+            "atr3",
+            tails=["int", "int", "int", "char"],
+            strings=["WIND1NUMBER", "WIND2NUMBER", "WIND3NUMBER", "ID"],
+            flags=[2, 2, 2, 2],
+        )
+        self.bus_areas = self.get_data("abus", tails=["int", "int"], strings=["NUMBER", "AREA"], flags=[2, 2])
+        self.bus_zones = self.get_data("abus", tails=["int", "int"], strings=["NUMBER", "ZONE"], flags=[2, 2])
         self.area = self.get_data(
             "aarea", tails=["int", "char"], strings=["NUMBER", "AREANAME"], flags=[2, 2]
         )  # Talk to Aadil
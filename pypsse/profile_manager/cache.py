@@ -0,0 +1,130 @@
+"Read-ahead cache for profile datasets"
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import h5py
+import numpy as np
+from loguru import logger
+from numpy.lib import recfunctions as rfn
+
+
+def to_matrix(data: np.ndarray) -> np.ndarray:
+    """converts (structured) profile rows to a 2-D float matrix (time, column)
+
+    Args:
+        data (np.ndarray): profile rows
+
+    Returns:
+        np.ndarray: profile data
+    """
+    if data.dtype.names:
+        data = rfn.structured_to_unstructured(data)
+    return np.asarray(data, dtype=np.float64).reshape(len(data), -1)
+
+
+class ProfileCache:
+    """Bounded LRU cache of decompressed profile windows.
+
+    Each window holds a fixed number of consecutive rows of a single dataset, rounded up to the dataset chunk size
+    so that a window read never decompresses a chunk twice. Optionally, the next window of a dataset is read on a
+    background thread as soon as a window is first used.
+    """
+
+    def __init__(self, window_rows: int = 3600, max_windows: int = 32, prefetch: bool = False):
+        """creates the profile cache
+
+        Args:
+            window_rows (int, optional): minimum number of rows per window. Defaults to 3600.
+            max_windows (int, optional): maximum number of windows kept in memory. Defaults to 32.
+            prefetch (bool, optional): read the next window on a background thread. Defaults to False.
+        """
+        self.window_rows = window_rows
+        self.max_windows = max_windows
+        self.prefetch = prefetch
+        self.windows = OrderedDict()
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        self.hits = 0
+        self.misses = 0
+
+    def get_window_size(self, dataset: h5py.Dataset) -> int:
+        """returns the window size for a dataset aligned to its chunk boundaries"""
+        chunk_rows = dataset.chunks[0] if dataset.chunks else 1
+        return max(1, -(-self.window_rows // chunk_rows) * chunk_rows)
+
+    @staticmethod
+    def get_key(dataset: h5py.Dataset, start: int) -> tuple:
+        """returns the cache key of a window. h5py creates a new 'File' object on every access, so the file is
+        identified by its path"""
+        return (dataset.file.filename, dataset.name, start)
+
+    def read_window(self, dataset: h5py.Dataset, start: int, size: int) -> np.ndarray:
+        """reads and decompresses a window of rows from a dataset"""
+        return to_matrix(dataset[start : min(start + size, dataset.shape[0])])
+
+    def get_window(self, dataset: h5py.Dataset, start: int, size: int) -> np.ndarray:
+        """returns a cached window, reading it (or waiting for a prefetch) if required"""
+        key = self.get_key(dataset, start)
+        with self.lock:
+            window = self.windows.get(key)
+            if window is not None:
+                self.windows.move_to_end(key)
+                self.hits += 1
+                return window
+            future = self.pending.pop(key, None)
+
+        self.misses += 1
+        window = future.result() if future is not None else self.read_window(dataset, start, size)
+        self.store(key, window)
+        if self.executor is not None and start + size < dataset.shape[0]:
+            self.schedule(dataset, start + size, size)
+        return window
+
+    def store(self, key: tuple, window: np.ndarray):
+        """adds a window to the cache and evicts the least recently used windows"""
+        with self.lock:
+            self.windows[key] = window
+            self.windows.move_to_end(key)
+            while len(self.windows) > self.max_windows:
+                self.windows.popitem(last=False)
+
+    def schedule(self, dataset: h5py.Dataset, start: int, size: int):
+        """queues a background read of a window"""
+        key = self.get_key(dataset, start)
+        with self.lock:
+            if key in self.windows or key in self.pending:
+                return
+            self.pending[key] = self.executor.submit(self.read_window, dataset, start, size)
+        logger.debug(f"Prefetching rows {start}-{start + size} of {dataset.name}")
+
+    def get_rows(self, dataset: h5py.Dataset, rows: list) -> list:
+        """returns profile rows as float arrays
+
+        Args:
+            dataset (h5py.Dataset): profile dataset
+            rows (list): row indices
+
+        Returns:
+            list: list of rows
+        """
+        size = self.get_window_size(dataset)
+        values = []
+        for row in rows:
+            start = (row // size) * size
+            values.append(self.get_window(dataset, start, size)[row - start])
+        return values
+
+    def clear(self):
+        """drops all cached windows"""
+        with self.lock:
+            self.windows.clear()
+            self.pending.clear()
+
+    def close(self):
+        """stops the prefetch thread"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
@@ -0,0 +1,196 @@
+"Profile store compaction to a homogeneous matrix layout"
+
+import json
+import os
+from pathlib import Path
+
+import h5py
+import numpy as np
+from loguru import logger
+
+from pypsse.enumerations import ProfileCompressors
+from pypsse.profile_manager.cache import to_matrix
+
+try:
+    import hdf5plugin
+except ImportError:
+    hdf5plugin = None
+
+MATRIX_LAYOUT = "matrix"
+LAYOUT_ATTRIBUTE = "layout"
+METADATA_DATASET = "metadata"
+
+
+def get_compression_options(compressor: ProfileCompressors = ProfileCompressors.AUTO) -> dict:
+    """returns h5py dataset compression options for a compressor
+
+    lz4 and blosc require hdf5plugin. If it is not installed, gzip (level 1) is used instead.
+
+    Args:
+        compressor (ProfileCompressors, optional): compressor. Defaults to ProfileCompressors.AUTO.
+
+    Returns:
+        dict: keyword arguments for 'create_dataset'
+    """
+
+    compressor = ProfileCompressors(compressor)
+    if compressor != ProfileCompressors.GZIP and hdf5plugin is not None:
+        if compressor == ProfileCompressors.LZ4:
+            return dict(hdf5plugin.LZ4())
+        return dict(hdf5plugin.Blosc(cname="lz4", clevel=5, shuffle=hdf5plugin.Blosc.SHUFFLE))
+    if compressor in [ProfileCompressors.LZ4, ProfileCompressors.BLOSC]:
+        logger.warning(f"hdf5plugin is not installed, using gzip instead of {compressor.value}")
+    return {"compression": "gzip", "compression_opts": 1, "shuffle": True}
+
+
+def to_json_value(value):
+    """converts a dataset attribute to a json serializable value"""
+    if isinstance(value, bytes):
+        return value.decode()
+    if isinstance(value, np.ndarray):
+        return [to_json_value(v) for v in value.tolist()]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def get_profile_paths(store: h5py.File) -> list:
+    """returns the paths ('<group>/<profile>') of all profiles in a store"""
+    return [
+        f"{group_name}/{name}"
+        for group_name, group in store.items()
+        if isinstance(group, h5py.Group)
+        for name, dataset in group.items()
+        if isinstance(dataset, h5py.Dataset)
+    ]
+
+
+def consolidate_metadata(store: h5py.File):
+    """stores the attributes of all profiles as a single json string dataset on the root group
+
+    A dataset is used instead of an attribute as attributes are limited to 64 kB.
+
+    Args:
+        store (h5py.File): profile store
+    """
+
+    metadata = {
+        path: {key: to_json_value(value) for key, value in store[path].attrs.items()}
+        for path in get_profile_paths(store)
+    }
+    if METADATA_DATASET in store:
+        del store[METADATA_DATASET]
+    store.create_dataset(METADATA_DATASET, data=json.dumps(metadata), dtype=h5py.string_dtype())
+
+
+def read_metadata(store: h5py.File) -> dict:
+    """returns the attributes of all profiles in a store
+
+    The consolidated metadata is used if available, otherwise the attributes are read from each dataset.
+
+    Args:
+        store (h5py.File): profile store
+
+    Returns:
+        dict: mapping of profile paths to attributes
+    """
+
+    if METADATA_DATASET in store:
+        return json.loads(to_json_value(store[METADATA_DATASET][()]))
+    return {
+        path: {key: to_json_value(value) for key, value in store[path].attrs.items()}
+        for path in get_profile_paths(store)
+    }
+
+
+def is_matrix_layout(store: h5py.File) -> bool:
+    """returns true if a profile store has been compacted to the matrix layout"""
+    return to_json_value(store.attrs.get(LAYOUT_ATTRIBUTE, "")) == MATRIX_LAYOUT
+
+
+def create_matrix_dataset(
+    group: h5py.Group,
+    name: str,
+    shape: tuple,
+    dtype: str = "float64",
+    chunk_rows: int = 3600,
+    compressor: ProfileCompressors = ProfileCompressors.AUTO,
+) -> h5py.Dataset:
+    """creates a 2-D (time, column) profile dataset with time aligned chunks
+
+    Each chunk holds all columns of 'chunk_rows' consecutive time steps, so reading a time step decompresses
+    exactly one chunk.
+
+    Args:
+        group (h5py.Group): profile group
+        name (str): profile name
+        shape (tuple): number of time steps and columns
+        dtype (str, optional): float data type. Defaults to "float64".
+        chunk_rows (int, optional): time steps per chunk. Defaults to 3600.
+        compressor (ProfileCompressors, optional): compressor. Defaults to ProfileCompressors.AUTO.
+
+    Returns:
+        h5py.Dataset: profile dataset
+    """
+
+    npts, ncols = shape
+    chunks = (max(1, min(chunk_rows, npts)), max(1, ncols))
+    return group.create_dataset(name, shape=shape, dtype=dtype, chunks=chunks, **get_compression_options(compressor))
+
+
+def compact_profile_store(
+    source: Path,
+    destination: Path = None,
+    dtype: str = "float64",
+    chunk_rows: int = 3600,
+    compressor: ProfileCompressors = ProfileCompressors.AUTO,
+) -> Path:
+    """rewrites a profile store with homogeneous 2-D float datasets
+
+    Profiles are copied 'chunk_rows' time steps at a time, so the store never has to fit in memory. Dataset
+    attributes are preserved and also written as consolidated metadata to the root group. If no destination is
+    passed, the source file is replaced once the new store has been written.
+
+    Args:
+        source (Path): path to the profile store
+        destination (Path, optional): path to the compacted store. Defaults to None.
+        dtype (str, optional): float data type ('float32' or 'float64'). Defaults to "float64".
+        chunk_rows (int, optional): time steps per chunk. Defaults to 3600.
+        compressor (ProfileCompressors, optional): compressor. Defaults to ProfileCompressors.AUTO.
+
+    Raises:
+        ValueError: raised if a profile holds non numeric columns
+
+    Returns:
+        Path: path to the compacted store
+    """
+
+    source = Path(source)
+    target = Path(destination) if destination else source.with_suffix(".compact.hdf5")
+    with h5py.File(source, "r") as src, h5py.File(target, "w") as dst:
+        for group_name, group in src.items():
+            if isinstance(group, h5py.Group):
+                dst.create_group(group_name)
+        for path in get_profile_paths(src):
+            dataset = src[path]
+            if dataset.dtype.names and any(dataset.dtype[n].kind not in "biuf" for n in dataset.dtype.names):
+                msg = f"Profile '{path}' holds non numeric columns and can not be compacted"
+                raise ValueError(msg)
+            npts = dataset.shape[0]
+            ncols = len(dataset.dtype.names) if dataset.dtype.names else int(np.prod(dataset.shape[1:]))
+            group_name, name = path.split("/")
+            dset = create_matrix_dataset(dst[group_name], name, (npts, ncols), dtype, chunk_rows, compressor)
+            for start in range(0, npts, chunk_rows):
+                stop = min(start + chunk_rows, npts)
+                dset[start:stop] = to_matrix(dataset[start:stop])
+            for key, value in dataset.attrs.items():
+                dset.attrs[key] = value
+            logger.debug(f"Profile '{path}' compacted ({npts} x {ncols})")
+        dst.attrs[LAYOUT_ATTRIBUTE] = MATRIX_LAYOUT
+        consolidate_metadata(dst)
+
+    if destination is None:
+        os.replace(target, source)
+        target = source
+    logger.info(f"Profile store compacted to {target}")
+    return target
@@ -0,0 +1,176 @@
+"Vectorized update engine for mapped profiles"
+
+import numpy as np
+from loguru import logger
+
+from pypsse.modes.update_batch import get_key_order
+from pypsse.profile_manager.cache import ProfileCache
+from pypsse.profile_manager.common import PROFILE_VALIDATION
+from pypsse.profile_manager.profile import Profile
+from pypsse.profile_manager.schedule import ProfileSchedule
+
+
+class ProfileEngine:
+    """Computes values for all mapped objects of all profiles with one vectorized operation per time step.
+
+    Every (mapped object, profile column) pair is an entry in flat arrays holding the column position, the
+    multiplier / normalization scale and the interpolation flag. On each step the current and next profile rows
+    are gathered once per profile, interpolated and scaled for all entries at once, and the results are
+    dispatched to the model with a single 'update_objects' call. Profile rows are read through a windowed 'ProfileCache'.
+    For fixed step simulations, rows and weights are taken from a 'ProfileSchedule' driven by the step counter.
+    """
+
+    def __init__(self, solver: object, profiles: dict, cache: ProfileCache = None, settings: object = None):
+        """creates the profile engine
+
+        Args:
+            solver (object): simulation mode instance
+            profiles (dict): mapping of profile names to 'Profile' objects
+            cache (ProfileCache, optional): profile row cache. Defaults to None.
+            settings (SimSettings, optional): simulation settings used to build the row schedule. Defaults to None.
+        """
+        self.solver = solver
+        self.names = list(profiles)
+        self.profiles = [profiles[name] for name in self.names]
+        self.cache = cache if cache is not None else ProfileCache()
+        self.setup()
+        self.schedule = None
+        if settings is not None and self.profiles:
+            self.schedule = ProfileSchedule.from_settings(settings, self.stimes, self.resolutions)
+
+    @staticmethod
+    def get_column_count(profile: Profile) -> int:
+        """returns the number of data columns in a profile dataset"""
+        dataset = profile.profile
+        if dataset.dtype.names:
+            return len(dataset.dtype.names)
+        return dataset.shape[1] if len(dataset.shape) > 1 else 1
+
+    def setup(self):
+        """builds the entry arrays for all mapped objects"""
+
+        self.stimes = np.array([p.stime.timestamp() for p in self.profiles])
+        self.etimes = np.array([p.etime.timestamp() for p in self.profiles])
+        self.resolutions = np.array([float(p.attrs["resTime"]) for p in self.profiles])
+        self.npts = np.array([p.profile.shape[0] for p in self.profiles], dtype=int)
+        self.ncols = np.array([self.get_column_count(p) for p in self.profiles], dtype=int)
+        col_offsets = np.concatenate([[0], np.cumsum(self.ncols)[:-1]]).astype(int)
+
+        entry_index = []
+        scale = []
+        interpolate = []
+        self.objects = []
+        for i, p in enumerate(self.profiles):
+            ncols = self.ncols[i]
+            keys = [f"realar{PROFILE_VALIDATION[p.dtype].index(c) + 1}" for c in p.columns]
+            max_values = np.broadcast_to(np.asarray(p.attrs["max"], dtype=np.float64), (ncols,))
+            for obj_name, settings in p.value_settings.items():
+                bus, object_id = obj_name.split("__")
+                start = len(entry_index)
+                mult = np.broadcast_to(np.asarray(settings["multiplier"], dtype=np.float64), (ncols,))
+                entry_index.extend(col_offsets[i] + np.arange(ncols))
+                scale.extend(mult / max_values if settings["normalize"] else mult)
+                interpolate.extend([bool(settings["interpolate"])] * ncols)
+                self.objects.append((p.dtype, bus, object_id, keys, start, len(entry_index)))
+
+        self.entry_index = np.array(entry_index, dtype=int)
+        self.scale = np.array(scale, dtype=np.float64)
+        self.interpolate = np.array(interpolate, dtype=bool)
+        self.setup_batch()
+        logger.info(f"Profile engine set up for {len(self.profiles)} profiles and {len(self.objects)} objects")
+
+    def setup_batch(self):
+        """builds the update table layout, one row per mapped object and one column per realar key"""
+
+        self.keys = sorted({k for obj in self.objects for k in obj[3]}, key=get_key_order)
+        columns = {k: j for j, k in enumerate(self.keys)}
+        self.dtypes = np.array([obj[0] for obj in self.objects], dtype=object)
+        self.buses = np.array([int(obj[1]) for obj in self.objects], dtype=int)
+        self.element_ids = np.array([obj[2] for obj in self.objects], dtype=object)
+        entry_row = []
+        entry_col = []
+        for i, (_, _, _, keys, start, stop) in enumerate(self.objects):
+            entry_row.extend([i] * (stop - start))
+            entry_col.extend(columns[k] for k in keys)
+        self.entry_row = np.array(entry_row, dtype=int)
+        self.entry_col = np.array(entry_col, dtype=int)
+
+    def get_rows(self, i: int, n: int, n1: int) -> (np.ndarray, np.ndarray):
+        """returns rows n and n1 of a profile
+
+        Args:
+            i (int): profile index
+            n (int): current row
+            n1 (int): next row
+
+        Returns:
+            np.ndarray: current row
+            np.ndarray: next row
+        """
+        v0, v1 = self.cache.get_rows(self.profiles[i].profile, [n, n1])
+        return v0, v1
+
+    def get_indices(self) -> (np.ndarray, np.ndarray, np.ndarray):
+        """returns the current row, interpolation weight and validity for each profile at the solver time
+
+        Returns:
+            np.ndarray: current profile rows
+            np.ndarray: interpolation weights
+            np.ndarray: true if the solver time is within the profile time range
+        """
+        t = self.solver.get_time().astimezone(None).timestamp()
+        scheduled = self.schedule.get(t) if self.schedule is not None else None
+        if scheduled is not None:
+            rows, weights, started = scheduled
+            return np.clip(rows, 0, self.npts - 1), weights, started & (t <= self.etimes)
+
+        dt = t - self.stimes
+        in_range = (t >= self.stimes) & (t <= self.etimes)
+        rows = np.clip(np.floor(dt / self.resolutions).astype(int), 0, self.npts - 1)
+        weights = (dt - rows * self.resolutions) / self.resolutions
+        return rows, weights, in_range
+
+    def compute(self) -> (np.ndarray, dict):
+        """computes values for all entries at the current solver time
+
+        Returns:
+            np.ndarray: scaled value for each (object, column) entry
+            dict: current (not interpolated) row for each profile
+        """
+
+        rows, weights, in_range = self.get_indices()
+        current = []
+        following = []
+        for i in range(len(self.profiles)):
+            if in_range[i]:
+                v0, v1 = self.get_rows(i, rows[i], min(rows[i] + 1, self.npts[i] - 1))
+            else:
+                v0 = v1 = np.zeros(self.ncols[i])
+            current.append(v0)
+            following.append(v1)
+
+        if not current:
+            return np.zeros(0), {}
+        v0 = np.concatenate(current)
+        v1 = np.concatenate(following)
+        w = np.repeat(weights, self.ncols)
+        interpolated = v0 + (v1 - v0) * w
+        values = np.where(self.interpolate, interpolated[self.entry_index], v0[self.entry_index]) * self.scale
+        return values, dict(zip(self.names, current))
+
+    def update(self, update_object_properties: bool = True) -> dict:
+        """updates all mapped objects for the current time step
+
+        Args:
+            update_object_properties (bool, optional): write values to the mapped objects. Defaults to True.
+
+        Returns:
+            dict: values for profiles at the current time step
+        """
+
+        values, results = self.compute()
+        if update_object_properties and self.objects:
+            table = np.full((len(self.objects), len(self.keys)), np.nan)
+            table[self.entry_row, self.entry_col] = values
+            self.solver.update_objects(self.dtypes, self.buses, self.element_ids, self.keys, table)
+        return results
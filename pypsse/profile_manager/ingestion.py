@@ -0,0 +1,188 @@
+"Parallel ingestion of csv profiles into the profile store"
+
+import datetime
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import pandas as pd
+from loguru import logger
+
+from pypsse.profile_manager.common import PROFILE_VALIDATION, ProfileTypes
+from pypsse.profile_manager.compaction import consolidate_metadata, is_matrix_layout
+from pypsse.profile_manager.profile_store import ProfileManager
+
+INGESTION_JOURNAL_FILENAME = "ingested_profiles.txt"
+JOURNAL_STARTED = "started"
+JOURNAL_DONE = "done"
+
+
+def get_profile_files(profile_folder: Path) -> list:
+    """returns all csv profiles in a folder
+
+    CSV file names should follow the following format: {profile-type}__{profile-name}.csv
+
+    Args:
+        profile_folder (Path): path to folder containing csv profiles
+
+    Returns:
+        list: list of (csv file, profile type, profile name) tuples
+    """
+
+    files = []
+    for root, _, names in os.walk(profile_folder):
+        for file in sorted(names):
+            filename = file.replace(".csv", "")
+            if file.endswith(".csv") and "__" in filename:
+                p_type, p_name = filename.split("__")
+                files.append((Path(root) / file, p_type, p_name))
+    return files
+
+
+def read_profile(csv_file: Path, p_type: str, matrix: bool = False) -> (pd.DataFrame, tuple):
+    """parses and converts a csv profile. Runs in a worker process
+
+    Args:
+        csv_file (Path): path to profiles in a csv file
+        p_type (str): profile type
+        matrix (bool, optional): the store uses the compacted matrix layout. Defaults to False.
+
+    Raises:
+        ValueError: rasied if invalid profile type passed
+        ValueError: rasied if invalid profile column passed
+
+    Returns:
+        pd.DataFrame: profile data
+        tuple: structured array and dtype, None for the matrix layout
+    """
+
+    if p_type not in [p.value for p in ProfileTypes]:
+        msg = f"Valid profile types are: {list(PROFILE_VALIDATION.keys())}"
+        raise ValueError(msg)
+
+    data = pd.read_csv(csv_file)
+    for c in data.columns:
+        if c not in PROFILE_VALIDATION[p_type]:
+            msg = f"{c} is not valid, Valid subtypes for '{p_type}' are: {PROFILE_VALIDATION[p_type]}"
+            raise ValueError(msg)
+    return data, None if matrix else ProfileManager.df_to_sarray(data)
+
+
+class ProfileIngestor:
+    """Adds a large number of csv profiles to the profile store.
+
+    CSV parsing and array conversion run in a process pool, while the calling process is the single writer to the
+    HDF5 file. Every profile is recorded in a journal next to the store before ('started') and after ('done') it
+    is written, so an interrupted run can be restarted and only profiles not done are ingested again. A profile
+    left behind by an interrupted write is replaced only if the journal shows it was started by an ingestion run,
+    existing profiles are never overwritten.
+    """
+
+    def __init__(self, manager: ProfileManager, workers: int = None, progress_interval: float = 10.0):
+        """creates the profile ingestor
+
+        Args:
+            manager (ProfileManager): profile manager used to write profiles
+            workers (int, optional): number of worker processes. Defaults to None (number of CPUs).
+            progress_interval (float, optional): seconds between progress reports. Defaults to 10.0.
+        """
+        self.manager = manager
+        self.workers = workers or os.cpu_count() or 1
+        self.progress_interval = progress_interval
+        self.journal_path = Path(manager.store.filename).parent / INGESTION_JOURNAL_FILENAME
+
+    def read_journal(self) -> (set, set):
+        """returns the csv files started and ingested by previous runs
+
+        Journal lines are '{state}\t{csv file}'. Lines without a state are treated as done.
+
+        Returns:
+            set: csv files whose profiles were started
+            set: csv files whose profiles were written
+        """
+
+        started, done = set(), set()
+        if not self.journal_path.exists():
+            return started, done
+        with open(self.journal_path) as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if not line.strip():
+                    continue
+                state, sep, csv_file = line.partition("\t")
+                if not sep:
+                    state, csv_file = JOURNAL_DONE, line.strip()
+                (started if state == JOURNAL_STARTED else done).add(csv_file)
+        return started, done
+
+    def ingest(
+        self, files: list, start_time: datetime.datetime, resolution_sec: float = 900, info: str = ""
+    ) -> (int, int):
+        """ingests csv profiles
+
+        Args:
+            files (list): list of (csv file, profile type, profile name) tuples
+            start_time (datetime.datetime): profile start time
+            resolution_sec (float, optional): profile resolution in seconds. Defaults to 900.
+            info (str, optional): profile info. Defaults to "".
+
+        Returns:
+            int: number of profiles written
+            int: number of profiles that failed
+        """
+
+        started_files, done = self.read_journal()
+        pending = [f for f in files if str(f[0]) not in done]
+        logger.info(f"Ingesting {len(pending)} profiles ({len(files) - len(pending)} already ingested)")
+
+        store = self.manager.store
+        matrix = is_matrix_layout(store)
+        written = failed = 0
+        started = last_report = time.monotonic()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor, open(self.journal_path, "a") as journal:
+            queue = iter(pending)
+            futures = {}
+            while True:
+                while len(futures) < 2 * self.workers:
+                    item = next(queue, None)
+                    if item is None:
+                        break
+                    futures[executor.submit(read_profile, item[0], item[1], matrix)] = item
+                if not futures:
+                    break
+
+                completed, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    csv_file, p_type, p_name = futures.pop(future)
+                    try:
+                        data, sarray = future.result()
+                        group = store.require_group(p_type)
+                        if p_name in group:
+                            if str(csv_file) not in started_files:
+                                msg = f"Profile '{p_type}/{p_name}' already exists in the store"
+                                raise ValueError(msg)
+                            # started by an interrupted run but never recorded as done
+                            del group[p_name]
+                        journal.write(f"{JOURNAL_STARTED}\t{csv_file}\n")
+                        journal.flush()
+                        self.manager.create_dataset(
+                            p_name, p_type, data, start_time, resolution_sec, "", info, sarray=sarray, consolidate=False
+                        )
+                        store.flush()
+                        journal.write(f"{JOURNAL_DONE}\t{csv_file}\n")
+                        journal.flush()
+                        written += 1
+                    except Exception as e:
+                        logger.error(f"Failed to ingest profile '{csv_file}': {e!s}")
+                        failed += 1
+
+                if time.monotonic() - last_report >= self.progress_interval:
+                    last_report = time.monotonic()
+                    rate = written / (last_report - started)
+                    logger.info(f"Ingested {written + failed} of {len(pending)} profiles ({rate:.1f} profiles/s)")
+
+        if matrix:
+            consolidate_metadata(store)
+        logger.info(f"{written} profiles ingested, {failed} failed in {time.monotonic() - started:.1f} s")
+        return written, failed
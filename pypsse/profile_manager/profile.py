@@ -12,11 +12,9 @@ class Profile:
 
     DEFAULT_SETTINGS = {"multiplier": 1, "normalize": False, "interpolate": False}
 
-    def __init__(self, profile_obj, solver, mapping_dict, buffer_size=10, neglect_year=True):
+    def __init__(self, profile_obj, solver, mapping_dict, neglect_year=True):
         self.value_settings = {f"{x['bus']}__{x['id']}": {**self.DEFAULT_SETTINGS, **x} for x in mapping_dict}
         self.mapping_dict = mapping_dict
-        self.buffer_size = buffer_size
-        self.buffer = np.zeros(buffer_size)
         self.profile = profile_obj
         self.neglect_year = neglect_year
         self.solver = solver
@@ -15,7 +15,10 @@ from pypsse.modes.dynamic import Dynamic
 from pypsse.modes.pcm import ProductionCostModel
 from pypsse.modes.snap import Snap
 from pypsse.modes.static import Static
+from pypsse.profile_manager.cache import ProfileCache
 from pypsse.profile_manager.common import PROFILE_VALIDATION, ProfileTypes
+from pypsse.profile_manager.compaction import consolidate_metadata, create_matrix_dataset, is_matrix_layout
+from pypsse.profile_manager.engine import ProfileEngine
 from pypsse.profile_manager.profile import Profile
 
 
@@ -84,6 +87,11 @@ class ProfileManager:
                             logger.warning(rf"Group {group} \ data set {profile_name} not found in the h5 store")
                 else:
                     logger.warning(f"Group {group} not found in the h5 store")
+            cache_settings = self.settings.profiles
+            self.cache = ProfileCache(
+                cache_settings.cache_window_rows, cache_settings.cache_max_windows, cache_settings.cache_prefetch
+            )
+            self.engine = ProfileEngine(self.solver, self.profiles, self.cache, self.settings.simulation)
         else:
             msg = f"Profile_mapping.toml file does not exist in path {mapping_path}"
             raise Exception(msg)
@@ -97,6 +105,8 @@ class ProfileManager:
         resolution: float,
         units:str,
         info: str,
+        sarray: tuple = None,
+        consolidate: bool = True,
     ):
         """Create new profile datasets
 
@@ -108,24 +118,35 @@ class ProfileManager:
             resolution (float): profile resolution
             _ (_type_): _description_
             info (:str): profile description
+            sarray (tuple, optional): data already converted with 'df_to_sarray'. Defaults to None.
+            consolidate (bool, optional): update the consolidated metadata of a compacted store. Defaults to True.
 
         Raises:
             Exception: raised if dataset already exists
         """
 
-        grp = self.store[p_type]
+        grp = self.store.require_group(p_type)
         if dname not in grp:
-            sa, sa_type = self.df_to_sarray(data)
-            dset = grp.create_dataset(
-                dname, data=sa, chunks=True, compression="gzip", compression_opts=4, shuffle=True, dtype=sa_type
-            )
+            if is_matrix_layout(self.store):
+                values = data.to_numpy(dtype=np.float64)
+                chunk_rows = self.settings.profiles.cache_window_rows
+                dset = create_matrix_dataset(grp, dname, values.shape, chunk_rows=chunk_rows)
+                dset[:] = values
+            else:
+                sa, sa_type = sarray if sarray is not None else self.df_to_sarray(data)
+                dset = grp.create_dataset(
+                    dname, data=sa, chunks=True, compression="gzip", compression_opts=4, shuffle=True, dtype=sa_type
+                )
             self.create_metadata(dset, start_time, resolution, data, list(data.columns), info, p_type)
+            if consolidate and is_matrix_layout(self.store):
+                consolidate_metadata(self.store)
         else:
             logger.error(f'Data set "{dname}" already exists in group "{p_type}".')
             msg = f'Data set "{dname}" already exists in group "{p_type}".'
             raise Exception(msg)
 
-    def df_to_sarray(self, df: pd.DataFrame) -> [str, str]:
+    @staticmethod
+    def df_to_sarray(df: pd.DataFrame) -> [str, str]:
         """Enables data converson
 
         Args:
@@ -281,7 +302,7 @@ class ProfileManager:
         }
         for key, value in metadata.items():
             if isinstance(value, str):
-                value_mod = np.string_(value)
+                value_mod = np.bytes_(value)
             else:
                 value_mod = value
             d_set.attrs[key] = value_mod
@@ -293,12 +314,7 @@ class ProfileManager:
             dict: values for profiles at the current time step
         """
 
-        results = {}
-        for profile_name, profile_obj in self.profiles.items():
-            result = profile_obj.update()
-            results[profile_name] = result
-            
-        return results
+        return self.engine.update()
 
     # def __del__(self):
     #     self.store.flush()
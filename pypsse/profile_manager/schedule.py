@@ -0,0 +1,111 @@
+"Profile row schedule for fixed step simulations"
+
+import numpy as np
+from loguru import logger
+
+
+class ProfileSchedule:
+    """Profile rows and interpolation weights for every step of a fixed step simulation.
+
+    Profiles sharing a start time and resolution share a time grid, so rows and weights are computed once per
+    distinct (start time, resolution) pair and gathered for each profile. Rows and weights are affine in the step
+    index, so they are computed from an integer step counter with one vectorized operation over the time grids
+    instead of being stored for every step. If the simulation time does not match the scheduled time of the current
+    step (e.g. repeated or skipped steps), the step is looked up from the time and 'get' returns None for times not
+    on the schedule.
+    """
+
+    def __init__(self, start: float, step: float, nsteps: int, stimes: np.ndarray, resolutions: np.ndarray):
+        """builds the schedule
+
+        Args:
+            start (float): simulation start time (POSIX timestamp)
+            step (float): simulation step resolution in seconds
+            nsteps (int): number of simulation steps
+            stimes (np.ndarray): profile start times (POSIX timestamps)
+            resolutions (np.ndarray): profile resolutions in seconds
+        """
+
+        grids = {}
+        self.grid_index = np.array([grids.setdefault(g, len(grids)) for g in zip(stimes, resolutions)], dtype=int)
+        grid_stimes = np.array([g[0] for g in grids])
+        grid_resolutions = np.array([g[1] for g in grids])
+
+        self.start = start
+        self.step_size = step
+        self.nsteps = nsteps
+        self.offsets = start - grid_stimes
+        self.resolutions = grid_resolutions
+        self.step = 0
+        logger.debug(f"Profile schedule created for {nsteps} steps and {len(grids)} time grids")
+
+    @classmethod
+    def from_settings(cls, settings, stimes: np.ndarray, resolutions: np.ndarray):
+        """builds the schedule from the simulation settings
+
+        Args:
+            settings (SimSettings): simulation settings
+            stimes (np.ndarray): profile start times (POSIX timestamps)
+            resolutions (np.ndarray): profile resolutions in seconds
+
+        Returns:
+            ProfileSchedule: profile schedule
+        """
+
+        step = settings.simulation_step_resolution.total_seconds()
+        nsteps = int(settings.simulation_time.total_seconds() // step) + 1
+        start = settings.start_time.astimezone(None).timestamp()
+        return cls(start, step, nsteps, stimes, resolutions)
+
+    def get_time(self, k: int) -> float:
+        """returns the scheduled time of a step (POSIX timestamp)"""
+        return self.start + k * self.step_size
+
+    def get_step(self, t: float) -> int:
+        """returns the schedule step for a time, None if the time is not on the schedule"""
+        k = self.step
+        if k < self.nsteps and abs(self.get_time(k) - t) < 1e-6:
+            return k
+        k = int(round((t - self.start) / self.step_size))
+        if 0 <= k < self.nsteps and abs(self.get_time(k) - t) < 1e-6:
+            return k
+        return None
+
+    def get_grid_indices(self, k: int) -> (np.ndarray, np.ndarray, np.ndarray):
+        """returns the rows, interpolation weights and start flags of all time grids at a step
+
+        Args:
+            k (int): schedule step
+
+        Returns:
+            np.ndarray: rows of each time grid (not clipped)
+            np.ndarray: interpolation weights of each time grid
+            np.ndarray: true if the step is not before the start time of the grid
+        """
+
+        dt = np.round(self.offsets + k * self.step_size, 6)
+        rows = np.floor(dt / self.resolutions).astype(int)
+        weights = (dt - rows * self.resolutions) / self.resolutions
+        return rows, weights, dt >= 0
+
+    def get(self, t: float) -> (np.ndarray, np.ndarray, np.ndarray):
+        """returns the scheduled rows and weights of all profiles and advances the step counter
+
+        Args:
+            t (float): simulation time (POSIX timestamp)
+
+        Returns:
+            np.ndarray: profile rows (not clipped)
+            np.ndarray: interpolation weights
+            np.ndarray: true if the time is not before the profile start time
+
+            None is returned if the time is not on the schedule.
+        """
+
+        k = self.get_step(t)
+        if k is None:
+            return None
+        self.step = k + 1
+        rows, weights, started = self.get_grid_indices(k)
+        gi = self.grid_index
+        return rows[gi], weights[gi], started[gi]
@@ -9,7 +9,17 @@ import toml
 
 from pypsse.common import DEFAULT_PROFILE_MAPPING_FILENAME, DEFAULT_PROFILE_STORE_FILENAME, PROFILES_FOLDER, DEFAULT_PROFILE_EXPORT_FILE
 from pypsse.models import SimulationSettings
+from pypsse.profile_manager.cache import to_matrix
+from pypsse.profile_manager.compaction import read_metadata
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+MAX_WINDOW_VALUES = 4_000_000
 
 
 class ProfileManagerInterface:
@@ -22,6 +32,7 @@ class ProfileManagerInterface:
         toml_file = project_path / PROFILES_FOLDER / DEFAULT_PROFILE_MAPPING_FILENAME
         self._store = h5py.File(store_file, 'r')
         self._toml_dict = toml.load(toml_file)
+        self._metadata = read_metadata(self._store)
         self._start_time = settings.simulation.start_time
         self._simulation_duration = settings.simulation.simulation_time
         self._end_time = self._start_time + self._simulation_duration
@@ -33,42 +44,142 @@ class ProfileManagerInterface:
         simulation_settiings = SimulationSettings(**simulation_settiings)
         return cls(simulation_settiings)
 
-    def get_profiles(self) -> list:
-        all_datasets = []
+    def _get_columns(self) -> list:
+        """returns one entry per mapped object: (profile path, P column, Q column, multiplier, normalize)"""
+        columns = []
         for model_type, model_info in self._toml_dict.items():
             for profile_id, model_maps in model_info.items():
                 for model_map in model_maps:
                     bus_id : str = model_map["bus"]
                     model_id : str = model_map["id"]
-                    mult : float = model_map.get("multiplier")
-                    norm: True = model_map.get("normalize")
-                    dataset = self._store[f"{model_type}/{profile_id}"]
-                    data = np.array(np.array(dataset).tolist())
-              
-                    if norm:
-                        data_max = np.array(dataset.attrs["max"])
-                        data = data / data_max
-                    if mult:
-                        data = data * mult
-
-                    data = pd.DataFrame(data)                    
-                    even_sum = data.iloc[:, ::2].sum(axis=1)
-                    odd_sum = data.iloc[:, 1::2].sum(axis=1)
-                    data = [even_sum, odd_sum]    
-                    final_df = pd.concat(data, axis=1)
-                    final_df.columns = [f"{model_type}_{model_id}_{bus_id}_P", f"{model_type}_{model_id}_{bus_id}_Q"]
-                    
-                    start_time = str(dataset.attrs["sTime"].decode('utf-8'))
-                    end_time = str(dataset.attrs["eTime"].decode('utf-8'))
-                    timestep = timedelta(seconds=dataset.attrs["resTime"])
-                    date_range =pd.date_range(
-                        start_time, 
-                        end_time, 
-                        freq=timestep)
-                    final_df.index = date_range[:-1]
-                    filtered_df = final_df.loc[(final_df.index >= self._start_time) & (final_df.index <= self._end_time)]
-                    all_datasets.append(filtered_df)
-                    
-        final_df = pd.concat(all_datasets, axis=1)
-        final_df.to_csv(self._export_file)
-        logger.info(f"Profiles exported to {self._export_file}")
\ No newline at end of file
+                    columns.append(
+                        (
+                            f"{model_type}/{profile_id}",
+                            f"{model_type}_{model_id}_{bus_id}_P",
+                            f"{model_type}_{model_id}_{bus_id}_Q",
+                            model_map.get("multiplier"),
+                            model_map.get("normalize"),
+                        )
+                    )
+        return columns
+
+    def _get_time_index(self, path: str) -> pd.DatetimeIndex:
+        """returns the time stamps of a profile"""
+        attrs = self._metadata[path]
+        npts = self._store[path].shape[0]
+        return pd.date_range(str(attrs["sTime"]), periods=npts, freq=timedelta(seconds=attrs["resTime"]))
+
+    def _get_export_index(self, paths: list) -> pd.DatetimeIndex:
+        """returns the union of the profile time stamps within the simulation window"""
+        index = pd.DatetimeIndex([])
+        grids = {}
+        for path in paths:
+            key = (str(self._metadata[path]["sTime"]), self._metadata[path]["resTime"], self._store[path].shape[0])
+            grids.setdefault(key, path)
+        for path in grids.values():
+            time_index = self._get_time_index(path)
+            time_index = time_index[(time_index >= self._start_time) & (time_index <= self._end_time)]
+            index = index.union(time_index)
+        return index
+
+    def _read_window(self, path: str, window: pd.DatetimeIndex) -> (np.ndarray, np.ndarray):
+        """reads the profile rows for a window of time stamps with a single hyperslab selection
+
+        Returns:
+            np.ndarray: profile rows (window, columns), NaN where the profile has no value
+            np.ndarray: true for time stamps with a profile value
+        """
+        attrs = self._metadata[path]
+        dataset = self._store[path]
+        offsets = (window - pd.Timestamp(str(attrs["sTime"]))).total_seconds().to_numpy() / attrs["resTime"]
+        rows = np.rint(offsets).astype(int)
+        valid = np.isclose(offsets, rows) & (rows >= 0) & (rows < dataset.shape[0])
+        if not valid.any():
+            return None, valid
+        first, last = rows[valid].min(), rows[valid].max()
+        data = to_matrix(dataset[first : last + 1])
+        values = np.full((len(window), data.shape[1]), np.nan)
+        values[valid] = data[rows[valid] - first]
+        return values, valid
+
+    def get_profiles(self, export_format: str = "csv", window_rows: int = 1000) -> Path:
+        """exports all mapped profiles within the simulation window
+
+        Profiles are read and written one window of time stamps at a time, so memory use is bound by the window
+        size and the number of mapped objects, not by the length or number of stored profiles.
+
+        Args:
+            export_format (str, optional): export format, 'csv' or 'parquet'. Defaults to "csv".
+            window_rows (int, optional): maximum number of time stamps per window. Defaults to 1000.
+
+        Returns:
+            Path: path to the exported file
+        """
+        columns = self._get_columns()
+        paths = {}
+        for j, column in enumerate(columns):
+            paths.setdefault(column[0], []).append(j)
+        names = [name for c in columns for name in c[1:3]]
+        index = self._get_export_index(paths)
+        window_rows = max(1, min(window_rows, MAX_WINDOW_VALUES // max(len(names), 1)))
+        export_file = self._export_file.with_suffix(f".{export_format}")
+
+        writer = self._create_writer(export_file, export_format)
+        try:
+            for start in range(0, max(len(index), 1), window_rows):
+                window = index[start : start + window_rows]
+                block = np.full((len(window), len(names)), np.nan)
+                for path, column_ids in paths.items():
+                    values, valid = self._read_window(path, window)
+                    if values is None:
+                        continue
+                    data_max = np.array(self._metadata[path]["max"])
+                    for j in column_ids:
+                        _, _, _, mult, norm = columns[j]
+                        data = values[valid]
+                        if norm:
+                            data = data / data_max
+                        if mult:
+                            data = data * mult
+                        block[valid, 2 * j] = data[:, ::2].sum(axis=1)
+                        block[valid, 2 * j + 1] = data[:, 1::2].sum(axis=1)
+                writer(pd.DataFrame(block, index=window, columns=names))
+        finally:
+            # closes the export file, also if a window fails
+            writer(None)
+        logger.info(f"Profiles exported to {export_file}")
+        return export_file
+
+    def _create_writer(self, export_file: Path, export_format: str):
+        """returns a function that appends a data frame to the export file (None closes the file)"""
+        if export_format == "parquet":
+            if pq is None:
+                msg = "Parquet export requires pyarrow. Use 'pip install NREL-pypsse[parquet]' to install it"
+                raise ImportError(msg)
+            state = {"writer": None}
+
+            def write(df: pd.DataFrame):
+                if df is None:
+                    if state["writer"] is not None:
+                        state["writer"].close()
+                    return
+                table = pa.Table.from_pandas(df.rename_axis("timestamp").reset_index(), preserve_index=False)
+                if state["writer"] is None:
+                    state["writer"] = pq.ParquetWriter(export_file, table.schema)
+                state["writer"].write_table(table)
+
+            return write
+        elif export_format == "csv":
+            handle = open(export_file, "w", newline="")
+            state = {"header": True}
+
+            def write(df: pd.DataFrame):
+                if df is None:
+                    handle.close()
+                    return
+                df.to_csv(handle, header=state["header"])
+                state["header"] = False
+
+            return write
+        msg = f"Invalid export format '{export_format}', valid formats are 'csv' and 'parquet'"
+        raise ValueError(msg)
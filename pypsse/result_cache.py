@@ -0,0 +1,191 @@
+"Persistent cache of contingency results keyed by case fingerprint"
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def hash_files(paths: list) -> str:
+    """returns a content hash of a list of files. Missing (None) paths are hashed as empty entries
+
+    Args:
+        paths (list): file paths
+
+    Returns:
+        str: sha256 hex digest
+    """
+
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(b"\0")
+        if path is None:
+            continue
+        with open(path, "rb") as f:
+            for block in iter(lambda f=f: f.read(HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def to_json_value(value):
+    """converts numpy scalars in a result row to json serializable values"""
+    if isinstance(value, np.generic):
+        return value.item()
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+def get_result_key(fingerprint: str, contingencies_: object, export_variables: dict) -> str:
+    """returns the cache key of a contingency case
+
+    Args:
+        fingerprint (str): content hash of the case, dyr and settings files
+        contingencies_ (Contingencies): contingency case
+        export_variables (dict): settings that define the exported results
+
+    Returns:
+        str: sha256 hex digest
+    """
+
+    data = {
+        "fingerprint": fingerprint,
+        "contingencies": contingencies_.model_dump(mode="json"),
+        "export_variables": export_variables,
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class ResultCache:
+    """On disk cache of result rows stored in a SQLite database.
+
+    Every row is stored under a key that combines the case fingerprint, the contingency definition and the export
+    variables, so a changed case, contingency or result definition never reuses a stale row. The total size of the
+    stored rows is bounded, and the least recently used rows are evicted once 'max_size_mb' is exceeded.
+    """
+
+    def __init__(self, path: Path, max_size_mb: float = 512.0):
+        """opens (or creates) the cache
+
+        Args:
+            path (Path): path to the cache database
+            max_size_mb (float, optional): maximum size of the stored rows in MB. Defaults to 512.0.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.connection = sqlite3.connect(str(self.path))
+        with self.connection:
+            self.connection.execute(
+                """CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    case_file TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )"""
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS last_access_index ON results (last_access)")
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def get_size(self) -> int:
+        """returns the total size of the stored rows in bytes"""
+        return self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def get_many(self, keys: list) -> dict:
+        """returns the cached rows for a list of keys and marks them as recently used
+
+        Args:
+            keys (list): cache keys
+
+        Returns:
+            dict: mapping of cached keys to result rows, keys not in the cache are omitted
+        """
+
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+        # stay below the SQLite limit on query parameters
+        for start in range(0, len(unique_keys), 500):
+            batch = unique_keys[start : start + 500]
+            query = f"SELECT key, value FROM results WHERE key IN ({','.join('?' * len(batch))})"  # noqa: S608
+            found.update({key: json.loads(value) for key, value in self.connection.execute(query, batch)})
+        if found:
+            now = time.time()
+            with self.connection:
+                self.connection.executemany(
+                    "UPDATE results SET last_access = ? WHERE key = ?", [(now, key) for key in found]
+                )
+        return found
+
+    def put_many(self, case_file: Path, rows: dict):
+        """stores result rows and evicts least recently used rows if the cache is full
+
+        Args:
+            case_file (Path): case the rows were computed for (used for invalidation)
+            rows (dict): mapping of cache keys to result rows
+        """
+
+        now = time.time()
+        records = []
+        for key, row in rows.items():
+            value = json.dumps(row, default=to_json_value)
+            records.append((key, str(Path(case_file).resolve()), value, len(value), now))
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)", records)
+        self.evict()
+
+    def evict(self) -> int:
+        """removes least recently used rows until the cache fits its size limit
+
+        Returns:
+            int: number of rows removed
+        """
+
+        excess = self.get_size() - self.max_size
+        if excess <= 0:
+            return 0
+        removed = 0
+        keys = []
+        cursor = self.connection.execute("SELECT key, size FROM results ORDER BY last_access")
+        for key, size in cursor:
+            if removed >= excess:
+                break
+            keys.append((key,))
+            removed += size
+        cursor.close()
+        with self.connection:
+            self.connection.executemany("DELETE FROM results WHERE key = ?", keys)
+        logger.debug(f"{len(keys)} cached results evicted")
+        return len(keys)
+
+    def invalidate(self, case_file: Path = None) -> int:
+        """removes all rows, or the rows of a case
+
+        Args:
+            case_file (Path, optional): case to invalidate. Defaults to None (all rows).
+
+        Returns:
+            int: number of rows removed
+        """
+
+        with self.connection:
+            if case_file is None:
+                cursor = self.connection.execute("DELETE FROM results")
+            else:
+                cursor = self.connection.execute(
+                    "DELETE FROM results WHERE case_file = ?", (str(Path(case_file).resolve()),)
+                )
+        self.connection.execute("VACUUM")
+        logger.info(f"{cursor.rowcount} cached results invalidated")
+        return cursor.rowcount
+
+    def close(self):
+        """closes the cache database"""
+        self.connection.close()
@@ -1,13 +1,155 @@
 import datetime
-from typing import Union
+from typing import Callable, Union
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
 from pypsse.common import EXPORTS_FOLDER, MAPPED_CLASS_NAMES
+from pypsse.data_writers.async_writer import AsyncDataWriter
 from pypsse.data_writers.data_writer import DataWriter
 from pypsse.enumerations import BulkWriteModes, StreamedWriteModes
 from pypsse.models import ExportAssetTypes, ModelTypes, SimulationSettings, ExportFileOptions
+from pypsse.result_frame import ResultVector
+
+
+class ResultBuffer:
+    """Preallocated 2-D storage for a single result variable (rows are time steps, columns are elements).
+
+    Rows are allocated up front and the buffer grows geometrically if more steps are stored (e.g. HELICS
+    iterations). Columns are added when new element labels appear. Missing values are tracked in a separate mask,
+    so integer results keep an integer data type and are exported as '1', not '1.0'.
+    """
+
+    def __init__(self, rows: int):
+        """creates a result buffer
+
+        Args:
+            rows (int): number of time steps to preallocate
+        """
+        self.capacity = max(int(rows), 1)
+        self.labels = []
+        self.index = {}
+        self.values = None
+        self.valid = None
+        self.row = 0
+        self.vector_columns = (None, np.zeros(0, dtype=int))
+
+    def fill_value(self, dtype):
+        dtype = np.dtype(dtype)
+        if dtype == object:
+            return None
+        return 0 if dtype == np.int64 else np.nan
+
+    def add_columns(self, labels: list, data: dict):
+        """adds columns for new element labels
+
+        Args:
+            labels (list): new element labels
+            data (dict): mapping of element labels to values used to select the data type
+        """
+
+        if self.values is None:
+            if isinstance(data, ResultVector):
+                dtype = data.values.dtype
+            else:
+                first = next((v for v in data.values() if v is not None), None)
+                dtype = ResultVector.get_dtype(first)
+            self.values = np.full((self.capacity, 0), self.fill_value(dtype), dtype=dtype)
+            self.valid = np.zeros((self.capacity, 0), dtype=bool)
+        dtype = self.values.dtype
+        columns = np.full((self.values.shape[0], len(labels)), self.fill_value(dtype), dtype=dtype)
+        self.values = np.concatenate([self.values, columns], axis=1)
+        self.valid = np.concatenate([self.valid, np.zeros(columns.shape, dtype=bool)], axis=1)
+        for label in labels:
+            self.index[label] = len(self.labels)
+            self.labels.append(label)
+
+    def grow(self):
+        """doubles the number of preallocated rows"""
+        dtype = self.values.dtype
+        rows = np.full(self.values.shape, self.fill_value(dtype), dtype=dtype)
+        self.values = np.concatenate([self.values, rows], axis=0)
+        self.valid = np.concatenate([self.valid, np.zeros(rows.shape, dtype=bool)], axis=0)
+        logger.debug(f"result buffer resized to {self.values.shape[0]} rows")
+
+    def upcast(self, dtype):
+        """changes the buffer data type when a value does not fit the current one"""
+        dtype = ResultVector.get_common_dtype(self.values.dtype, dtype)
+        values = self.values.astype(dtype)
+        values[~self.valid] = self.fill_value(dtype)
+        self.values = values
+
+    def append(self, data: dict):
+        """stores results from a single time step
+
+        Args:
+            data (dict): mapping of element labels to values ('ResultVector' values are copied as arrays)
+        """
+
+        if isinstance(data, ResultVector):
+            self.append_vector(data)
+            return
+
+        new_labels = [label for label in data if label not in self.index]
+        if new_labels or self.values is None:
+            self.add_columns(new_labels, data)
+        if self.row >= self.values.shape[0]:
+            self.grow()
+
+        for label, value in data.items():
+            if value is None:
+                continue
+            if self.values.dtype != object:
+                dtype = ResultVector.get_dtype(value)
+                if not np.can_cast(dtype, self.values.dtype):
+                    self.upcast(dtype)
+            column = self.index[label]
+            self.values[self.row, column] = value
+            self.valid[self.row, column] = True
+        self.row += 1
+
+    def append_vector(self, vector: ResultVector):
+        """stores results from a single time step held in a result vector
+
+        Args:
+            vector (ResultVector): result vector
+        """
+
+        cached, columns = self.vector_columns
+        if cached is not vector or len(columns) != len(vector.labels):
+            new_labels = [label for label in vector.labels if label not in self.index]
+            if new_labels or self.values is None:
+                self.add_columns(new_labels, vector)
+            columns = np.array([self.index[label] for label in vector.labels], dtype=int)
+            self.vector_columns = (vector, columns)
+        if self.row >= self.values.shape[0]:
+            self.grow()
+
+        valid = vector.valid
+        if self.values.dtype != object and not np.can_cast(vector.values.dtype, self.values.dtype):
+            self.upcast(vector.values.dtype)
+        self.values[self.row, columns[valid]] = vector.values[valid]
+        self.valid[self.row, columns[valid]] = True
+        self.row += 1
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """returns stored results as a data frame. Integer columns with missing values use the nullable 'Int64'
+        data type
+
+        Returns:
+            pd.DataFrame: stored results
+        """
+        if self.values is None:
+            return pd.DataFrame()
+        values = self.values[: self.row]
+        valid = self.valid[: self.row]
+        if values.dtype != np.int64 or valid.all():
+            return pd.DataFrame(values, columns=self.labels)
+        columns = {}
+        for i, label in enumerate(self.labels):
+            columns[label] = pd.arrays.IntegerArray(values[:, i].copy(), ~valid[:, i])
+        return pd.DataFrame(columns, columns=self.labels)
 
 
 class Container:
@@ -16,12 +158,16 @@ class Container:
     BULK_WRITE_MODES = [m.value for m in BulkWriteModes]
     STREAMED_WRITE_MODES = [m.value for m in StreamedWriteModes]
 
-    def __init__(self, settings: SimulationSettings, export_settings: ExportFileOptions):
+    def __init__(
+        self, settings: SimulationSettings, export_settings: ExportFileOptions, get_result_types: Callable = None
+    ):
         """Sets up the result container object
 
         Args:
             settings (SimulationSettings): _description_
             export_settings (ExportAssetTypes): _description_
+            get_result_types (Callable, optional): returns the value types of the export variables, used to type
+                the hdf5 datasets and parquet columns. Defaults to None.
         """
 
         export__list = [m.value for m in ModelTypes]
@@ -44,8 +190,18 @@ class Container:
             self.settings.simulation.simulation_time.total_seconds()
             / self.settings.simulation.simulation_step_resolution.total_seconds()
         )
+        self.time_steps = time_steps
         if self.export_settings.file_format not in self.BULK_WRITE_MODES:
-            self.dataWriter = DataWriter(self.export_path, export_settings.file_format.value, time_steps,  self.export_settings.filename_prefix)
+            self.dataWriter = DataWriter(
+                self.export_path,
+                export_settings.file_format.value,
+                time_steps,
+                self.export_settings.filename_prefix,
+                self.export_settings,
+                get_result_types(self.export_vars) if get_result_types else None,
+            )
+            if self.export_settings.write_buffer.background_thread:
+                self.dataWriter = AsyncDataWriter(self.dataWriter, self.export_settings.write_buffer.queue_size)
 
     def update_export_variables(self, params: Union[ExportAssetTypes, dict]) -> dict:
         """Updates the container with current system state.
@@ -104,29 +260,29 @@ class Container:
         if self.export_settings.file_format not in self.BULK_WRITE_MODES:
             self.dataWriter.write(time, bus_data, has_converged)
         else:
-            for variable_name, _ in bus_data.items():
-                if not isinstance(self.results[f"{variable_name}"], pd.DataFrame):
-                    self.results[f"{variable_name}"] = pd.DataFrame(bus_data[variable_name], index=[0])
-                else:
-                    df1 = self.results[f"{variable_name}"]
-                    df2 = pd.DataFrame.from_dict([bus_data[variable_name]])
-                    concatenated = pd.concat([df1, df2])
-                    self.results[f"{variable_name}"] = concatenated
+            for variable_name, data in bus_data.items():
+                if not isinstance(self.results.get(variable_name), ResultBuffer):
+                    self.results[variable_name] = ResultBuffer(self.time_steps)
+                self.results[variable_name].append(data)
         logger.debug("result container updated")
 
     def export_results(self):
         """exports all results stored to an external file"""
 
-        if self.export_settings.file_format in self.BULK_WRITE_MODES:
-            for df_name, df in self.results.items():
+        if self.export_settings.file_format not in self.BULK_WRITE_MODES:
+            self.dataWriter.close_store()
+        else:
+            for df_name, buffer in self.results.items():
+                if not isinstance(buffer, ResultBuffer):
+                    continue
+                df = buffer.to_dataframe()
                 export_path = (
                     self.settings.simulation.project_path
                     / EXPORTS_FOLDER
                     / f'{df_name}.{self.export_settings.file_format}'
                 )
                 if self.export_settings.file_format == BulkWriteModes.CSV:
-                    if isinstance(df, pd.DataFrame):
-                        df.to_csv(export_path)
+                    df.to_csv(export_path)
                 elif self.export_settings.file_format == BulkWriteModes.PKL:
                     df.to_pickle(export_path)
                 logger.info(f"results exported to {export_path}")
@@ -0,0 +1,264 @@
+"Columnar container for per time step simulation results"
+
+from collections.abc import MutableMapping
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+
+class ResultVector(MutableMapping):
+    """Label index and preallocated value vector for a single 'Class_VARIABLE' result.
+
+    The vector is a mutable mapping of element labels to values, so readers write results into it the same way
+    they write into a dictionary, but values are stored in place in a NumPy array. The label index only grows when
+    a new element appears. Values start with the narrowest type (int64) and are widened (int -> float -> complex
+    -> object) only when a value does not fit.
+    """
+
+    def __init__(self, labels: list = (), dtype=np.int64):
+        """creates a result vector
+
+        Args:
+            labels (list, optional): element labels. Defaults to ().
+            dtype (optional): numpy data type of the values. Defaults to np.int64.
+        """
+        self.labels = []
+        self.index = {}
+        self.buffer = np.zeros(max(len(labels), 1), dtype=dtype)
+        self.valid_buffer = np.zeros(len(self.buffer), dtype=bool)
+        self.present_buffer = np.zeros(len(self.buffer), dtype=bool)
+        for label in labels:
+            self.add_label(label)
+
+    @property
+    def values(self) -> np.ndarray:
+        """value of every label (undefined where 'valid' is false)"""
+        return self.buffer[: len(self.labels)]
+
+    @property
+    def valid(self) -> np.ndarray:
+        """true for labels with a value in the current step"""
+        return self.valid_buffer[: len(self.labels)]
+
+    @property
+    def present(self) -> np.ndarray:
+        """true for labels written in the current step (a value or None)"""
+        return self.present_buffer[: len(self.labels)]
+
+    @staticmethod
+    def get_dtype(value) -> type:
+        """returns the vector data type for a value
+
+        Args:
+            value: result value
+
+        Returns:
+            type: numpy data type
+        """
+
+        if isinstance(value, (bool, np.bool_)):
+            return object
+        if isinstance(value, (complex, np.complexfloating)):
+            return np.complex128
+        if isinstance(value, (int, np.integer)):
+            return np.int64
+        if isinstance(value, (float, np.floating)):
+            return np.float64
+        return object
+
+    @staticmethod
+    def get_common_dtype(current: type, dtype: type) -> type:
+        """returns the data type that holds values of both data types (int -> float -> complex -> object)
+
+        Args:
+            current (type): current data type
+            dtype (type): data type of the new value
+
+        Returns:
+            type: numpy data type
+        """
+
+        numeric = [np.dtype(np.int64), np.dtype(np.float64), np.dtype(np.complex128)]
+        current, dtype = np.dtype(current), np.dtype(dtype)
+        if current in numeric and dtype in numeric:
+            return max(current, dtype, key=numeric.index).type
+        return object
+
+    def add_label(self, label: str) -> int:
+        """adds an element label, doubling the preallocated vectors if required
+
+        Args:
+            label (str): element label
+
+        Returns:
+            int: position of the label
+        """
+
+        i = len(self.labels)
+        if i >= len(self.buffer):
+            self.buffer = np.concatenate([self.buffer, np.zeros(len(self.buffer), dtype=self.buffer.dtype)])
+            self.valid_buffer = np.concatenate([self.valid_buffer, np.zeros(len(self.valid_buffer), dtype=bool)])
+            self.present_buffer = np.concatenate(
+                [self.present_buffer, np.zeros(len(self.present_buffer), dtype=bool)]
+            )
+        self.labels.append(label)
+        self.index[label] = i
+        return i
+
+    def upcast(self, dtype: type):
+        """changes the vector data type when a value does not fit the current one
+
+        Args:
+            dtype (type): data type of the new value
+        """
+
+        self.buffer = self.buffer.astype(self.get_common_dtype(self.buffer.dtype, dtype))
+
+    def reset(self):
+        """marks all labels as not written, called at the start of a time step"""
+        self.valid_buffer[:] = False
+        self.present_buffer[:] = False
+
+    def fill(self, data: dict):
+        """fills the vector in place from a mapping of labels to values
+
+        Args:
+            data (dict): mapping of element labels to values
+        """
+
+        self.reset()
+        for label, value in data.items():
+            self[label] = value
+
+    def __setitem__(self, label: str, value):
+        i = self.index.get(label)
+        if i is None:
+            i = self.add_label(label)
+        self.present_buffer[i] = True
+        if value is None:
+            self.valid_buffer[i] = False
+            return
+        if self.buffer.dtype != object and not np.can_cast(self.get_dtype(value), self.buffer.dtype):
+            self.upcast(self.get_dtype(value))
+        self.buffer[i] = value
+        self.valid_buffer[i] = True
+
+    def __getitem__(self, label: str):
+        i = self.index[label]
+        if not self.present_buffer[i]:
+            raise KeyError(label)
+        if not self.valid_buffer[i]:
+            return None
+        value = self.buffer[i]
+        return value if self.buffer.dtype == object else value.item()
+
+    def __delitem__(self, label: str):
+        i = self.index[label]
+        if not self.present_buffer[i]:
+            raise KeyError(label)
+        self.present_buffer[i] = False
+        self.valid_buffer[i] = False
+
+    def __iter__(self):
+        present = self.present_buffer
+        return (label for i, label in enumerate(self.labels) if present[i])
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.present))
+
+    def to_dict(self) -> dict:
+        """returns the vector as a mapping of labels to values (None for missing values)"""
+        values = self.values.tolist()
+        valid = self.valid
+        return {label: values[i] if valid[i] else None for i, label in enumerate(self.labels) if self.present[i]}
+
+
+class ResultFrame(MutableMapping):
+    """Columnar alternative to the nested result dictionaries returned by 'read_subsystems'.
+
+    Each 'Class_VARIABLE' key owns a 'ResultVector' that is reused every time step. The frame is passed to
+    'read_subsystems', and the readers write values directly into the preallocated vectors instead of building
+    nested dictionaries. Consumers can iterate the frame as a mapping of keys to {label: value} mappings, or use
+    the 'values' / 'valid' arrays of the vectors directly.
+    """
+
+    def __init__(self):
+        """creates an empty result frame"""
+        self.vectors = {}
+        self.keys_written = {}
+
+    def begin(self) -> "ResultFrame":
+        """starts a new time step. Vectors are kept, but all keys and labels are marked as not written
+
+        Returns:
+            ResultFrame: the frame
+        """
+
+        for vector in self.vectors.values():
+            vector.reset()
+        self.keys_written.clear()
+        return self
+
+    def setdefault(self, key: str, default=None) -> ResultVector:  # noqa: ARG002
+        """returns the vector of a key, creating it if required. The default is ignored, vectors are always used
+
+        Args:
+            key (str): 'Class_VARIABLE' key
+            default (optional): unused, kept for dictionary compatibility. Defaults to None.
+
+        Returns:
+            ResultVector: result vector
+        """
+
+        vector = self.vectors.get(key)
+        if vector is None:
+            vector = ResultVector()
+            self.vectors[key] = vector
+            logger.debug(f"Result vector '{key}' created")
+        self.keys_written[key] = None
+        return vector
+
+    def __setitem__(self, key: str, data: dict):
+        vector = self.setdefault(key)
+        if data is not vector:
+            vector.fill(data)
+
+    def __getitem__(self, key: str) -> ResultVector:
+        if key not in self.keys_written:
+            raise KeyError(key)
+        return self.vectors[key]
+
+    def __delitem__(self, key: str):
+        del self.keys_written[key]
+        self.vectors[key].reset()
+
+    def __iter__(self):
+        return iter(self.keys_written)
+
+    def __len__(self) -> int:
+        return len(self.keys_written)
+
+    def to_dict(self) -> dict:
+        """returns the frame as nested dictionaries
+
+        Returns:
+            dict: mapping of 'Class_VARIABLE' keys to {label: value} dictionaries
+        """
+        return {key: self.vectors[key].to_dict() for key in self.keys_written}
+
+    def to_pandas(self) -> pd.DataFrame:
+        """returns the frame as a data frame with element labels as index and result keys as columns
+
+        Returns:
+            pd.DataFrame: simulation results
+        """
+
+        columns = {}
+        for key in self.keys_written:
+            vector = self.vectors[key]
+            present = vector.present
+            values = vector.values.astype(object)
+            values[~vector.valid] = None
+            columns[key] = pd.Series(values[present], index=np.array(vector.labels, dtype=object)[present])
+        return pd.DataFrame(columns)
@@ -46,7 +46,9 @@ from pypsse.parsers import gic_parser as gp
 from pypsse.parsers import reader as rd
 from pypsse.profile_manager.profile_store import ProfileManager
 from pypsse.result_container import Container
+from pypsse.result_frame import ResultFrame
 from pypsse.models import Contingencies
+from pypsse.modes.snapshots import BASE_SNAPSHOT
 from pypsse.enumerations import PSSE_VERSIONS
 
 USING_NAERM = 0
@@ -195,6 +197,7 @@ class Simulator:
         )
 
         self.contingencies = self.build_contingencies()
+        self.contingency_schedule = c.ContingencyScheduler(self.contingencies)
 
         if self.settings.helics and self.settings.helics.cosimulation_mode:
             if self.settings.simulation.simulation_mode in [
@@ -221,7 +224,8 @@ class Simulator:
         else:
             self.network_graph = None
 
-        self.results = Container(self.settings, self.export_settings)
+        self.results = Container(self.settings, self.export_settings, self.sim.get_result_types)
+        self.result_frame = ResultFrame() if self.export_settings.columnar_results else None
         self.exp_vars = self.results.get_export_variables()
         self.inc_time = True
 
@@ -229,6 +233,8 @@ class Simulator:
         """Initializes the model"""
 
         self.sim.init(self.bus_subsystems)
+        if self.settings.snapshots.capture_base_case:
+            self.sim.snapshots.capture(BASE_SNAPSHOT)
 
         if self.settings.simulation.use_profile_manager:
             self.pm = ProfileManager(self.sim, self.settings)
@@ -337,6 +343,8 @@ class Simulator:
                 if t >= total_simulation_time:
                     break
 
+            self.sim.update_filter.log_statistics()
+            self.sim.snapshots.close()
             self.psse.pssehalt_2()
             if not self.export_settings.export_results_using_channels:
                 self.results.export_results()
@@ -404,16 +412,18 @@ class Simulator:
             t (float): simulation time in seconds
 
         Returns:
-            dict: simulation reults from the current time step
+            dict: simulation reults from the current time step ('ResultFrame' if columnar results are enabled)
         """
 
+        # with columnar results enabled the readers write directly into the preallocated vectors of the frame
+        results = self.result_frame.begin() if self.result_frame is not None else None
         if self.export_settings.defined_subsystems_only:
             curr_results = self.sim.read_subsystems(
-                self.exp_vars, self.all_subsysten_buses
+                self.exp_vars, self.all_subsysten_buses, results=results
             )
         else:
             curr_results = self.sim.read_subsystems(
-                self.exp_vars, self.raw_data.buses
+                self.exp_vars, self.raw_data.buses, results=results
             )
 
         if not USING_NAERM:
@@ -506,6 +516,7 @@ class Simulator:
         """
         contingencies = c.build_contingencies(self.psse, contigencies)
         self.contingencies.extend(contingencies)
+        self.contingency_schedule.add(contingencies)
 
     def update_contingencies(self, t: float):
         """Updates contingencies during the simualtion run
@@ -514,8 +525,9 @@ class Simulator:
             t (float): simulation time in seconds
         """
 
-        for contingency in self.contingencies:
-            contingency.update(t)
+        # faults and trips only change element status, the element index (built from flag 4 arrays that include
+        # out of service elements) stays valid
+        self.contingency_schedule.update(t)
 
     def force_psse_halt(self):
         """forces cleaup of pypss imort"""
@@ -15,6 +15,7 @@ import random
 import numpy as np
 from loguru import logger
 
+from pypsse.modes.snapshots import SnapshotManager
 from pypsse.utils.dc2ac.helper_functions import PowerFlowData
 
 
@@ -31,8 +32,16 @@ class DC2ACconverter:
         self._i = psse._i
         self._s = psse._s
         self.converged = False
+        # intermediate cases are restored repeatedly and must never be evicted
+        self.snapshots = SnapshotManager(psse, max_snapshots=None)
 
     def run(self):
+        try:
+            self.convert()
+        finally:
+            self.snapshots.close()
+
+    def convert(self):
         self.pfd = PowerFlowData(self.psse)  # original power flow data
         self.pfdt = PowerFlowData(self.psse)
         self.all_subs = self.get_bus_list()
@@ -66,14 +75,14 @@ class DC2ACconverter:
                 return
 
             # try to approach the target loading
-            step2_tempcase = self.save_raw(4, 2)
+            step2_tempcase = self.snapshots.capture("step2")
             inc_cur, inc_target, inc_step = self.approach_target_loading(dec_perc, step2_tempcase)  ## Step 5
 
             # Recover the original loading and dispatch
             if inc_cur >= inc_target:
                 solved_flag_1st = 0
                 # recover loading
-                self.psse.read(0, step2_tempcase)  # saveRaw outputs .raw files only
+                self.snapshots.restore(step2_tempcase)
                 self.pfdt.getdata(self.psse)
 
                 self.psse.scal_2(0, 1, 1, [0, 0, 0, 0, 0], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
@@ -101,7 +110,7 @@ class DC2ACconverter:
                     self.converged = True
                     return
                 else:
-                    self.psse.rawd_2(0, 1, [1, 1, 1, 0, 0, 0, 0], 0, step2_tempcase)
+                    self.snapshots.capture(step2_tempcase)
 
                 # recover dispatch
                 if solved_flag == 0:
@@ -111,7 +120,7 @@ class DC2ACconverter:
                         if self.pfd.gen_status[i] != 1 or abs(self.pfd.bus_type[busi]) != 2:
                             continue
 
-                        self.psse.read(0, step2_tempcase)
+                        self.snapshots.restore(step2_tempcase)
                         self.psse.machine_chng_2(
                             self.pfd.gen_bus[i],
                             self.pfd.gen_id[i],
@@ -140,7 +149,7 @@ class DC2ACconverter:
                         solved_flag = self.if_solved(self.psse, 1, 5)
 
                         if solved_flag == 0:
-                            self.psse.rawd_2(0, 1, [1, 1, 1, 0, 0, 0, 0], 0, step2_tempcase)  ## Possibility b
+                            self.snapshots.capture(step2_tempcase)  ## Possibility b
                         else:
                             logger.info("Should not see this!!!\n")
                             pass
@@ -148,7 +157,7 @@ class DC2ACconverter:
             else:
                 inc_cur = inc_cur - inc_step
                 perc = str(inc_cur / inc_target * 100)[0:7]
-                self.psse.read(0, step2_tempcase)
+                self.snapshots.restore(step2_tempcase)
 
                 self.save_raw(3, 2.1, perc)
 
@@ -164,7 +173,7 @@ class DC2ACconverter:
         w_q_q = []
         if solved_flag_1st == 0:
             logger.info("PF (w added gens) converged.")
-            step3_tempcase = self.save_raw(4, 3)
+            step3_tempcase = self.snapshots.capture("step3")
 
             # try to gradually remove all added generators
             # gen data from PSSE
@@ -191,7 +200,7 @@ class DC2ACconverter:
             ad_genbus, ad_gen_q = self.get_q_of_added_generator(step3_tempcase, ad_pq_busid, ad_pv_busid)
 
             # voltage adjustment to remove more added gen (directly solved by NR with a better initial)
-            step4_tempcase = self.save_raw(5)
+            step4_tempcase = self.snapshots.capture("step4")
             q_remote, bus_remote, v_set_remote = self.remove_geni_adj_vi(ad_genbus, ad_gen_q, step4_tempcase)
 
             if len(bus_remote) == 0:
@@ -201,7 +210,7 @@ class DC2ACconverter:
                 return
 
             # near-by PV bus voltage adjustment to remove even more added gen
-            step5_tempcase = self.save_raw(5)
+            step5_tempcase = self.snapshots.capture("step5")
             self.pfdt.getdata()
 
             v_set = []
@@ -438,7 +447,7 @@ class DC2ACconverter:
 
         pfdt = PowerFlowData(self.psse)
 
-        self.psse.read(0, step2_tempcase)
+        self.snapshots.restore(step2_tempcase)
         pfdt.getdata(self.psse)
 
         for i in range(len(pfdt.gen_bus)):
@@ -451,7 +460,7 @@ class DC2ACconverter:
 
         while (inc_cur < inc_target) & (inc_step_mw > inc_step_mw_min):
             inc_cur = inc_cur + inc_step
-            self.psse.read(0, step2_tempcase)
+            self.snapshots.restore(step2_tempcase)
 
             gen_mw = gen_mw_pre * inc_cur
             load_mw = load_mw_pre * inc_cur
@@ -488,7 +497,7 @@ class DC2ACconverter:
 
             solved_flag = self.if_solved(1, 5)
             if solved_flag == 0:
-                self.psse.rawd_2(0, 1, [1, 1, 1, 0, 0, 0, 0], 0, step2_tempcase)
+                self.snapshots.capture(step2_tempcase)
             else:
                 inc_cur = inc_cur - inc_step
                 inc_step = inc_step / 2
@@ -500,14 +509,14 @@ class DC2ACconverter:
         # remove added gen on original pv bus
         n_ct_pv = 0
         for ii in ad_pv_genbus:
-            self.psse.read(0, step3_tempcase)
+            self.snapshots.restore(step3_tempcase)
             self.psse.purgmac(ii, r"""ad""")
 
             solved_flag = self.ifsolved(self.psse, 1, 3)
 
             if solved_flag == 0:
                 n_ct_pv = n_ct_pv + 1
-                self.psse.rawd_2(0, 1, [1, 1, 1, 0, 0, 0, 0], 0, step3_tempcase)
+                self.snapshots.capture(step3_tempcase)
             if solved_flag == 2:
                 break
 
@@ -523,7 +532,7 @@ class DC2ACconverter:
             if n_cur + n_step > n_max:
                 n_step = n_max - n_cur
 
-            self.psse.read(0, step3_tempcase)
+            self.snapshots.restore(step3_tempcase)
             for nn in range(n_cur, n_cur + n_step, 1):
                 ii = idx[nn]
                 self.psse.purgmac(ad_pq_genbus[ii], r"""ad""")
@@ -539,7 +548,7 @@ class DC2ACconverter:
             if solved_flag == 0:
                 n_ct_pq = n_ct_pq + n_step
                 n_cur = n_cur + n_step
-                self.psse.rawd_2(0, 1, [1, 1, 1, 0, 0, 0, 0], 0, step3_tempcase)
+                self.snapshots.capture(step3_tempcase)
             else:
                 if n_step >= 1:
                     if n_step == 2:
@@ -586,7 +595,7 @@ class DC2ACconverter:
         return ad_pq_genbus, ad_pq_gen_q, ad_pq_gen_q_abs, ad_pv_genbus, ad_pv_gen_q
 
     def get_q_of_added_generator(self, step3_tempcase, ad_pq_busid, ad_pv_busid):
-        self.psse.read(0, step3_tempcase)
+        self.snapshots.restore(step3_tempcase)
         self.psse.fnsl([0, 0, 0, 1, 1, 0, -1, 0])
         temp_genid = self.psse.amachchar(-1, 4, "ID")[1][0]
         temp_genbus = self.psse.amachint(-1, 4, "NUMBER")[1][0]
@@ -614,7 +623,7 @@ class DC2ACconverter:
         v_set_remote = []
         for busi, q_i in zip(ad_genbus, ad_gen_q):
             q = []
-            self.psse.read(0, step4_tempcase)
+            self.snapshots.restore(step4_tempcase)
             self.psse.plant_chng_4(busi, 0, [self._i, self._i], [1.00, self._f])
             flag = self.ifsolved(self.psse, 1, 5)
             self.pfdt.getdata(self.psse)
@@ -623,7 +632,7 @@ class DC2ACconverter:
                 idxi = idxi + 1
             q.append(self.pfdt.gen_Mvar[idxi])
 
-            self.psse.read(0, step4_tempcase)
+            self.snapshots.restore(step4_tempcase)
             self.psse.plant_chng_4(busi, 0, [self._i, self._i], [0.99, self._f])
             flag = self.ifsolved(self.psse, 1, 5)
             self.pfdt.getdata(self.psse)
@@ -632,7 +641,7 @@ class DC2ACconverter:
                 idxi = idxi + 1
             q.append(self.pfdt.gen_Mvar[idxi])
 
-            self.psse.read(0, step4_tempcase)
+            self.snapshots.restore(step4_tempcase)
             self.psse.plant_chng_4(busi, 0, [self._i, self._i], [1.01, self._f])
             flag = self.ifsolved(self.psse, 1, 5)
             self.pfdt.getdata(self.psse)
@@ -654,7 +663,7 @@ class DC2ACconverter:
                     vset = x1
                 else:
                     vset = x2
-                self.psse.read(0, step4_tempcase)
+                self.snapshots.restore(step4_tempcase)
                 self.psse.plant_chng_4(busi, 0, [self._i, self._i], [vset, self._f])
                 self.psse.fnsl([0, 0, 0, 1, 1, 0, 0, 0])
                 flag = self.ifsolved(self.psse, 1, 5)
@@ -675,7 +684,7 @@ class DC2ACconverter:
                 # step4_tempcase = saveRaw(self.psse, rawfile, 5)
             else:
                 logger.info("cannot remove gen" + str(busi))
-                self.psse.read(0, step4_tempcase)
+                self.snapshots.restore(step4_tempcase)
 
                 self.pfdt.getdata(self.psse)
                 idxi = self.pfdt.gen_bus.index(busi)
@@ -735,7 +744,7 @@ class DC2ACconverter:
 
     def remove_geni_adj_vj(self, busi, busj, pfdt, step5_tempcase, vseti):
         q = []
-        self.psse.read(0, step5_tempcase)
+        self.snapshots.restore(step5_tempcase)
         self.psse.plant_chng_4(busi, 0, [self._i, self._i], [vseti, self._f])
         self.psse.plant_chng_4(busj, 0, [self._i, self._i], [1.0, self._f])
         flag = self.ifsolved(self.psse, 1, 5)
@@ -745,7 +754,7 @@ class DC2ACconverter:
             idxi = idxi + 1
         q.append(pfdt.gen_Mvar[idxi])
 
-        self.psse.read(0, step5_tempcase)
+        self.snapshots.restore(step5_tempcase)
         self.psse.plant_chng_4(busi, 0, [self._i, self._i], [vseti, self._f])
         self.psse.plant_chng_4(busj, 0, [self._i, self._i], [1.01, self._f])
         flag = self.ifsolved(self.psse, 1, 5)
@@ -760,7 +769,7 @@ class DC2ACconverter:
         if a != 0:
             vset = -b / a + 0.01
 
-            self.psse.read(0, step5_tempcase)
+            self.snapshots.restore(step5_tempcase)
             self.psse.plant_chng_4(busi, 0, [self._i, self._i], [vseti, self._f])
             self.psse.plant_chng_4(busj, 0, [self._i, self._i], [vset, self._f])
             self.psse.fnsl([0, 0, 0, 1, 1, 0, 0, 0])
@@ -786,7 +795,7 @@ class DC2ACconverter:
         v_set_remote = []
         for busi, q_i in zip(ad_genbus, ad_gen_q):
             q = []
-            self.psse.read(0, step4_tempcase)
+            self.snapshots.restore(step4_tempcase)
             self.psse.plant_chng_4(busi, 0, [self._i, self._i], [1.00, self._f])
             flag = self.if_solved(1, 5)
             self.pfdt.getdata(self.psse)
@@ -795,7 +804,7 @@ class DC2ACconverter:
                 idxi = idxi + 1
             q.append(self.pfdt.gen_Mvar[idxi])
 
-            self.psse.read(0, step4_tempcase)
+            self.snapshots.restore(step4_tempcase)
             self.psse.plant_chng_4(busi, 0, [self._i, self._i], [0.99, self._f])
             flag = self.if_solved(1, 5)
             self.pfdt.getdata(self.psse)
@@ -804,7 +813,7 @@ class DC2ACconverter:
                 idxi = idxi + 1
             q.append(self.pfdt.gen_Mvar[idxi])
 
-            self.psse.read(0, step4_tempcase)
+            self.snapshots.restore(step4_tempcase)
             self.psse.plant_chng_4(busi, 0, [self._i, self._i], [1.01, self._f])
             flag = self.if_solved(1, 5)
             self.pfdt.getdata(self.psse)
@@ -826,7 +835,7 @@ class DC2ACconverter:
                     vset = x1
                 else:
                     vset = x2
-                self.psse.read(0, step4_tempcase)
+                self.snapshots.restore(step4_tempcase)
                 self.psse.plant_chng_4(busi, 0, [self._i, self._i], [vset, self._f])
                 self.psse.fnsl([0, 0, 0, 1, 1, 0, 0, 0])
                 flag = self.if_solved(1, 5)
@@ -847,7 +856,7 @@ class DC2ACconverter:
                 # step4_tempcase = self.save_raw(self.psse, rawfile, 5)
             else:
                 logger.info("cannot remove gen" + str(busi))
-                self.psse.read(0, step4_tempcase)
+                self.snapshots.restore(step4_tempcase)
 
                 self.pfdt.getdata(self.psse)
                 idxi = self.pfdt.gen_bus.index(busi)
@@ -0,0 +1,115 @@
+"Stand-in for the psspy API used by the contingency analysis tests"
+
+import copy
+import os
+import pickle
+from pathlib import Path
+
+BUSES = [101, 102, 103]
+BRANCHES = [(101, 102, "1"), (102, 103, "1"), (101, 103, "1"), (102, 103, "2")]
+state = {}
+
+
+def psseinit(n):
+    log = os.environ.get("STANDIN_PSSPY_LOG")
+    if log:
+        with open(log, "a") as f:
+            f.write(f"{os.getpid()}\n")
+    return 0
+
+
+def case(path):
+    path = Path(path)
+    # files written by 'save' are loaded, any other case file loads the base case
+    if path.exists() and path.read_bytes()[:1] == b"\x80":
+        with open(path, "rb") as f:
+            state.clear()
+            state.update(pickle.load(f))
+        return 0
+    # circuit 2 between 102 and 103 is out of service in the base case
+    state.update(bus_status={b: 1 for b in BUSES}, branch_status={b: 1 for b in BRANCHES}, machines={(101, "1"): 1})
+    state["branch_status"][(102, 103, "2")] = 0
+    state["voltages"] = {b: 1.0 for b in BUSES}
+    state["tap"] = 0.0
+    return 0
+
+
+def save(path):
+    with open(path, "wb") as f:
+        pickle.dump(copy.deepcopy(state), f)
+    return 0
+
+
+def fnsl():
+    # every solution moves a tap, so results depend on the state the case is solved from
+    state["tap"] += 0.01
+    in_service = [b for b in BRANCHES if state["branch_status"][b] and all(state["bus_status"][x] for x in b[:2])]
+    state["in_service"] = in_service
+    for bus in BUSES:
+        n = sum(bus in b[:2] for b in in_service)
+        if state["machines"][(101, "1")]:
+            v = round(1.0 - 0.03 * (2 - n) + state["tap"] - 0.02, 6)
+            state["voltages"][bus] = v * state["bus_status"][bus]
+        else:
+            state["voltages"][bus] = 0.9
+    state["solved"] = 0 if in_service else 1
+    return 0
+
+
+def solved():
+    return state["solved"]
+
+
+def abusint(sid, flag, string):
+    if string == "TYPE":
+        return 0, [[3 if b == BUSES[0] else 1 for b in BUSES]]
+    return 0, [BUSES]
+
+
+def abuscplx(sid, flag, string):
+    return 0, [[complex(state["voltages"][b]) for b in BUSES]]
+
+
+def get_branches(flag):
+    # flag 3 returns in service branches only
+    return [b for b in BRANCHES if flag != 3 or state["branch_status"][b]]  # noqa: PLR2004
+
+
+def abrnint(sid, owner, ties, flag, entry, string):
+    branches = get_branches(flag)
+    return 0, [[b[0] for b in branches], [b[1] for b in branches]]
+
+
+def abrnchar(sid, owner, ties, flag, entry, string):
+    return 0, [[b[2] for b in get_branches(flag)]]
+
+
+def abrncplx(sid, owner, ties, flag, entry, string):
+    return 0, [[complex(0.001, 0.1) for _ in get_branches(flag)]]
+
+
+def abrnreal(sid, owner, ties, flag, entry, string):
+    branches = get_branches(flag)
+    if string == ["RATE", "P"]:
+        # base case flows for 90 MW from bus 101 to bus 103
+        flows = {(101, 102, "1"): 30.0, (102, 103, "1"): 30.0, (101, 103, "1"): 60.0}
+        return 0, [[100.0 for _ in branches], [flows[b] for b in branches]]
+    n = len(state["in_service"])
+    return 0, [[60.0 * 3 / n if b in state["in_service"] else 0.0 for b in branches]]
+
+
+def dscn(ibus):
+    state["bus_status"][ibus] = 0
+    return 0
+
+
+def branch_chng_3(ibus, jbus, ckt, intgar1):
+    if (ibus, jbus, ckt) not in state["branch_status"]:
+        return 1
+    state["branch_status"][(ibus, jbus, ckt)] = intgar1
+    return 0
+
+
+def machine_chng_3(ibus, id, intgar1):  # noqa: A002
+    state["machines"][(ibus, id)] = intgar1
+    return 0
@@ -0,0 +1,58 @@
+from datetime import datetime
+
+import pytest
+
+from pypsse.data_writers.async_writer import AsyncDataWriter
+
+
+class RecordingWriter:
+    def __init__(self, fail_at=None):
+        self.rows = []
+        self.closed = False
+        self.fail_at = fail_at
+
+    def write(self, currenttime, powerflow_output, convergence):
+        if len(self.rows) == self.fail_at:
+            raise OSError("disk full")
+        self.rows.append((currenttime, powerflow_output, convergence))
+
+    def close_store(self):
+        self.closed = True
+
+
+def test_async_writer_drains_queue_on_close():
+    writer = RecordingWriter()
+    async_writer = AsyncDataWriter(writer, queue_size=2)
+    results = {"Buses_PU": {"101": 1.0}}
+    for i in range(10):
+        results["Buses_PU"]["101"] = float(i)
+        async_writer.write(datetime(2020, 1, 1), results, True)
+    async_writer.close_store()
+    assert writer.closed
+    assert [row[1]["Buses_PU"]["101"] for row in writer.rows] == [float(i) for i in range(10)]
+
+
+def test_async_writer_propagates_errors():
+    async_writer = AsyncDataWriter(RecordingWriter(fail_at=0))
+    async_writer.write(datetime(2020, 1, 1), {}, True)
+    with pytest.raises(OSError):
+        async_writer.close_store()
+
+
+def test_async_writer_errors_are_sticky():
+    writer = RecordingWriter(fail_at=1)
+    async_writer = AsyncDataWriter(writer, queue_size=1)
+    with pytest.raises(OSError):
+        for i in range(100):
+            async_writer.write(datetime(2020, 1, 1), {"Buses_PU": {"101": float(i)}}, True)
+    async_writer.thread.join(timeout=5)
+    assert not async_writer.thread.is_alive()
+    assert len(writer.rows) == 1
+
+    with pytest.raises(OSError):
+        async_writer.write(datetime(2020, 1, 1), {}, True)
+    with pytest.raises(OSError):
+        async_writer.close_store()
+    assert writer.closed
+    with pytest.raises(OSError):
+        async_writer.close_store()
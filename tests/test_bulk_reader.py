@@ -0,0 +1,53 @@
+from pypsse.modes.bulk_reader import BulkSubsystemReader
+
+
+class ArrayApi:
+    buses = {"NUMBER": [101, 102, 201], "PU": [1.01, 0.99, 1.02]}
+    loads = {"NUMBER": [101, 201], "ID": ["1 ", "2 "], "MVA": [complex(10, 2), complex(5, 1)]}
+
+    def abusint(self, sid, flag, string):
+        return 0, [self.buses[s] for s in string]
+
+    def abusreal(self, sid, flag, string):
+        return 0, [self.buses[s] for s in string]
+
+    def aloadint(self, sid, flag, string):
+        return 0, [self.loads[s] for s in string]
+
+    def aloadchar(self, sid, flag, string):
+        return 0, [self.loads[s] for s in string]
+
+    def aloadcplx(self, sid, flag, string):
+        return 0, [self.loads["MVA"] for _ in string]
+
+
+def test_bulk_reader_matches_legacy_layout():
+    reader = BulkSubsystemReader(ArrayApi())
+    quantities = {"Buses": ["PU", "FREQ"], "Loads": ["MVA"]}
+    results, handled = reader.read(quantities, ["101", "201"], {"Buses": ["PU", "FREQ"], "Loads": ["MVA"]})
+    assert handled == {"Buses": ["PU"], "Loads": ["MVA"]}
+    assert results["Buses_PU"] == {"101": 1.01, "201": 1.02}
+    assert results["Loads_MVA"] == {"101_1 ": complex(10, 2), "201_2 ": complex(5, 1)}
+
+
+class BranchArrayApi:
+    # branch 201 -> 101 has its from bus outside the subsystem
+    branches = [(101, 102, "1 ", 10.0), (201, 101, "1 ", 20.0), (201, 202, "1 ", 30.0)]
+
+    def get_rows(self, entry):
+        rows = [{"FROMNUMBER": i, "TONUMBER": j, "ID": ckt, "P": p} for i, j, ckt, p in self.branches]
+        if entry == 2:  # noqa: PLR2004
+            rows += [{"FROMNUMBER": j, "TONUMBER": i, "ID": ckt, "P": -p} for i, j, ckt, p in self.branches]
+        return rows
+
+    def abrnint(self, sid, flag, string, entry=1):
+        return 0, [[row[s] for row in self.get_rows(entry)] for s in string]
+
+    abrnchar = abrnint
+    abrnreal = abrnint
+
+
+def test_bulk_reader_includes_branches_connected_at_either_end():
+    reader = BulkSubsystemReader(BranchArrayApi())
+    results, _ = reader.read({"Branches": ["P"]}, ["101", "102"])
+    assert results["Branches_P"] == {"101_102_1 ": 10.0, "102_101_1 ": -10.0, "101_201_1 ": -20.0}
@@ -0,0 +1,93 @@
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from pypsse.contingency_analysis import ContingencyAnalysis
+from pypsse.models import BusFault, BusTrip, Contingencies, ContingencyAnalysisSettings, LineTrip, MachineTrip
+
+TESTS_PATH = Path(__file__).parent
+
+
+def get_cases():
+    return [
+        Contingencies(contingencies=[LineTrip(bus_ids=[101, 102, 1])]),
+        Contingencies(contingencies=[LineTrip(bus_ids=[101, 102, 1]), LineTrip(bus_ids=[101, 103, 1])]),
+        Contingencies(contingencies=[BusTrip(bus_id=103)]),
+        Contingencies(contingencies=[BusFault(bus_id=103)]),
+        Contingencies(contingencies=[LineTrip(bus_ids=[101, 999, 1])]),
+        Contingencies(contingencies=[MachineTrip(bus_id=101, machine_id="1")]),
+    ]
+
+
+def run(tmp_path, workers, cases=None, screening_threshold=None):
+    settings = ContingencyAnalysisSettings(
+        workers=workers,
+        psse_module="standin_psspy",
+        psse_version=None,
+        monitored_buses=[102],
+        snapshot_directory=tmp_path,
+        screening_threshold=screening_threshold,
+    )
+    return ContingencyAnalysis(tmp_path / "case.sav", settings).run(cases or get_cases())
+
+
+def test_contingency_screening(tmp_path):
+    results = run(tmp_path, 1)
+    assert list(results.index) == [0, 1, 2, 3, 4, 5]
+    assert results.loc[0, "converged"] and results.loc[0, "thermal_violations"] == 0
+    assert results.loc[0, "max_loading"] == 90.0
+    assert results.loc[1, "thermal_violations"] == 1
+    assert results.loc[1, "voltage_violations"] == 1 and results.loc[1, "violating_buses"] == "101"
+    assert results.loc[2, "V_102"] == 0.97
+    assert results.loc[2, "min_voltage"] == 0.97
+    assert not results.loc[3, "applied"] and results.loc[3, "error"] == "no steady state outage"
+    assert not results.loc[4, "applied"] and "error code 1" in results.loc[4, "error"]
+    assert results.loc[5, "min_voltage"] == 0.9 and results.loc[5, "max_loading"] == 60.0
+    # snapshots are removed once screening is complete
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_results_do_not_depend_on_case_order(tmp_path):
+    results = run(tmp_path, 1).set_index("elements")
+    reversed_results = run(tmp_path, 1, get_cases()[::-1]).set_index("elements")
+    pd.testing.assert_frame_equal(reversed_results[results.columns], results.loc[reversed_results.index])
+
+
+def test_parallel_screening_matches_serial(tmp_path, monkeypatch):
+    log = tmp_path / "workers.txt"
+    # the stand-in module must be importable in the worker processes for any start method
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join([str(TESTS_PATH), os.environ.get("PYTHONPATH", "")]))
+    monkeypatch.setenv("STANDIN_PSSPY_LOG", str(log))
+    snapshots = tmp_path / "snapshots"
+    snapshots.mkdir()
+
+    parallel = run(snapshots, 2)
+    workers = set(log.read_text().split())
+    assert workers and str(os.getpid()) not in workers
+    assert len(workers) <= 2
+
+    pd.testing.assert_frame_equal(parallel, run(snapshots, 1))
+
+
+def test_screening_simulates_only_risky_cases(tmp_path):
+    full = run(tmp_path, 1)
+    screened = run(tmp_path, 1, screening_threshold=95.0)
+    assert screened.loc[0, "estimated_loading"] == pytest.approx(90.0)
+    assert not screened.loc[0, "simulate"] and pd.isna(screened.loc[0, "converged"])
+    assert screened.loc[0, "elements"] == full.loc[0, "elements"]
+    # removing both branches of bus 101 islands it, other outages can not be screened
+    assert screened.loc[1, "islanding"]
+    assert screened.loc[1:, "simulate"].all()
+    pd.testing.assert_frame_equal(screened.loc[1:, full.columns], full.loc[1:], check_dtype=False)
+
+    everything = run(tmp_path, 1, screening_threshold=80.0)
+    assert everything["simulate"].all()
+
+
+def test_parallel_screening(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join([str(TESTS_PATH), os.environ.get("PYTHONPATH", "")]))
+    pd.testing.assert_frame_equal(
+        run(tmp_path, 2, screening_threshold=95.0), run(tmp_path, 1, screening_threshold=95.0)
+    )
@@ -0,0 +1,40 @@
+import numpy as np
+
+from pypsse.contingencies import ContingencyScheduler, build_contingencies
+from pypsse.models import BusFault, BusTrip, Contingencies, LineTrip
+
+
+class DistApi:
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda **kwargs: self.calls.append((name, kwargs.get("ibus"))) or 0
+
+
+def get_contingencies():
+    return Contingencies(
+        contingencies=[
+            BusFault(time=0.2, bus_id=101, duration=0.3),
+            BusFault(time=0.25, bus_id=102, duration=0.0),
+            BusTrip(time=0.4, bus_id=201),
+            LineTrip(time=0.1, bus_ids=[301, 302]),
+            BusFault(time=1.05, bus_id=103, duration=0.02),
+        ]
+    )
+
+
+def test_scheduler_matches_polling():
+    polled_api = DistApi()
+    polled = build_contingencies(polled_api, get_contingencies())
+    scheduled_api = DistApi()
+    scheduler = ContingencyScheduler(build_contingencies(scheduled_api, get_contingencies()))
+    assert len(scheduler) == 8
+
+    for t in np.arange(0, 1.5, 0.05):
+        polled_changed = any([contingency.update(t) for contingency in polled])
+        assert scheduler.update(t) == polled_changed
+    assert scheduled_api.calls == polled_api.calls
+    assert ("dist_bus_fault", 101) in scheduled_api.calls
+    assert ("dist_bus_fault", 102) not in scheduled_api.calls
+    assert len(scheduler) == 0
@@ -0,0 +1,38 @@
+import csv
+import gzip
+from datetime import datetime, timedelta
+
+from pypsse.data_writers.csv import CSVWriter
+from pypsse.models import WriterBufferSettings
+
+
+def write_rows(writer):
+    start = datetime(2020, 1, 1)
+    for i in range(5):
+        writer.write(start + timedelta(seconds=i), {"Buses_PU": {"101": 1.0 + i, "102": None}}, True)
+    writer.close_store()
+
+
+def test_csv_writer_appends_rows(tmp_path):
+    write_rows(CSVWriter(tmp_path, 5, "test", WriterBufferSettings(rows=2)))
+    with open(tmp_path / "test_Buses_PU.csv", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["timestamp", "convergence", "101", "102"]
+    assert len(rows) == 6
+    assert rows[5][1:] == ["True", "5.0", ""]
+
+
+def test_csv_writer_gzip(tmp_path):
+    write_rows(CSVWriter(tmp_path, 5, "test", WriterBufferSettings(rows=3), compress=True))
+    with gzip.open(tmp_path / "test_Buses_PU.csv.gz", "rt", newline="") as f:
+        rows = list(csv.reader(f))
+    assert len(rows) == 6
+    assert rows[1][2] == "1.0"
+
+
+def test_csv_writer_reports_unknown_labels(tmp_path):
+    writer = CSVWriter(tmp_path, 2, "test", WriterBufferSettings(rows=2))
+    writer.write(datetime(2020, 1, 1), {"Buses_PU": {"101": 1.0}}, True)
+    writer.write(datetime(2020, 1, 1), {"Buses_PU": {"101": 1.0, "201": 0.9}}, True)
+    writer.close_store()
+    assert writer.unknown_labels == {"Buses_PU": ["201"]}
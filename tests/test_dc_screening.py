@@ -0,0 +1,107 @@
+import pickle
+
+import numpy as np
+import pytest
+
+import pypsse.dc_screening as dc
+from pypsse.dc_screening import DCNetwork, screen_contingencies
+from pypsse.models import BusTrip, Contingencies, LineFault, LineTrip
+
+BUSES = [1, 2, 3, 4, 5, 6]
+# buses 1-5 form a meshed network, bus 6 is radial from bus 5
+BRANCHES = [(1, 2, 0.1), (1, 3, 0.2), (2, 3, 0.25), (2, 4, 0.1), (3, 4, 0.15), (4, 5, 0.05), (3, 5, 0.3), (5, 6, 0.1)]
+INJECTIONS = np.array([150.0, 20.0, -40.0, -30.0, -60.0, -40.0])
+
+
+def get_network(branches=BRANCHES, flows=None, ratings=None):
+    f, t, x = zip(*branches)
+    return DCNetwork(BUSES, f, t, x, ratings=ratings, flows=flows, slack_buses=[1])
+
+
+def get_flows(branches=BRANCHES):
+    return get_network(branches).get_ptdf() @ INJECTIONS
+
+
+def test_ptdf_matches_dc_power_flow():
+    network = get_network()
+    ptdf = network.get_ptdf()
+    assert ptdf.shape == (len(BRANCHES), len(BUSES))
+    np.testing.assert_allclose(ptdf[:, 0], 0.0)
+    flows = ptdf @ INJECTIONS
+    # flows balance the injection at every bus
+    balance = np.zeros(len(BUSES))
+    np.add.at(balance, network.from_index, flows)
+    np.add.at(balance, network.to_index, -flows)
+    np.testing.assert_allclose(balance[1:], INJECTIONS[1:], atol=1e-9)
+    # radial branch carries the load at bus 6
+    assert flows[-1] == pytest.approx(40.0)
+
+
+def test_lodf_matches_outage_resolve():
+    flows = get_flows()
+    lodf = get_network(flows=flows).get_lodf()
+    np.testing.assert_allclose(np.diag(lodf), -1.0)
+    for k in range(len(BRANCHES) - 1):
+        remaining = BRANCHES[:k] + BRANCHES[k + 1 :]
+        expected = np.insert(get_flows(remaining), k, 0.0)
+        np.testing.assert_allclose(flows + lodf[:, k] * flows[k], expected, atol=1e-9)
+    # tripping the radial branch islands bus 6
+    assert np.isnan(lodf[0, -1])
+
+
+def test_multiple_outages_match_resolve():
+    flows = get_flows()
+    network = get_network(flows=flows)
+    post = network.get_post_contingency_flows([0, 4])
+    expected = get_flows([b for k, b in enumerate(BRANCHES) if k not in [0, 4]])
+    np.testing.assert_allclose(np.delete(post, [0, 4]), expected, atol=1e-9)
+    assert post[0] == 0.0 and post[4] == 0.0
+    assert network.get_post_contingency_flows([7]) is None
+    assert network.get_post_contingency_flows([5, 6]) is None
+
+
+def test_dense_fallback_matches_sparse(monkeypatch):
+    sparse = get_network(flows=get_flows())
+    monkeypatch.setattr(dc, "sp", None)
+    dense = get_network(flows=get_flows())
+    np.testing.assert_allclose(dense.get_ptdf(), sparse.get_ptdf(), atol=1e-12)
+    np.testing.assert_allclose(dense.get_post_contingency_flows([2]), sparse.get_post_contingency_flows([2]))
+
+
+def test_islands_get_one_reference_bus():
+    network = DCNetwork([1, 2, 3, 4], [1, 3], [2, 4], [0.1, 0.1], slack_buses=[2])
+    assert network.buses[network.reference].tolist() == [2, 3]
+
+
+def test_network_can_be_pickled():
+    network = get_network(flows=get_flows())
+    copy = pickle.loads(pickle.dumps(network))
+    np.testing.assert_allclose(copy.get_post_contingency_flows([1]), network.get_post_contingency_flows([1]))
+
+
+def test_screening_selects_risky_outages():
+    flows = get_flows()
+    ratings = np.abs(flows) * 1.5
+    network = get_network(flows=flows, ratings=ratings)
+    cases = [
+        Contingencies(contingencies=[LineTrip(bus_ids=[1, 2, 1])]),
+        Contingencies(contingencies=[LineTrip(bus_ids=[3, 2, 1])]),
+        Contingencies(contingencies=[LineFault(bus_ids=[5, 6, 1], bus_trip=True)]),
+        Contingencies(contingencies=[LineFault(bus_ids=[2, 3, 1], bus_trip=False)]),
+        Contingencies(contingencies=[BusTrip(bus_id=3)]),
+        Contingencies(contingencies=[LineTrip(bus_ids=[1, 2, 2])]),
+    ]
+    results = screen_contingencies(network, cases, threshold=100.0)
+    expected = [network.get_loading(network.get_post_contingency_flows([k])).max() for k in [0, 2]]
+    assert results.loc[0, "estimated_loading"] == pytest.approx(expected[0])
+    assert results.loc[1, "estimated_loading"] == pytest.approx(expected[1])
+    assert results.loc[0, "simulate"] and results.loc[0, "critical_branch"] == "3_4_1"
+    # branches are matched in either direction, the outage of 2-3 stays below the threshold
+    assert not results.loc[1, "simulate"]
+    assert results.loc[2, "islanding"] and results.loc[2, "simulate"]
+    # faults without a trip, bus trips and unknown branches can not be screened
+    assert results.loc[[3, 4, 5], "simulate"].all()
+    # cases are ranked by estimated loading, cases without an estimate first
+    ranked = results[results["estimated_loading"].notna()]
+    assert list(ranked["estimated_loading"]) == sorted(ranked["estimated_loading"], reverse=True)
+    assert results["rank"].tolist() == list(range(1, len(cases) + 1))
@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+
+from pypsse.parsers.element_index import ElementIndex
+
+
+class StationApi:
+    stations = {101: 1, 102: 1, 201: 2}
+
+    def busint(self, bus, string):
+        return 0, self.stations[bus]
+
+    def ini2dc(self):
+        return 1
+
+
+def test_element_index_groups_elements_by_bus():
+    raw_data = SimpleNamespace(
+        buses=[101, 102, 201],
+        loads=[(101, "1 "), (101, "2 "), (201, "1 ")],
+        generators=[(102, "1 ")],
+        induction_machines=[],
+        fixed_stunts=[(201, "1 ")],
+        ac_branches=[(101, 102, "1 "), (101, 201, "1 ")],
+        two_winding_transformers=[(101, 201, "1 ")],
+        three_winding_transformers=[(102, 101, 201, "1 ")],
+        bus_areas=[(101, 1), (102, 1), (201, 2)],
+        bus_zones=[(101, 10), (102, 10), (201, 20)],
+    )
+    index = ElementIndex(StationApi(), raw_data)
+    assert index.loads == {101: ["1 ", "2 "], 201: ["1 "]}
+    assert index.machines[102] == ["1 "]
+    assert index.branches[101] == [(102, "1 "), (201, "1 ")]
+    assert index.branches[102] == [(101, "1 ")]
+    assert index.branches[201] == [(101, "1 ")]
+    assert index.two_winding_transformers[201] == [(101, "1 ")]
+    assert index.three_winding_transformers[102] == [(101, 201, "1 ")]
+    assert index.three_winding_transformers[101] == [(102, 201, "1 ")]
+    assert index.three_winding_transformers[201] == [(102, 101, "1 ")]
+    assert sorted(index.get_areas(["101", "201"])) == [1, 2]
+    assert index.get_zones(["102"]) == [10]
+    assert index.get_stations(["101", "102"]) == [1]
+    assert index.get_dc_line_names(["101"]) == []
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import h5py
+import numpy as np
+import pytest
+
+from pypsse.data_writers.hdf5 import HDF5Writer
+from pypsse.enumerations import HDF5Layouts
+from pypsse.models import WriterBufferSettings
+from pypsse.modes.abstract_mode import AbstractMode
+
+
+def test_hdf5_writer_buffers_rows(tmp_path):
+    writer = HDF5Writer(tmp_path, 5, "test", WriterBufferSettings(rows=2))
+    start = datetime(2020, 1, 1)
+    for i in range(5):
+        results = {"Buses_PU": {"101": 1.0 + i, "102": None}, "Loads_MVA": {"101_1 ": complex(i, 1)}}
+        writer.write(start + timedelta(seconds=i), results, 1)
+        assert writer.buffered == (i + 1) % 2
+    writer.close_store()
+
+    with h5py.File(next(tmp_path.iterdir()), "r") as f:
+        assert list(f["Buses_PU"]["101"][:]) == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert list(f["Buses_PU"]["102"][:]) == [0.0] * 5
+        assert f["Loads_MVA"]["101_1"][4] == complex(4, 1)
+        assert f["Time stamp"][0] == b"2020-01-01 00:00:00.000000"
+        assert list(f["Convergence"][:]) == [1] * 5
+
+
+def test_hdf5_writer_matrix_layout(tmp_path):
+    writer = HDF5Writer(tmp_path, 3, "test", WriterBufferSettings(rows=2), HDF5Layouts.MATRIX)
+    start = datetime(2020, 1, 1)
+    for i in range(3):
+        writer.write(start + timedelta(seconds=i), {"Buses_PU": {"101": 1.0 + i, "102": 0.5}}, 1)
+    writer.close_store()
+
+    with h5py.File(next(tmp_path.iterdir()), "r") as f:
+        assert [label.decode() for label in f["Buses_PU"]["labels"][:]] == ["101", "102"]
+        assert f["Buses_PU"]["values"].shape == (3, 2)
+        assert list(f["Buses_PU"]["values"][:, 0]) == [1.0, 2.0, 3.0]
+        assert list(f["Buses_PU"]["values"][1]) == [2.0, 0.5]
+
+
+@pytest.mark.parametrize("layout", [HDF5Layouts.COLUMNS, HDF5Layouts.MATRIX])
+def test_hdf5_writer_does_not_repeat_flushed_values(tmp_path, layout):
+    writer = HDF5Writer(tmp_path, 3, "test", WriterBufferSettings(rows=2), layout)
+    start = datetime(2020, 1, 1)
+    for i, results in enumerate(
+        [
+            {"Buses_PU": {"101": 1.0, "102": 0.5}, "Loads_STATUS": {"1": 1, "2": 1}},
+            {"Buses_PU": {"101": 2.0, "102": 0.6}, "Loads_STATUS": {"1": 1, "2": 1}},
+            {"Buses_PU": {"101": 3.0}, "Loads_STATUS": {"1": 1}},
+        ]
+    ):
+        writer.write(start + timedelta(seconds=i), results, 1)
+    writer.close_store()
+
+    with h5py.File(next(tmp_path.iterdir()), "r") as f:
+        if layout == HDF5Layouts.MATRIX:
+            buses, loads = f["Buses_PU"]["values"][:, 1], f["Loads_STATUS"]["values"][:, 1]
+        else:
+            buses, loads = f["Buses_PU"]["102"][:], f["Loads_STATUS"]["2"][:]
+        assert list(buses[:2]) == [0.5, 0.6]
+        assert np.isnan(buses[2])
+        assert list(loads) == [1, 1, 0]
+
+
+def test_hdf5_writer_sizes_datasets_from_result_types(tmp_path):
+    writer = HDF5Writer(tmp_path, 2, "test", WriterBufferSettings(rows=2), result_types={"Loads_MVA": "cplx"})
+    start = datetime(2020, 1, 1)
+    writer.write(start, {"Loads_MVA": {"101_1 ": None}, "Buses_PU": {"101": 1, "102": 0.5}}, 1)
+    writer.write(start + timedelta(seconds=1), {"Loads_MVA": {"101_1 ": complex(1, 2)}, "Buses_PU": {"101": 1.5}}, 1)
+    writer.close_store()
+
+    with h5py.File(next(tmp_path.iterdir()), "r") as f:
+        assert list(f["Loads_MVA"]["101_1"][:]) == [0, complex(1, 2)]
+        assert list(f["Buses_PU"]["101"][:]) == [1.0, 1.5]
+
+
+def test_hdf5_writer_reports_unknown_labels(tmp_path):
+    writer = HDF5Writer(tmp_path, 2, "test", WriterBufferSettings(rows=2))
+    start = datetime(2020, 1, 1)
+    writer.write(start, {"Buses_PU": {"101": 1.0}}, 1)
+    writer.write(start + timedelta(seconds=1), {"Buses_PU": {"101": 1.0, "201": 0.9}}, 1)
+    assert writer.unknown_labels == {"Buses_PU": ["201"]}
+
+    with pytest.raises(TypeError, match="Buses_PU"):
+        writer.write(start, {"Buses_PU": {"101": complex(1, 1)}}, 1)
+    writer.close_store()
+
+
+def test_result_types_follow_psse_getters():
+    mode = SimpleNamespace(
+        func_options={"Loads": {"loddt2": ["MVA"], "lodint": ["STATUS", "AREA"]}, "Buses": {"busdat": ["PU"]}}
+    )
+    types = AbstractMode.get_result_types(mode, {"Loads": ["MVA", "STATUS", "AREA"], "Buses": ["PU", "Vpu"]})
+    assert types == {
+        "Loads_MVA": "cplx",
+        "Loads_STATUS": "char",
+        "Loads_AREA": "int",
+        "Buses_PU": "real",
+        "Buses_Vpu": "real",
+    }
@@ -0,0 +1,49 @@
+import json
+from types import SimpleNamespace
+
+import pypsse.helics_interface as hi
+
+
+class Sim:
+    def __init__(self):
+        self.results = {"Buses_PU": {101: 1.01, 102: 0.99}, "Buses_ANGLE": {101: 0.1, 102: 0.2}}
+
+    def read_subsystems(self, quantities, subsystem_buses):
+        return {k: dict(v) for k, v in self.results.items()}
+
+
+class Interface(hi.HelicsInterface):
+    def __del__(self):
+        pass
+
+
+def create_interface(monkeypatch):
+    published = []
+    info = {}
+    monkeypatch.setattr(hi.h, "helicsFederateRegisterGlobalTypePublication", lambda fed, tag, dtype, units: tag)
+    monkeypatch.setattr(hi.h, "helicsPublicationSetInfo", lambda pub, text: info.update({pub: json.loads(text)}))
+    for pub_type in ["double", "vector"]:
+        monkeypatch.setitem(hi.PUBLISH_FUNCTIONS, pub_type, lambda pub, val: published.append((pub, val)))
+
+    interface = Interface.__new__(Interface)
+    interface.sim = Sim()
+    interface.psse_federate = None
+    interface.settings = SimpleNamespace(helics=SimpleNamespace(federate_name="psse"))
+    interface.publications = {}
+    return interface, published, info
+
+
+def test_scalar_and_vector_publications(monkeypatch):
+    interface, published, info = create_interface(monkeypatch)
+    scalar = interface.register_scalar_publications(interface.sim.read_subsystems({}, []))
+    vector = interface.register_vector_publications(interface.sim.read_subsystems({}, []))
+    interface.pub_struc = [[{"Buses": ["PU", "ANGLE"]}, ["101", "102"], scalar + vector]]
+    assert len(scalar) == 4 and len(vector) == 2
+    assert info["psse.Buses.PU"] == ["101", "102"]
+
+    interface.sim.results["Buses_PU"][102] = 0.98
+    results = interface.publish()
+    assert ("psse.Buses.102.PU", 0.98) in published
+    assert ("psse.Buses.PU", (1.01, 0.98)) in published
+    assert results["Buses.ANGLE"] == (0.1, 0.2)
+    assert len(published) == 6
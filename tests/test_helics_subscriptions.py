@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+import pypsse.helics_interface as hi
+
+
+class Sim:
+    def __init__(self):
+        self.batches = []
+
+    def update_objects(self, dtypes, buses, element_ids, keys, values):
+        self.batches.append((list(dtypes), list(buses), list(element_ids), keys, values.copy()))
+        return np.zeros(len(dtypes), dtype=int)
+
+
+class Interface(hi.HelicsInterface):
+    def __del__(self):
+        pass
+
+
+def test_subscriptions_update_changed_elements(monkeypatch):
+    inputs = {"load1.P": 2.0, "load2.PQ": [1.0, 0.5], "gen1.P": 0.0}
+    monkeypatch.setattr(hi.h, "helicsInputGetDouble", lambda sub: inputs[sub])
+    monkeypatch.setattr(hi.h, "helicsInputGetVector", lambda sub: inputs[sub])
+
+    interface = Interface.__new__(Interface)
+    interface.sim = Sim()
+    interface.settings = SimpleNamespace(helics=SimpleNamespace(iterative_mode=False))
+    interface.c_seconds = interface.c_seconds_old = 0
+    interface.subscriptions = {
+        "load1.P": {"bus": 101, "element_id": "1", "element_type": "Load", "property": "PL", "scaler": 10.0},
+        "load2.PQ": {"bus": 102, "element_id": "1", "element_type": "Load", "property": ["PL", "QL"], "scaler": [1, 2]},
+        "gen1.P": {"bus": 201, "element_id": "1", "element_type": "Machine", "property": "PG", "scaler": 1.0},
+    }
+    for tag, sub_data in interface.subscriptions.items():
+        sub_data["subscription"] = tag
+    interface.compile_subscriptions()
+    assert interface.sub_keys == ["realar1", "realar2"]
+
+    all_values = interface.subscribe()
+    assert all_values == {"Load.101.1.PL": 2.0, "Load.102.1.PL": 1.0, "Load.102.1.QL": 0.5, "Machine.201.1.PG": 0.0}
+    dtypes, buses, _, keys, values = interface.sim.batches[0]
+    assert buses == [101, 102]
+    np.testing.assert_array_equal(values, [[20.0, np.nan], [1.0, 1.0]])
+
+    interface.subscribe()
+    assert len(interface.sim.batches) == 1
+
+    inputs["load2.PQ"] = [1.0, 0.75]
+    interface.subscribe()
+    _, buses, _, _, values = interface.sim.batches[1]
+    assert buses == [102]
+    np.testing.assert_array_equal(values, [[1.0, 1.5]])
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from pypsse.data_writers.parquet import ParquetWriter
+from pypsse.models import WriterBufferSettings
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def test_parquet_writer_row_groups(tmp_path):
+    writer = ParquetWriter(tmp_path, 5, "test", WriterBufferSettings(rows=2), dictionary_encoding=True)
+    start = datetime(2020, 1, 1)
+    for i in range(5):
+        results = {
+            "Buses_PU": {"101": 1.0 + i, "102": None},
+            "Buses_NAME": {"101": "BUS 101", "102": "BUS 102"},
+            "Loads_MVA": {"101_1 ": complex(i, 1)},
+        }
+        writer.write(start + timedelta(seconds=i), results, True)
+    writer.close_store()
+
+    pu = pq.ParquetFile(tmp_path / "test_Buses_PU.parquet")
+    assert pu.metadata.num_row_groups == 3
+    table = pu.read().to_pydict()
+    assert table["101"] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert table["102"] == [None] * 5
+    assert table["timestamp"][1] == start + timedelta(seconds=1)
+
+    loads = pq.read_table(tmp_path / "test_Loads_MVA.parquet").to_pydict()
+    assert loads["101_1_real"] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert loads["101_1_imag"] == [1.0] * 5
+
+    names = pq.read_table(tmp_path / "test_Buses_NAME.parquet")
+    assert names.column("101").to_pylist() == ["BUS 101"] * 5
+
+
+def get_encodings(path, column):
+    metadata = pq.ParquetFile(path).metadata
+    index = metadata.schema.names.index(column)
+    return set(metadata.row_group(0).column(index).encodings)
+
+
+def test_parquet_writer_dictionary_encodes_label_columns_only(tmp_path):
+    writer = ParquetWriter(tmp_path, 2, "test", WriterBufferSettings(rows=2), dictionary_encoding=True)
+    for i in range(2):
+        results = {"Buses_PU": {"101": 1.0 + i}, "Buses_NAME": {"101": "BUS 101"}}
+        writer.write(datetime(2020, 1, 1) + timedelta(seconds=i), results, True)
+    writer.close_store()
+
+    assert "RLE_DICTIONARY" in get_encodings(tmp_path / "test_Buses_NAME.parquet", "101")
+    assert "RLE_DICTIONARY" not in get_encodings(tmp_path / "test_Buses_PU.parquet", "101")
+
+
+def test_parquet_writer_column_types(tmp_path):
+    writer = ParquetWriter(tmp_path, 3, "test", WriterBufferSettings(rows=3), result_types={"Loads_STATUS": "char"})
+    start = datetime(2020, 1, 1)
+    pu = [{"101": 1, "102": None}, {"101": 1.5, "102": 2}, {"101": 2, "102": 0.5}]
+    names = [{"101": None, "102": "BUS 102"}, {"101": "BUS 101", "102": "BUS 102"}, {"101": "BUS 101"}]
+    status = [{"1": None}, {"1": 1}, {"1": "connected"}]
+    for i in range(3):
+        results = {"Buses_PU": pu[i], "Buses_NAME": names[i], "Loads_STATUS": status[i]}
+        writer.write(start + timedelta(seconds=i), results, True)
+    writer.close_store()
+
+    pu = pq.read_table(tmp_path / "test_Buses_PU.parquet")
+    assert str(pu.schema.field("101").type) == "double"
+    assert pu.to_pydict()["101"] == [1.0, 1.5, 2.0]
+    assert pu.to_pydict()["102"] == [None, 2.0, 0.5]
+    assert pq.read_table(tmp_path / "test_Buses_NAME.parquet").to_pydict()["101"] == [None, "BUS 101", "BUS 101"]
+    assert pq.read_table(tmp_path / "test_Loads_STATUS.parquet").to_pydict()["1"] == [None, "1", "connected"]
@@ -0,0 +1,70 @@
+import datetime
+
+import h5py
+import numpy as np
+import pandas as pd
+from click.testing import CliRunner
+
+from pypsse.cli.profiles import compact
+from pypsse.profile_manager.compaction import compact_profile_store, is_matrix_layout, read_metadata
+from pypsse.profile_manager.profile import Profile
+from pypsse.profile_manager.profile_store import ProfileManager
+
+
+class Solver:
+    def __init__(self, time):
+        self.time = time
+        self.updates = []
+
+    def get_time(self):
+        return self.time
+
+    def get_step_size_cec(self):
+        return 1.0
+
+    def update_object(self, dtype, bus, object_id, value):
+        self.updates.append((dtype, bus, object_id, value))
+
+
+def create_store(path, start):
+    manager = ProfileManager.__new__(ProfileManager)
+    with h5py.File(path, "w") as store:
+        manager.store = store
+        store.create_group("Load")
+        data = pd.DataFrame({"PL": np.arange(10, dtype=float), "QL": np.arange(10, dtype=float) * 2})
+        sa, sa_type = manager.df_to_sarray(data)
+        dset = store["Load"].create_dataset("test", data=sa, dtype=sa_type, chunks=True, compression="gzip")
+        manager.create_metadata(dset, start, 2.0, data, list(data.columns), "", "Load")
+
+
+def test_compacted_store_is_read_like_the_original(tmp_path):
+    start = datetime.datetime(2020, 1, 1)
+    source = tmp_path / "profiles.hdf5"
+    create_store(source, start)
+    target = compact_profile_store(source, tmp_path / "compact.hdf5", dtype="float32", chunk_rows=4)
+
+    mapping = [{"bus": "153", "id": "1", "interpolate": True}]
+    solver = Solver((start + datetime.timedelta(seconds=5)).astimezone(None))
+    with h5py.File(source, "r") as original, h5py.File(target, "r") as compacted:
+        assert is_matrix_layout(compacted)
+        dataset = compacted["Load/test"]
+        assert dataset.shape == (10, 2)
+        assert dataset.dtype == np.float32
+        assert dataset.chunks == (4, 2)
+        assert read_metadata(compacted) == read_metadata(original)
+        assert read_metadata(compacted)["Load/test"]["units"] == ["PL", "QL"]
+
+        Profile(original["Load/test"], solver, mapping).update()
+        Profile(compacted["Load/test"], solver, mapping).update()
+        assert solver.updates[0] == solver.updates[1]
+
+
+def test_compact_command_replaces_project_store(tmp_path):
+    (tmp_path / "profiles").mkdir()
+    store_file = tmp_path / "profiles" / "profiles.hdf5"
+    create_store(store_file, datetime.datetime(2020, 1, 1))
+    result = CliRunner().invoke(compact, [str(tmp_path), "-c", "gzip"])
+    assert result.exit_code == 0, result.output
+    with h5py.File(store_file, "r") as store:
+        assert is_matrix_layout(store)
+        np.testing.assert_array_equal(store["Load/test"][:, 1], np.arange(10) * 2)
@@ -0,0 +1,139 @@
+import datetime
+from types import SimpleNamespace
+
+import h5py
+import numpy as np
+import pandas as pd
+
+from pypsse.profile_manager.cache import ProfileCache
+from pypsse.profile_manager.engine import ProfileEngine
+from pypsse.profile_manager.profile import Profile
+from pypsse.profile_manager.profile_store import ProfileManager
+from pypsse.profile_manager.schedule import ProfileSchedule
+
+
+class Solver:
+    def __init__(self, time):
+        self.time = time
+        self.updates = []
+
+    def get_time(self):
+        return self.time
+
+    def get_step_size_cec(self):
+        return 1.0
+
+    def update_object(self, dtype, bus, object_id, value):
+        self.updates.append((dtype, str(bus), object_id, value))
+
+    def update_objects(self, dtypes, buses, object_ids, keys, values):
+        for dtype, bus, object_id, row in zip(dtypes, buses, object_ids, values):
+            self.update_object(dtype, bus, object_id, {k: v for k, v in zip(keys, row) if not np.isnan(v)})
+
+
+def create_store(tmp_path, start):
+    store = h5py.File(tmp_path / "profiles.hdf5", "w")
+    manager = ProfileManager.__new__(ProfileManager)
+    manager.store = store
+    store.create_group("Load")
+    data = pd.DataFrame({"PL": np.arange(10, dtype=float), "QL": np.arange(10, dtype=float) * 2})
+    sa, sa_type = manager.df_to_sarray(data)
+    dset = store["Load"].create_dataset("test", data=sa, dtype=sa_type)
+    dset.attrs["sTime"] = np.bytes_(str(start))
+    dset.attrs["eTime"] = np.bytes_(str(start + datetime.timedelta(seconds=10)))
+    dset.attrs["resTime"] = 2.0
+    dset.attrs["max"] = data.max().values
+    dset.attrs["units"] = list(data.columns)
+    dset.attrs["type"] = np.bytes_("Load")
+    return store
+
+
+def test_profile_engine_matches_profile_update(tmp_path):
+    start = datetime.datetime(2020, 1, 1)
+    store = create_store(tmp_path, start)
+    mapping = [
+        {"bus": "153", "id": "1", "interpolate": True},
+        {"bus": "154", "id": "1", "multiplier": 2, "normalize": True},
+    ]
+    solver = Solver(start.astimezone(None))
+    engine = ProfileEngine(solver, {"Load/test": Profile(store["Load"]["test"], solver, mapping)})
+
+    for step in [0, 3, 7, 20]:
+        solver.time = (start + datetime.timedelta(seconds=step)).astimezone(None)
+        solver.updates = []
+        engine.update()
+        engine_updates = solver.updates
+
+        for setting in mapping:
+            solver.updates = []
+            Profile(store["Load"]["test"], solver, [setting]).update()
+            dtype, bus, object_id, value = solver.updates[0]
+            match = [u for u in engine_updates if u[1] == bus and u[2] == object_id][0]
+            assert match[0] == dtype
+            assert match[3].keys() == value.keys()
+            np.testing.assert_allclose(list(match[3].values()), list(value.values()))
+
+
+def test_profile_cache_windows_are_bounded(tmp_path):
+    store = h5py.File(tmp_path / "cache.hdf5", "w")
+    data = np.arange(100, dtype=float).reshape(50, 2)
+    dataset = store.create_dataset("test", data=data, chunks=(4, 2))
+    cache = ProfileCache(window_rows=10, max_windows=2, prefetch=True)
+    assert cache.get_window_size(dataset) == 12
+
+    for row in range(50):
+        np.testing.assert_array_equal(cache.get_rows(dataset, [row])[0], data[row])
+        assert len(cache.windows) <= 2
+    cache.close()
+
+
+def test_profile_cache_reuses_windows(tmp_path):
+    store = h5py.File(tmp_path / "cache.hdf5", "w")
+    data = np.arange(100, dtype=float).reshape(50, 2)
+    store.create_dataset("test", data=data, chunks=(4, 2))
+    cache = ProfileCache(window_rows=10, max_windows=2, prefetch=False)
+
+    for _ in range(5):
+        np.testing.assert_array_equal(cache.get_rows(store["test"], [3])[0], data[3])
+    assert cache.misses == 1
+    assert cache.hits == 4
+    assert len(cache.windows) == 1
+    cache.close()
+
+
+def test_profile_schedule_matches_time_lookup(tmp_path):
+    start = datetime.datetime(2020, 1, 1)
+    store = create_store(tmp_path, start)
+    mapping = [{"bus": "153", "id": "1", "interpolate": True}]
+    settings = SimpleNamespace(
+        start_time=start,
+        simulation_time=datetime.timedelta(seconds=12),
+        simulation_step_resolution=datetime.timedelta(seconds=0.5),
+    )
+    solver = Solver(start.astimezone(None))
+    profiles = {"Load/test": Profile(store["Load"]["test"], solver, mapping)}
+    scheduled = ProfileEngine(solver, profiles, settings=settings)
+    computed = ProfileEngine(solver, profiles)
+    assert scheduled.schedule is not None and scheduled.schedule.nsteps == 25
+
+    for step in [0, 1, 2, 3, 3, 10, 24, 30]:
+        solver.time = (start + datetime.timedelta(seconds=step * 0.5)).astimezone(None)
+        for expected, actual in zip(computed.get_indices(), scheduled.get_indices()):
+            np.testing.assert_allclose(actual, expected)
+        np.testing.assert_allclose(scheduled.compute()[0], computed.compute()[0])
+    assert scheduled.schedule.step == 25
+
+
+def test_profile_schedule_memory_does_not_grow_with_steps():
+    stimes = np.array([0.0, 0.0, 5.0])
+    resolutions = np.array([2.0, 2.0, 2.0])
+    schedule = ProfileSchedule(10.0, 0.5, 10**9, stimes, resolutions)
+    assert schedule.offsets.nbytes == 2 * 8
+
+    t = schedule.get_time(10**8)
+    rows, weights, started = schedule.get(t)
+    dt = t - stimes
+    np.testing.assert_array_equal(rows, np.floor(dt / resolutions))
+    np.testing.assert_allclose(weights, (dt - rows * resolutions) / resolutions)
+    assert started.all()
+    assert schedule.get(t + 0.25) is None
@@ -0,0 +1,89 @@
+import datetime
+
+import h5py
+import numpy as np
+import pandas as pd
+import pytest
+
+from pypsse.profile_manager.compaction import read_metadata
+from pypsse.profile_manager.profile_store import ProfileManager
+from pypsse.profile_manager_interface import ProfileManagerInterface
+
+
+def create_interface(tmp_path):
+    manager = ProfileManager.__new__(ProfileManager)
+    store = h5py.File(tmp_path / "profiles.hdf5", "w")
+    manager.store = store
+    store.create_group("Load")
+    profiles = {
+        "a": (datetime.datetime(2020, 1, 1), 60.0, 50),
+        "b": (datetime.datetime(2020, 1, 1, 0, 10), 120.0, 20),
+    }
+    for name, (start, resolution, npts) in profiles.items():
+        data = pd.DataFrame({"PL": np.arange(npts, dtype=float), "QL": np.arange(npts, dtype=float) * 2})
+        sa, sa_type = manager.df_to_sarray(data)
+        dset = store["Load"].create_dataset(name, data=sa, dtype=sa_type)
+        manager.create_metadata(dset, start, resolution, data, list(data.columns), "", "Load")
+    store.flush()
+
+    interface = ProfileManagerInterface.__new__(ProfileManagerInterface)
+    interface._store = store
+    interface._metadata = read_metadata(store)
+    interface._toml_dict = {
+        "Load": {
+            "a": [{"bus": "1", "id": "1"}, {"bus": "2", "id": "1", "multiplier": 2, "normalize": True}],
+            "b": [{"bus": "3", "id": "1"}],
+        }
+    }
+    interface._start_time = datetime.datetime(2020, 1, 1, 0, 5)
+    interface._end_time = datetime.datetime(2020, 1, 1, 0, 40)
+    interface._export_file = tmp_path / "profiles.csv"
+    return interface
+
+
+def test_streaming_export(tmp_path):
+    interface = create_interface(tmp_path)
+    export_file = interface.get_profiles(window_rows=7)
+    df = pd.read_csv(export_file, index_col=0, parse_dates=True)
+
+    assert df.index[0] == pd.Timestamp("2020-01-01 00:05") and df.index[-1] == pd.Timestamp("2020-01-01 00:40")
+    assert len(df) == 36
+    assert list(df.columns) == ["Load_1_1_P", "Load_1_1_Q", "Load_1_2_P", "Load_1_2_Q", "Load_1_3_P", "Load_1_3_Q"]
+    np.testing.assert_allclose(df["Load_1_1_P"], np.arange(5, 41))
+    np.testing.assert_allclose(df["Load_1_2_Q"], np.arange(5, 41) * 2 / 98 * 2)
+    b = df["Load_1_3_Q"].dropna()
+    assert b.index[0] == pd.Timestamp("2020-01-01 00:10") and len(b) == 16
+    np.testing.assert_allclose(b, np.arange(16) * 2)
+
+    parquet_file = interface.get_profiles("parquet", window_rows=7)
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(parquet_file).set_index("timestamp"), df, check_names=False, check_freq=False
+    )
+
+
+def test_streaming_export_closes_file_on_error(tmp_path, monkeypatch):
+    interface = create_interface(tmp_path)
+    calls = []
+    create_writer = interface._create_writer
+
+    def recording_writer(*args):
+        write = create_writer(*args)
+
+        def record(df):
+            calls.append(df is None)
+            write(df)
+
+        return record
+
+    read_window = interface._read_window
+
+    def failing_read_window(path, window):
+        if calls:
+            raise OSError("read failed")
+        return read_window(path, window)
+
+    monkeypatch.setattr(interface, "_create_writer", recording_writer)
+    monkeypatch.setattr(interface, "_read_window", failing_read_window)
+    with pytest.raises(OSError):
+        interface.get_profiles(window_rows=7)
+    assert calls == [False, True]
@@ -0,0 +1,76 @@
+import datetime
+from types import SimpleNamespace
+
+import h5py
+import numpy as np
+import pandas as pd
+
+from pypsse.profile_manager.ingestion import (
+    INGESTION_JOURNAL_FILENAME,
+    JOURNAL_STARTED,
+    ProfileIngestor,
+    get_profile_files,
+)
+from pypsse.profile_manager.profile_store import ProfileManager
+
+
+def create_manager(path):
+    manager = ProfileManager.__new__(ProfileManager)
+    manager.store = h5py.File(path, "w")
+    manager.store.create_group("Load")
+    manager.settings = SimpleNamespace(profiles=SimpleNamespace(cache_window_rows=3600))
+    return manager
+
+
+def test_parallel_ingestion_is_resumable(tmp_path):
+    folder = tmp_path / "csv"
+    folder.mkdir()
+    for i in range(4):
+        pd.DataFrame({"PL": np.arange(5.0) + i, "QL": np.arange(5.0)}).to_csv(folder / f"Load__p{i}.csv", index=False)
+    pd.DataFrame({"XX": [1.0]}).to_csv(folder / "Load__bad.csv", index=False)
+    (folder / "notes.csv").write_text("PL\n1\n")
+
+    files = get_profile_files(folder)
+    assert [f[2] for f in files] == ["bad", "p0", "p1", "p2", "p3"]
+
+    manager = create_manager(tmp_path / "profiles.hdf5")
+    start = datetime.datetime(2020, 1, 1)
+    ingestor = ProfileIngestor(manager, workers=2)
+    written, failed = ingestor.ingest(files[:3], start, 60.0)
+    assert (written, failed) == (2, 1)
+
+    # profile started by an interrupted run but not recorded as done is replaced
+    manager.store["Load"].create_dataset("p2", data=np.zeros(1))
+    with open(tmp_path / INGESTION_JOURNAL_FILENAME, "a") as f:
+        f.write(f"{JOURNAL_STARTED}\t{files[3][0]}\n")
+    written, failed = ingestor.ingest(files, start, 60.0)
+    assert (written, failed) == (2, 1)
+    assert ingestor.read_journal()[1] == {str(f[0]) for f in files[1:]}
+
+    assert sorted(manager.store["Load"]) == ["p0", "p1", "p2", "p3"]
+    np.testing.assert_array_equal(manager.store["Load"]["p3"]["PL"], np.arange(5.0) + 3)
+    assert manager.store["Load"]["p3"].attrs["resTime"] == 60.0
+
+
+def test_ingestion_keeps_existing_profiles(tmp_path):
+    pd.DataFrame({"PL": [1.0, 2.0]}).to_csv(tmp_path / "Load__p0.csv", index=False)
+    manager = create_manager(tmp_path / "profiles.hdf5")
+    manager.store["Load"].create_dataset("p0", data=np.zeros(1))
+
+    ingestor = ProfileIngestor(manager, workers=1)
+    written, failed = ingestor.ingest(get_profile_files(tmp_path), datetime.datetime(2020, 1, 1), 60.0)
+    assert (written, failed) == (0, 1)
+    np.testing.assert_array_equal(manager.store["Load"]["p0"], np.zeros(1))
+    assert ingestor.read_journal() == (set(), set())
+
+
+def test_ingestion_into_empty_store(tmp_path):
+    pd.DataFrame({"PG": [1.0, 2.0]}).to_csv(tmp_path / "Machine__m1.csv", index=False)
+    manager = create_manager(tmp_path / "profiles.hdf5")
+    del manager.store["Load"]
+
+    written, failed = ProfileIngestor(manager, workers=1).ingest(
+        get_profile_files(tmp_path), datetime.datetime(2020, 1, 1), 60.0
+    )
+    assert (written, failed) == (1, 0)
+    np.testing.assert_array_equal(manager.store["Machine"]["m1"]["PG"], [1.0, 2.0])
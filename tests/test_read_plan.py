@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+from pypsse.modes.read_plan import ReadPlanCompiler
+from pypsse.result_frame import ResultFrame
+
+
+class GetterApi:
+    def __init__(self):
+        self.calls = 0
+
+    def busdat(self, bus, string):
+        self.calls += 1
+        return 0, bus / 100.0
+
+    def loddt2(self, bus, load_id, string, string2):
+        self.calls += 1
+        return 0, complex(bus, 1)
+
+    def brndat(self, bus, bus1, ckt, string):
+        self.calls += 1
+        return (0, 1.0) if bus1 == 102 else (1, None)
+
+    def notona(self, bus):
+        return 0, f"BUS{bus}"
+
+
+FUNC_OPTIONS = {
+    "Buses": {"busdat": ["PU"], "notona": ["NAME"], "busnofunc": ["NUMBER"]},
+    "Loads": {"loddt2": ["MVA"]},
+    "Branches": {"brndat": ["RATE"]},
+}
+
+
+def test_read_plan_is_compiled_once_and_matches_legacy_labels():
+    psse = GetterApi()
+    index = SimpleNamespace(
+        loads={101: ["1 "]},
+        branches={101: [(102, "1 "), (201, "1 ")]},
+    )
+    compiler = ReadPlanCompiler(psse, FUNC_OPTIONS, index)
+    quantities = {"Buses": ["PU", "NUMBER"], "Loads": ["MVA"], "Branches": ["RATE"]}
+    plan = compiler.get(quantities, ["101", "201"], {}, quantities)
+    assert compiler.get(quantities, ["101", "201"], {}, quantities) is plan
+    assert plan.compiled == {"Buses": ["PU"], "Loads": ["MVA"], "Branches": ["RATE"]}
+
+    results = plan.execute()
+    assert results["Buses_PU"] == {"101": 1.01, "201": 2.01}
+    assert results["Loads_MVA"] == {"101_1 ": complex(101, 1)}
+    assert results["Branches_RATE"] == {"101_102_1 ": 1.0}
+    assert psse.calls == 5
+
+    compiler.clear()
+    assert compiler.get(quantities, ["101", "201"], {}, quantities) is not plan
+
+
+def test_read_plan_cache_evicts_least_recently_used_plans():
+    index = SimpleNamespace(loads={}, branches={})
+    compiler = ReadPlanCompiler(GetterApi(), FUNC_OPTIONS, index, max_plans=2)
+    quantities = {"Buses": ["PU"]}
+    first = compiler.get(quantities, ["101"])
+    second = compiler.get(quantities, ["102"])
+    assert compiler.get(quantities, ["101"]) is first
+    compiler.get(quantities, ["201"])
+    assert len(compiler.plans) == 2
+    assert compiler.get(quantities, ["101"]) is first
+    assert compiler.get(quantities, ["102"]) is not second
+
+
+def test_read_plan_fills_result_frame():
+    index = SimpleNamespace(loads={101: ["1 "]}, branches={})
+    compiler = ReadPlanCompiler(GetterApi(), FUNC_OPTIONS, index)
+    frame = ResultFrame()
+    plan = compiler.get({"Buses": ["PU"], "Loads": ["MVA"]}, ["101", "201"])
+    plan.execute(frame.begin())
+    vector = frame["Buses_PU"]
+    plan.execute(frame.begin())
+    assert frame["Buses_PU"] is vector
+    assert vector.values.tolist() == [1.01, 2.01]
+    assert frame["Loads_MVA"] == {"101_1 ": complex(101, 1)}
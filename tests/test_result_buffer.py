@@ -0,0 +1,47 @@
+import numpy as np
+
+from pypsse.result_container import ResultBuffer
+
+
+def test_result_buffer_grows_and_adds_columns():
+    buffer = ResultBuffer(2)
+    buffer.append({"101": 1.0, "102": 0.99})
+    buffer.append({"101": 1.01, "102": None})
+    buffer.append({"101": 1.02, "102": 1.0, "201": 0.97})
+    assert buffer.values.shape == (4, 3)
+
+    df = buffer.to_dataframe()
+    assert list(df.columns) == ["101", "102", "201"]
+    assert len(df) == 3
+    assert np.isnan(df.loc[1, "102"])
+    assert np.isnan(df.loc[0, "201"])
+    assert df.loc[2, "201"] == 0.97
+
+
+def test_result_buffer_upcasts_complex_values():
+    buffer = ResultBuffer(1)
+    buffer.append({"101_1 ": 1.0})
+    buffer.append({"101_1 ": complex(1, 2)})
+    assert buffer.to_dataframe()["101_1 "].tolist() == [1.0, complex(1, 2)]
+
+
+def test_result_buffer_keeps_integer_values(tmp_path):
+    buffer = ResultBuffer(1)
+    buffer.append({"101_1 ": 1, "102_1 ": 0})
+    buffer.append({"101_1 ": 1, "102_1 ": 1})
+    assert buffer.to_dataframe().dtypes.tolist() == [np.int64, np.int64]
+    buffer.append({"101_1 ": 0})
+
+    df = buffer.to_dataframe()
+    assert str(df["102_1 "].dtype) == "Int64"
+    df.to_csv(tmp_path / "status.csv")
+    assert (tmp_path / "status.csv").read_text().splitlines() == [",101_1 ,102_1 ", "0,1,0", "1,1,1", "2,0,"]
+
+
+def test_result_buffer_upcasts_integers_to_float():
+    buffer = ResultBuffer(1)
+    buffer.append({"101": 1, "102": None})
+    buffer.append({"101": 1.5, "102": 2.5})
+    df = buffer.to_dataframe()
+    assert df["101"].tolist() == [1.0, 1.5]
+    assert np.isnan(df.loc[0, "102"])
@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+from click.testing import CliRunner
+
+import pypsse.result_cache as result_cache
+from pypsse.cli.cache import invalidate
+from pypsse.contingency_analysis import ContingencyAnalysis, ContingencyWorker
+from pypsse.models import BusTrip, Contingencies, ContingencyAnalysisSettings, LineTrip
+from pypsse.result_cache import ResultCache, get_result_key, hash_files
+
+
+def test_keys_change_with_case_contingency_and_export_variables(tmp_path):
+    case = tmp_path / "case.sav"
+    case.write_text("v1")
+    fingerprint = hash_files([case, None])
+    assert hash_files([case, None]) == fingerprint
+    assert hash_files([None, case]) != fingerprint
+    case.write_text("v2")
+    assert hash_files([case, None]) != fingerprint
+
+    contingency = Contingencies(contingencies=[BusTrip(bus_id=101)])
+    key = get_result_key(fingerprint, contingency, {"voltage_min": 0.95})
+    assert key == get_result_key(fingerprint, Contingencies(contingencies=[BusTrip(bus_id=101)]), {"voltage_min": 0.95})
+    assert key != get_result_key(fingerprint, Contingencies(contingencies=[BusTrip(bus_id=102)]), {"voltage_min": 0.95})
+    assert key != get_result_key(fingerprint, contingency, {"voltage_min": 0.9})
+
+
+def test_cache_persists_and_evicts_least_recently_used(tmp_path, monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr(result_cache, "time", SimpleNamespace(time=lambda: next(clock)))
+    path = tmp_path / "cache" / "results.db"
+    cache = ResultCache(path)
+    cache.put_many(tmp_path / "a.sav", {"k1": {"v": np.float64(1.5), "n": np.int64(2), "m": np.nan, "ok": np.bool_(1)}})
+    cache.close()
+
+    cache = ResultCache(path, max_size_mb=1 / 1024)
+    row = cache.get_many(["k1", "missing"])["k1"]
+    assert row["v"] == 1.5 and row["n"] == 2 and np.isnan(row["m"]) and row["ok"] is True
+
+    padding = "x" * 500
+    cache.put_many(tmp_path / "a.sav", {"k2": {"p": padding}})
+    cache.get_many(["k1"])
+    cache.put_many(tmp_path / "b.sav", {"k3": {"p": padding}})
+    # k2 is the least recently used row
+    assert set(cache.get_many(["k1", "k2", "k3"])) == {"k1", "k3"}
+    assert cache.get_size() <= 1024
+
+    assert cache.invalidate(tmp_path / "b.sav") == 1
+    assert len(cache) == 1
+    cache.close()
+
+    result = CliRunner().invoke(invalidate, [str(path)])
+    assert result.exit_code == 0 and "1 cached results removed" in result.output
+    assert len(ResultCache(path)) == 0
+
+
+def run(tmp_path, cases):
+    settings = ContingencyAnalysisSettings(
+        psse_module="standin_psspy",
+        psse_version=None,
+        monitored_buses=[102],
+        snapshot_directory=tmp_path,
+        cache_path=tmp_path / "cache.db",
+    )
+    return ContingencyAnalysis(tmp_path / "case.sav", settings).run(cases)
+
+
+def test_repeated_runs_only_simulate_new_cases(tmp_path, monkeypatch):
+    simulated = []
+    run_case = ContingencyWorker.run
+    monkeypatch.setattr(ContingencyWorker, "run", lambda self, i, case: simulated.append(i) or run_case(self, i, case))
+    (tmp_path / "case.sav").write_text("v1")
+    cases = [
+        Contingencies(contingencies=[LineTrip(bus_ids=[101, 102, 1])]),
+        Contingencies(contingencies=[BusTrip(bus_id=103)]),
+    ]
+    first = run(tmp_path, cases)
+    assert simulated == [0, 1]
+
+    # nothing is simulated (or loaded) if all results are cached
+    monkeypatch.setattr(ContingencyWorker, "__init__", None)
+    pd.testing.assert_frame_equal(run(tmp_path, cases), first)
+    monkeypatch.undo()
+    monkeypatch.setattr(ContingencyWorker, "run", lambda self, i, case: simulated.append(i) or run_case(self, i, case))
+
+    simulated.clear()
+    changed = [cases[1], Contingencies(contingencies=[LineTrip(bus_ids=[101, 103, 1])]), cases[0]]
+    results = run(tmp_path, changed)
+    assert simulated == [1]
+    pd.testing.assert_frame_equal(results.loc[[0, 2]], first.loc[[1, 0]].set_axis([0, 2]), check_names=False)
+
+    simulated.clear()
+    (tmp_path / "case.sav").write_text("v2")
+    run(tmp_path, cases)
+    assert simulated == [0, 1]
@@ -0,0 +1,56 @@
+import numpy as np
+
+from pypsse.result_container import ResultBuffer
+from pypsse.result_frame import ResultFrame
+
+
+def test_result_frame_reuses_vectors_between_steps():
+    frame = ResultFrame()
+    frame.update({"Buses_PU": {"101": 1.01, "102": None}, "Loads_MVA": {"101_1 ": complex(10, 2)}})
+    vector = frame.vectors["Buses_PU"]
+    assert frame["Buses_PU"] == {"101": 1.01, "102": None}
+    assert frame.vectors["Loads_MVA"].values.dtype == np.complex128
+
+    frame.update({"Buses_PU": {"101": 0.98, "102": 1.0}, "Loads_MVA": {"101_1 ": complex(11, 2)}})
+    assert frame.vectors["Buses_PU"] is vector
+    assert frame.to_dict() == {"Buses_PU": {"101": 0.98, "102": 1.0}, "Loads_MVA": {"101_1 ": complex(11, 2)}}
+
+    df = frame.to_pandas()
+    assert df.loc["102", "Buses_PU"] == 1.0
+    assert dict(frame.items())["Loads_MVA"] == {"101_1 ": complex(11, 2)}
+
+
+def test_result_frame_upcasts_mixed_values():
+    frame = ResultFrame()
+    frame.update({"Machines_STATUS": {"101_1 ": 1, "102_1 ": "OFF"}})
+    assert frame["Machines_STATUS"] == {"101_1 ": 1, "102_1 ": "OFF"}
+
+
+def test_result_frame_is_filled_in_place_by_readers():
+    frame = ResultFrame()
+    for step in range(2):
+        frame.begin()
+        frame.setdefault("Machines_STATUS", {})["101_1 "] = 1
+        frame.setdefault("Buses_PU", {})["101"] = 1.0 + step
+        if step == 0:
+            frame.setdefault("Loads_MVA", {})["101_1 "] = complex(1, 1)
+        vectors = dict(frame.vectors)
+
+    assert frame.vectors == vectors
+    assert list(frame) == ["Machines_STATUS", "Buses_PU"]
+    assert "Loads_MVA" not in frame
+    assert frame["Machines_STATUS"].values.dtype == np.int64
+    assert frame["Machines_STATUS"]["101_1 "] == 1
+    assert isinstance(frame["Machines_STATUS"]["101_1 "], int)
+    assert frame.to_dict() == {"Machines_STATUS": {"101_1 ": 1}, "Buses_PU": {"101": 2.0}}
+
+
+def test_result_buffer_copies_result_vectors():
+    frame = ResultFrame()
+    buffer = ResultBuffer(1)
+    for status in [{"101_1 ": 1, "102_1 ": 0}, {"101_1 ": 0, "102_1 ": None}]:
+        frame.begin()["Machines_STATUS"] = status
+        buffer.append(frame["Machines_STATUS"])
+    df = buffer.to_dataframe()
+    assert df["101_1 "].tolist() == [1, 0]
+    assert str(df["102_1 "].dtype) == "Int64"
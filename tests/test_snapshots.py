@@ -0,0 +1,147 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from pypsse.models import SnapshotSettings
+from pypsse.modes.abstract_mode import AbstractMode
+from pypsse.modes.snapshots import BASE_SNAPSHOT, SnapshotManager
+from pypsse.modes.update_filter import UpdateFilter
+from pypsse.simulator import Simulator
+
+
+class Psse:
+    "psspy stand-in holding a case and dynamic state that can be saved to and read from files"
+
+    def __init__(self):
+        self.case_data = {"load": 1.0}
+        self.dynamic_state = {"t": 0.0}
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.case_data, f)
+        return 0
+
+    def case(self, path):
+        with open(path) as f:
+            self.case_data = json.load(f)
+        return 0
+
+    def snap(self, options, path):
+        with open(path, "w") as f:
+            json.dump(self.dynamic_state, f)
+        return 0
+
+    def rstr(self, path):
+        with open(path) as f:
+            self.dynamic_state = json.load(f)
+        return 0
+
+
+def test_capture_and_restore(tmp_path):
+    psse = Psse()
+    snapshots = SnapshotManager(psse, directory=tmp_path, dynamic=True)
+    handle = snapshots.capture("base")
+    psse.case_data["load"] = 2.0
+    psse.dynamic_state["t"] = 1.0
+    snapshots.restore(handle)
+    assert psse.case_data == {"load": 1.0}
+    assert psse.dynamic_state == {"t": 0.0}
+
+    # restoring does not consume the snapshot
+    psse.case_data["load"] = 3.0
+    snapshots.restore(handle)
+    assert psse.case_data == {"load": 1.0}
+
+    directory = snapshots.directory
+    assert directory.parent == tmp_path
+    snapshots.close()
+    assert not directory.exists()
+    with pytest.raises(Exception, match="does not exist"):
+        snapshots.restore(handle)
+
+
+def test_least_recently_used_snapshots_are_evicted(tmp_path):
+    psse = Psse()
+    snapshots = SnapshotManager(psse, max_snapshots=2, directory=tmp_path)
+    for i in range(3):
+        psse.case_data["load"] = float(i)
+        snapshots.capture(f"s{i}")
+    assert "s0" not in snapshots and len(snapshots) == 2
+    assert len(list(snapshots.directory.iterdir())) == 2
+
+    snapshots.restore("s1")
+    psse.case_data["load"] = 3.0
+    snapshots.capture("s3")
+    assert list(snapshots.snapshots) == ["s1", "s3"]
+
+    # capturing an existing name replaces the snapshot
+    snapshots.capture("s1")
+    snapshots.restore("s1")
+    assert psse.case_data == {"load": 3.0}
+    assert len(list(snapshots.directory.iterdir())) == 2
+
+
+def test_generated_names_are_unique(tmp_path):
+    snapshots = SnapshotManager(Psse(), directory=tmp_path)
+    assert snapshots.capture() != snapshots.capture()
+
+
+def test_unbounded_snapshots_are_never_evicted(tmp_path):
+    snapshots = SnapshotManager(Psse(), max_snapshots=None, directory=tmp_path)
+    for i in range(20):
+        snapshots.capture(f"s{i}")
+    assert len(snapshots) == 20
+
+
+class ElementIndex:
+    def __init__(self):
+        self.refreshed = 0
+        self.raw_data = "raw"
+
+    def refresh(self):
+        self.refreshed += 1
+
+
+class ReadPlans:
+    def __init__(self):
+        self.cleared = 0
+
+    def clear(self):
+        self.cleared += 1
+
+
+def test_restore_snapshot_rebuilds_element_index(tmp_path):
+    mode = AbstractMode.__new__(AbstractMode)
+    mode.psse = Psse()
+    mode.snapshots = SnapshotManager(mode.psse, directory=tmp_path)
+    mode.element_index = ElementIndex()
+    mode.read_plans = ReadPlans()
+    mode.update_filter = UpdateFilter()
+
+    mode.snapshots.capture("base")
+    mode.psse.case_data["load"] = 2.0
+    mode.update_filter.commit("Load", 101, "1", {"realar1": 2.0})
+    mode.restore_snapshot("base")
+
+    assert mode.psse.case_data == {"load": 1.0}
+    assert mode.element_index.refreshed == 1 and mode.read_plans.cleared == 1
+    assert mode.update_filter.filter("Load", 101, "1", {"realar1": 2.0}) == {"realar1": 2.0}
+
+
+def test_simulator_captures_base_case(tmp_path):
+    simulator = Simulator.__new__(Simulator)
+    simulator.sim = SimpleNamespace(init=lambda buses: None, snapshots=SnapshotManager(Psse(), directory=tmp_path))
+    simulator.bus_subsystems = {}
+    simulator.settings = SimpleNamespace(
+        snapshots=SnapshotSettings(capture_base_case=True),
+        simulation=SimpleNamespace(use_profile_manager=False),
+        helics=None,
+    )
+    simulator.init()
+    assert BASE_SNAPSHOT in simulator.sim.snapshots
+
+    simulator.sim.snapshots = SnapshotManager(Psse(), directory=tmp_path)
+    simulator.settings.snapshots = SnapshotSettings()
+    simulator.init()
+    assert len(simulator.sim.snapshots) == 0
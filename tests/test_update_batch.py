@@ -0,0 +1,54 @@
+import numpy as np
+
+from pypsse.modes.abstract_mode import AbstractMode
+from pypsse.modes.update_batch import build_update_batch
+from pypsse.modes.update_filter import UpdateFilter
+
+
+class UpdateApi:
+    def __init__(self):
+        self.calls = []
+
+    def load_chng_5(self, ibus, id, **values):  # noqa: A002
+        self.calls.append(("load", ibus, id, values))
+        return 0
+
+    def machine_data_2(self, i, id, **values):  # noqa: A002
+        self.calls.append(("machine", i, id, values))
+        return 0 if i != 999 else 3
+
+
+def create_mode():
+    mode = AbstractMode.__new__(AbstractMode)
+    mode.psse = UpdateApi()
+    mode.update_filter = UpdateFilter()
+    return mode
+
+
+def test_build_update_batch():
+    dtypes, buses, ids, keys, values = build_update_batch(
+        [("Load", "101", "1", {"realar2": 1.0, "realar1": 2.0}), ("Machine", 201, "1", {"realar10": 3.0})]
+    )
+    assert list(dtypes) == ["Load", "Machine"]
+    assert list(buses) == [101, 201]
+    assert keys == ["realar1", "realar2", "realar10"]
+    np.testing.assert_array_equal(values, [[2.0, 1.0, np.nan], [np.nan, np.nan, 3.0]])
+
+
+def test_update_objects_groups_writes_and_reports_errors():
+    mode = create_mode()
+    errors = mode.update_objects(
+        ["Load", "Machine", "Load", "Machine", "Fixed_shunt"],
+        [101, 201, 102, 999, 301],
+        ["1", "1", "1", "1", "1"],
+        ["realar1", "realar2"],
+        np.array([[1.0, 2.0], [5.0, np.nan], [1e9, 1.0], [1.0, 1.0], [1.0, 1.0]]),
+    )
+    np.testing.assert_array_equal(errors, [0, 0, -1, 3, 1])
+    assert ("load", 101, "1", {"realar1": 1.0, "realar2": 2.0}) in mode.psse.calls
+    assert ("machine", 201, "1", {"realar1": 5.0}) in mode.psse.calls
+    assert len(mode.psse.calls) == 3
+
+    errors = mode.update_objects(["Load"], [101], ["1"], ["realar1", "realar2"], np.array([[1.0, 2.0]]))
+    np.testing.assert_array_equal(errors, [0])
+    assert len(mode.psse.calls) == 3
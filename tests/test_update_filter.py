@@ -0,0 +1,35 @@
+from pypsse.modes.update_filter import UpdateFilter
+
+
+def test_update_filter_skips_unchanged_values():
+    update_filter = UpdateFilter()
+    values = {"realar1": 10.0, "realar2": 2.0}
+    assert update_filter.filter("Load", 101, "1", values) == values
+    update_filter.commit("Load", 101, "1", values)
+
+    assert update_filter.filter("Load", 101, "1", values) == {}
+    assert update_filter.filter("Load", 101, "1", {"realar1": 10.0, "realar2": 3.0}) == {"realar2": 3.0}
+    assert update_filter.filter("Load", 102, "1", values) == values
+    assert update_filter.get_statistics() == {"written": 1, "skipped": 1}
+
+
+def test_update_filter_deadbands():
+    update_filter = UpdateFilter(absolute_deadband=0.5, relative_deadband=0.1)
+    update_filter.commit("Machine", 201, "1", {"realar1": 100.0})
+    assert update_filter.filter("Machine", 201, "1", {"realar1": 105.0}) == {}
+    assert update_filter.filter("Machine", 201, "1", {"realar1": 111.0}) == {"realar1": 111.0}
+
+    update_filter.commit("Machine", 201, "2", {"realar1": 1.0})
+    assert update_filter.filter("Machine", 201, "2", {"realar1": 1.4}) == {}
+    assert update_filter.filter("Machine", 201, "2", {"realar1": 1.6}) == {"realar1": 1.6}
+
+
+def test_update_filter_disabled_and_clear():
+    update_filter = UpdateFilter(enabled=False)
+    update_filter.commit("Load", 101, "1", {"realar1": 1.0})
+    assert update_filter.filter("Load", 101, "1", {"realar1": 1.0}) == {"realar1": 1.0}
+
+    update_filter = UpdateFilter()
+    update_filter.commit("Load", 101, "1", {"realar1": 1.0})
+    update_filter.clear()
+    assert update_filter.filter("Load", 101, "1", {"realar1": 1.0}) == {"realar1": 1.0}